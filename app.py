@@ -1,25 +1,26 @@
+import codecs
+import os
+import threading
+
 import streamlit as st
-import nltk
-from nltk.tokenize import sent_tokenize
-from sumy.parsers.plaintext import PlaintextParser
-from sumy.nlp.tokenizers import Tokenizer
-from sumy.summarizers.lsa import LsaSummarizer
-from sumy.summarizers.lex_rank import LexRankSummarizer
-from sumy.summarizers.text_rank import TextRankSummarizer
-from transformers import pipeline
 import pandas as pd
-from rouge_score import rouge_scorer
-import time
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from modules.registry import SummarizerRegistry, MODEL_BOUND
+from modules.extractive import ExtractiveSummarizer
+from modules.abstractive import AbstractiveSummarizer, GENERATION_PROFILES
+from modules.evaluation import SummaryEvaluator
+from modules.scheduler import CostModel, LatencyScheduler
+from modules.boilerplate import BoilerplateFilter
+from modules.styles import RetroStyles
+from modules.model_server import ModelServer, RemoteAbstractiveSummarizer
+from modules.batch import WorkQueue
+from utils.document_viewer import DocumentViewer
+from utils.visualization import DataVisualizer, build_dashboard
+from utils.threads import get_thread_budget
 
-# Download required NLTK resources
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-try:
-    nltk.data.find('stopwords')
-except LookupError:
-    nltk.download('stopwords')
+# Uploads larger than this are summarized as a stream instead of being decoded in memory
+LARGE_UPLOAD_BYTES = 5 * 1024 * 1024
 
 # Sample financial news articles
 SAMPLE_ARTICLES = {
@@ -65,174 +66,6 @@ SAMPLE_ARTICLES = {
     """
 }
 
-# Function to add custom CSS for retro gaming aesthetic
-def add_retro_css():
-    # Retro gaming color palette
-    primary_color = "#FF2A6D"  # Vibrant pink
-    secondary_color = "#05D9E8"  # Cyan
-    tertiary_color = "#D65108"  # Orange
-    background_color = "#1A1A2E"  # Dark blue
-    text_color = "#FFFFFF"  # White
-    highlight_color = "#F9C80E"  # Yellow
-
-    # CSS for retro gaming style
-    st.markdown("""
-    <style>
-    @import url('https://fonts.googleapis.com/css2?family=VT323&family=Space+Mono&display=swap');
-    
-    /* Main styles */
-    .main {
-        background-color: """ + background_color + """;
-        color: """ + text_color + """;
-        font-family: 'Space Mono', monospace;
-        padding: 0;
-    }
-    
-    /* Headings */
-    h1, h2, h3, h4, h5, h6 {
-        font-family: 'VT323', monospace;
-        color: """ + primary_color + """;
-        text-shadow: 3px 3px 0px """ + secondary_color + """;
-        letter-spacing: 2px;
-    }
-    
-    /* Buttons */
-    .stButton button {
-        background-color: """ + tertiary_color + """;
-        color: """ + text_color + """;
-        border: 2px solid """ + highlight_color + """;
-        border-radius: 0;
-        font-family: 'VT323', monospace;
-        font-size: 18px;
-        padding: 8px 16px;
-        box-shadow: 4px 4px 0px """ + highlight_color + """;
-        transition: transform 0.1s, box-shadow 0.1s;
-    }
-    
-    .stButton button:hover {
-        transform: translate(2px, 2px);
-        box-shadow: 2px 2px 0px """ + highlight_color + """;
-    }
-    
-    /* Text areas and inputs */
-    .stTextInput input, .stTextArea textarea, .stSelectbox, div[data-baseweb="select"] div {
-        background-color: """ + background_color + """;
-        color: """ + text_color + """;
-        border: 2px solid """ + secondary_color + """;
-        border-radius: 0;
-        font-family: 'Space Mono', monospace;
-    }
-    
-    /* Cards for summaries */
-    .summary-card {
-        background-color: """ + background_color + """;
-        border: 2px solid """ + primary_color + """;
-        padding: 10px;
-        margin: 10px 0;
-        box-shadow: 5px 5px 0px """ + highlight_color + """;
-    }
-    
-    .summary-card-title {
-        font-family: 'VT323', monospace;
-        color: """ + secondary_color + """;
-        font-size: 22px;
-        margin-bottom: 10px;
-        border-bottom: 2px solid """ + secondary_color + """;
-        padding-bottom: 5px;
-    }
-    
-    /* Loading animation */
-    .stProgress .st-bo {
-        background-color: """ + primary_color + """;
-    }
-    
-    /* Tables */
-    .dataframe {
-        font-family: 'Space Mono', monospace;
-        border: 2px solid """ + tertiary_color + """;
-    }
-    
-    .dataframe thead {
-        background-color: """ + tertiary_color + """;
-        color: """ + text_color + """;
-    }
-    
-    /* Custom pixelated container */
-    .pixel-container {
-        border: 4px solid """ + primary_color + """;
-        background-color: rgba(26, 26, 46, 0.7);
-        padding: 20px;
-        margin: 10px 0;
-        position: relative;
-    }
-    
-    .pixel-container::before {
-        content: '';
-        position: absolute;
-        top: -8px;
-        left: -8px;
-        right: -8px;
-        bottom: -8px;
-        border: 2px solid """ + secondary_color + """;
-        z-index: -1;
-    }
-    
-    /* For tabs */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 2px;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        background-color: """ + background_color + """;
-        border: 2px solid """ + primary_color + """;
-        border-radius: 0;
-        color: """ + primary_color + """;
-        font-family: 'VT323', monospace;
-        padding: 5px 15px;
-    }
-    
-    .stTabs [aria-selected="true"] {
-        background-color: """ + primary_color + """;
-        color: """ + text_color + """;
-    }
-    
-    /* Scoreboard style */
-    .scoreboard {
-        background-color: """ + background_color + """;
-        border: 3px solid """ + highlight_color + """;
-        padding: 10px;
-        font-family: 'VT323', monospace;
-        color: """ + highlight_color + """;
-        margin: 10px 0;
-        text-align: center;
-    }
-    
-    .scoreboard-title {
-        font-size: 24px;
-        margin-bottom: 5px;
-    }
-    
-    .scoreboard-value {
-        font-size: 36px;
-        color: """ + secondary_color + """;
-    }
-    
-    /* Pixel animation for loading */
-    @keyframes pixel-move {
-        0% { transform: translateX(0); }
-        100% { transform: translateX(20px); }
-    }
-    
-    .pixel-loading {
-        font-family: 'VT323', monospace;
-        font-size: 24px;
-        color: """ + primary_color + """;
-        display: inline-block;
-        animation: pixel-move 0.5s infinite alternate;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-
 # Function to display pixelated title
 def display_retro_title():
     st.markdown("""
@@ -259,81 +92,63 @@ def create_summary_card(title, summary_text, method_color):
     </div>
     """
 
-# Summarization functions
-def extractive_summarize_text_rank(text, num_sentences=5):
-    parser = PlaintextParser.from_string(text, Tokenizer("english"))
-    summarizer = TextRankSummarizer()
-    summary = summarizer(parser.document, num_sentences)
-    return " ".join([str(sentence) for sentence in summary])
-
-def extractive_summarize_lex_rank(text, num_sentences=5):
-    parser = PlaintextParser.from_string(text, Tokenizer("english"))
-    summarizer = LexRankSummarizer()
-    summary = summarizer(parser.document, num_sentences)
-    return " ".join([str(sentence) for sentence in summary])
+# Shared summarization backends, created once per server process so the
+# abstractive models and the result cache survive reruns and sessions
+def current_session_id():
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else threading.get_ident()
 
-def extractive_summarize_lsa(text, num_sentences=5):
-    parser = PlaintextParser.from_string(text, Tokenizer("english"))
-    summarizer = LsaSummarizer()
-    summary = summarizer(parser.document, num_sentences)
-    return " ".join([str(sentence) for sentence in summary])
+@st.cache_resource
+def get_registry():
+    # Cap torch and BLAS threads to this process's cores (FTS_CPU_CORES on shared hosts)
+    get_thread_budget().apply()
+    # Set FTS_MODEL_SERVER_WORKERS to load the models once in a shared server
+    # process instead of in every server worker
+    workers = int(os.environ.get("FTS_MODEL_SERVER_WORKERS", "0"))
+    # Set FTS_BART_DRAFT_MODEL to a local distilled BART directory to enable assisted decoding
+    draft_model_path = os.environ.get("FTS_BART_DRAFT_MODEL")
+    if workers > 0:
+        server = ModelServer(
+            workers=workers,
+            session_limit=int(os.environ.get("FTS_MODEL_SERVER_SESSION_LIMIT", "1")),
+            draft_model_path=draft_model_path
+        ).start()
+        return SummarizerRegistry(
+            abstractive=RemoteAbstractiveSummarizer(server, session_resolver=current_session_id)
+        )
+    return SummarizerRegistry(abstractive=AbstractiveSummarizer(draft_model_path=draft_model_path))
 
-# Simple TF-IDF based summarization
-def extractive_summarize_tfidf(text, num_sentences=5):
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    import numpy as np
-    
-    # Tokenize the text into sentences
-    sentences = sent_tokenize(text)
-    
-    # If there are fewer sentences than requested, return all sentences
-    if len(sentences) <= num_sentences:
-        return text
-    
-    # Create a TF-IDF vectorizer
-    vectorizer = TfidfVectorizer(stop_words='english')
-    
-    # Fit and transform the sentences
-    tfidf_matrix = vectorizer.fit_transform(sentences)
-    
-    # Calculate sentence scores based on TF-IDF values
-    sentence_scores = np.array([tfidf_matrix[i].sum() for i in range(len(sentences))])
-    
-    # Get the indices of the top N sentences
-    top_indices = sentence_scores.argsort()[-num_sentences:]
-    
-    # Sort indices to maintain original order
-    top_indices = sorted(top_indices)
-    
-    # Combine the top sentences
-    summary = ' '.join([sentences[i] for i in top_indices])
-    
-    return summary
+@st.cache_resource
+def get_evaluator():
+    return SummaryEvaluator()
 
-def abstractive_summarize_bart(text, max_length=150):
-    summarizer = pipeline("summarization", model="facebook/bart-large-cnn")
-    summary = summarizer(text, max_length=max_length, min_length=50, do_sample=False)
-    return summary[0]['summary_text']
+@st.cache_resource
+def get_scheduler():
+    # Set FTS_COST_MODEL to a cost model fitted with `python -m modules.scheduler fit`
+    path = os.environ.get("FTS_COST_MODEL")
+    return LatencyScheduler(get_registry(), CostModel.load(path) if path else None)
 
-def abstractive_summarize_t5(text, max_length=150):
-    summarizer = pipeline("summarization", model="t5-small")
-    summary = summarizer(text, max_length=max_length, min_length=50, do_sample=False)
-    return summary[0]['summary_text']
+@st.cache_resource
+def get_boilerplate_filter(splitter):
+    # Set FTS_BOILERPLATE_HASHES to sentences learned with `python -m modules.boilerplate learn`;
+    # one filter per splitter, so sentences are hashed the way they are split for summarizing
+    path = os.environ.get("FTS_BOILERPLATE_HASHES")
+    return BoilerplateFilter.load(path, splitter=splitter) if path else BoilerplateFilter(splitter=splitter)
 
-# Function to calculate ROUGE scores
-def calculate_rouge(reference, summary):
-    scorer = rouge_scorer.RougeScorer(['rouge1', 'rouge2', 'rougeL'], use_stemmer=True)
-    scores = scorer.score(reference, summary)
-    return {
-        'ROUGE-1': scores['rouge1'].fmeasure,
-        'ROUGE-2': scores['rouge2'].fmeasure,
-        'ROUGE-L': scores['rougeL'].fmeasure
-    }
+@st.cache_resource(max_entries=1)
+def get_corpus_dashboard(path, modified):
+    # Aggregated once per change to the queue database; `modified` is only part of the cache key
+    queue = WorkQueue(path)
+    try:
+        results = queue.scores_frame()
+    finally:
+        queue.close()
+    return build_dashboard(results, by='method', bucket='shard')
 
 # Main application
 def main():
     st.set_page_config(page_title="Financial Text Summarizer 3000", layout="wide")
-    add_retro_css()
+    RetroStyles.apply_styles()
     display_retro_title()
     
     # Sidebar for controls
@@ -367,6 +182,47 @@ def main():
             help="Maximum length for abstractive summaries"
         )
         
+        # Decoding profile for abstractive methods; deployments set the default
+        profile_options = ["DEFAULT"] + [name.upper() for name in GENERATION_PROFILES]
+        default_profile = os.environ.get("FTS_GENERATION_PROFILE", "default").upper()
+        generation_profile = st.selectbox(
+            "DECODING PROFILE",
+            profile_options,
+            index=profile_options.index(default_profile) if default_profile in profile_options else 0,
+            help="FAST uses greedy decoding, BALANCED and QUALITY use beam search, ASSISTED "
+                 "speeds up greedy BART decoding with a draft model; all scale the summary length to the input"
+        )
+        generation_profile = None if generation_profile == "DEFAULT" else generation_profile.lower()
+        
+        # Latency budget for the whole request
+        time_budget = st.slider(
+            "TIME BUDGET (SECONDS)",
+            min_value=5,
+            max_value=600,
+            value=60,
+            help="Methods that would not finish in time are downgraded or skipped"
+        )
+        
+        # Sentence splitter used by every extractive ranking
+        splitter = st.selectbox(
+            "SENTENCE SPLITTER",
+            ["PUNKT", "FINANCE"],
+            help="FINANCE keeps prices, company suffixes and abbreviations like U.S. inside one sentence"
+        ).lower()
+        
+        strip_boilerplate = st.checkbox(
+            "STRIP BOILERPLATE",
+            value=True,
+            help="Remove safe-harbor disclaimers and contact blocks before summarizing"
+        )
+        
+        # Focus for BM25 (Query) and the hybrid models' sentence selection
+        query = st.text_input(
+            "FOCUS QUERY",
+            placeholder="e.g. guidance, liquidity",
+            help="Summarize with respect to a topic; the document is indexed once and reused for every query"
+        ).strip() or None
+        
         # Add some gaming elements
         st.markdown("<div class='scoreboard'>", unsafe_allow_html=True)
         st.markdown("<div class='scoreboard-title'>DIFFICULTY</div>", unsafe_allow_html=True)
@@ -395,12 +251,17 @@ def main():
         # Summarization methods selection
         st.markdown("<h3>SELECT SUMMARIZERS</h3>", unsafe_allow_html=True)
         
-        use_textrank = st.checkbox("TextRank", value=True)
-        use_lexrank = st.checkbox("LexRank", value=True)
-        use_lsa = st.checkbox("LSA", value=True)
-        use_tfidf = st.checkbox("TF-IDF", value=True)
-        use_bart = st.checkbox("BART", value=False)
-        use_t5 = st.checkbox("T5", value=False)
+        registry = get_registry()
+        
+        # Model-bound methods are slow, so only the CPU methods start checked;
+        # query-focused methods start checked once there is a query
+        selected_methods = [
+            method.name for method in registry.methods()
+            if st.checkbox(
+                method.label,
+                value=method.cost_class != MODEL_BOUND and (query is not None or 'query' not in method.params)
+            )
+        ]
         
         # Calculate ROUGE scores option
         calculate_metrics = st.checkbox("CALCULATE ROUGE SCORES", value=False)
@@ -412,6 +273,7 @@ def main():
     
     with col1:
         st.markdown("<h2>📝 INPUT TEXT</h2>", unsafe_allow_html=True)
+        large_upload = None
         
         # Input text handling
         if input_method == "SAMPLE TEXT":
@@ -420,9 +282,6 @@ def main():
                 list(SAMPLE_ARTICLES.keys())
             )
             input_text = SAMPLE_ARTICLES[sample_selection]
-            st.markdown("<div class='pixel-container'>", unsafe_allow_html=True)
-            st.write(input_text)
-            st.markdown("</div>", unsafe_allow_html=True)
             
         elif input_method == "PASTE YOUR OWN":
             input_text = st.text_area(
@@ -438,13 +297,22 @@ def main():
                 help="Upload a text file containing financial news"
             )
             
-            if uploaded_file is not None:
-                input_text = uploaded_file.read().decode("utf-8")
+            if uploaded_file is not None and uploaded_file.size > LARGE_UPLOAD_BYTES:
+                large_upload = uploaded_file
+                input_text = ""
+                preview = uploaded_file.read(2000).decode("utf-8", errors="ignore")
+                uploaded_file.seek(0)
                 st.markdown("<div class='pixel-container'>", unsafe_allow_html=True)
-                st.write(input_text[:500] + ("..." if len(input_text) > 500 else ""))
+                st.write(preview[:500] + "...")
                 st.markdown("</div>", unsafe_allow_html=True)
+                st.info("Large file: it will be summarized with streaming TF-IDF only")
+            elif uploaded_file is not None:
+                input_text = uploaded_file.read().decode("utf-8")
             else:
                 input_text = ""
+        
+        # Filled at the end of the run, once the summaries to highlight are known
+        viewer_slot = st.container()
     
     with col2:
         st.markdown("<h2>🚀 REFERENCE SUMMARY</h2>", unsafe_allow_html=True)
@@ -458,7 +326,7 @@ def main():
 
     # Process and generate summaries
     if st.button("🎮 PRESS START TO SUMMARIZE"):
-        if not input_text:
+        if not input_text and large_upload is None:
             st.error("Please enter some text to summarize!")
         else:
             # Show loading animation
@@ -472,43 +340,81 @@ def main():
                 summaries = {}
                 rouge_scores = {}
                 
-                # Generate summaries using selected methods
-                if use_textrank:
-                    summaries["TextRank"] = extractive_summarize_text_rank(input_text, num_sentences)
+                if large_upload is not None:
+                    # Stream the upload so memory does not grow with the file size
+                    large_upload.seek(0)
+                    stream = codecs.getreader("utf-8")(large_upload, errors="replace")
+                    summaries = {
+                        "TF-IDF (Streaming)": ExtractiveSummarizer.streaming_tfidf(stream, num_sentences)
+                    }
+                else:
+                    # Generate summaries using selected methods within the time budget
+                    placeholder = st.empty()
+                    if any(registry.get(name).cost_class == MODEL_BOUND for name in selected_methods):
+                        # Model-bound methods take longer, so add a progress message
+                        placeholder.markdown(
+                            "<div style='text-align: center;'><span class='pixel-loading'>LOADING MODELS...</span></div>",
+                            unsafe_allow_html=True
+                        )
                 
-                if use_lexrank:
-                    summaries["LexRank"] = extractive_summarize_lex_rank(input_text, num_sentences)
+                    # Drop disclaimers and contact blocks before any method scores the text
+                    summary_input = input_text
+                    if strip_boilerplate:
+                        summary_input, filter_report = get_boilerplate_filter(splitter).filter(input_text)
+                        if filter_report.removed:
+                            saved = filter_report.time_saved(
+                                get_scheduler().cost_model,
+                                [registry.get(name).name for name in selected_methods]
+                            )
+                            st.caption(
+                                f"BOILERPLATE: removed {filter_report.removed} of {filter_report.sentences} "
+                                f"sentences, ~{max(saved, 0):.2f}s saved"
+                            )
                 
-                if use_lsa:
-                    summaries["LSA"] = extractive_summarize_lsa(input_text, num_sentences)
+                    schedule = get_scheduler().run(
+                        selected_methods,
+                        summary_input,
+                        time_budget,
+                        num_sentences=num_sentences,
+                        max_length=max_length,
+                        profile=generation_profile,
+                        splitter=splitter,
+                        query=query
+                    )
+                    summaries = schedule.summaries
+                    placeholder.empty()
                 
-                if use_tfidf:
-                    summaries["TF-IDF"] = extractive_summarize_tfidf(input_text, num_sentences)
+                    # Tell the user which methods were swapped or dropped to meet the budget
+                    for name, substitute in schedule.downgraded.items():
+                        st.warning(
+                            f"{registry.get(name).label} would exceed the time budget, "
+                            f"ran {registry.get(substitute).label} instead"
+                        )
+                    for name, reason in schedule.skipped.items():
+                        st.warning(f"{registry.get(name).label} skipped: {reason}")
                 
-                if use_bart:
-                    # This takes longer, so we'll add a progress message
-                    bart_placeholder = st.empty()
-                    bart_placeholder.markdown(
-                        "<div style='text-align: center;'><span class='pixel-loading'>LOADING BART MODEL...</span></div>",
-                        unsafe_allow_html=True
-                    )
-                    summaries["BART"] = abstractive_summarize_bart(input_text, max_length)
-                    bart_placeholder.empty()
+                    # Report how well the draft model kept up with BART, for runs that decoded just now
+                    for label, assisted in schedule.assisted.items():
+                        st.caption(
+                            f"ASSISTED DECODING ({label}): {assisted['acceptance_rate']:.0%} of draft tokens "
+                            f"accepted, {assisted['estimated_speedup']:.1f}x fewer BART decoder passes"
+                        )
                 
-                if use_t5:
-                    # This takes longer too
-                    t5_placeholder = st.empty()
-                    t5_placeholder.markdown(
-                        "<div style='text-align: center;'><span class='pixel-loading'>LOADING T5 MODEL...</span></div>",
-                        unsafe_allow_html=True
-                    )
-                    summaries["T5"] = abstractive_summarize_t5(input_text, max_length)
-                    t5_placeholder.empty()
+                    # Remember which input sentences each extractive summary picked
+                    viewer = DocumentViewer(input_text, splitter)
+                    st.session_state["summary_highlights"] = {
+                        "document": hash(input_text),
+                        "methods": {
+                            label: viewer.locate(summary) for label, summary in summaries.items()
+                            if registry.get(label).family == "extractive"
+                        },
+                    }
                 
                 # Calculate ROUGE scores if requested and reference summary exists
                 if calculate_metrics and reference_summary:
+                    evaluator = get_evaluator()
                     for method, summary in summaries.items():
-                        rouge_scores[method] = calculate_rouge(reference_summary, summary)
+                        rouge_scores[method] = evaluator.calculate_rouge(reference_summary, summary)
             
             # Display summaries
             st.markdown("<h2>📊 SUMMARY COMPARISON</h2>", unsafe_allow_html=True)
@@ -520,7 +426,10 @@ def main():
                 "LSA": "#F9C80E",       # Yellow
                 "TF-IDF": "#D65108",    # Orange
                 "BART": "#3A86FF",      # Blue
-                "T5": "#8338EC"         # Purple
+                "T5": "#8338EC",        # Purple
+                "T5 (Chunked)": "#B388EB", # Lavender
+                "BART (Hybrid)": "#8AB6FF", # Light blue
+                "T5 (Hybrid)": "#C77DFF"   # Violet
             }
             
             # Use tabs for the summaries
@@ -533,7 +442,7 @@ def main():
                         create_summary_card(
                             f"{method} SUMMARY",
                             summary,
-                            method_colors[method]
+                            method_colors.get(method, "#FF2A6D")
                         ),
                         unsafe_allow_html=True
                     )
@@ -587,7 +496,7 @@ def main():
                         create_summary_card(
                             f"{method}",
                             summary[:150] + ("..." if len(summary) > 150 else ""),
-                            method_colors[method]
+                            method_colors.get(method, "#FF2A6D")
                         ),
                         unsafe_allow_html=True
                     )
@@ -669,5 +578,25 @@ def main():
                 unsafe_allow_html=True
             )
 
+    # Show the input a page at a time, highlighting the chosen summary's sentences
+    stored = st.session_state.get("summary_highlights")
+    highlights = stored["methods"] if stored and stored["document"] == hash(input_text) else {}
+    if input_text and (input_method != "PASTE YOUR OWN" or highlights):
+        with viewer_slot:
+            highlighted = ()
+            if highlights:
+                choice = st.selectbox("HIGHLIGHT SUMMARY", ["NONE"] + list(highlights), key="highlight_method")
+                highlighted = highlights.get(choice, ())
+            DocumentViewer(input_text, splitter).show("input_viewer", highlighted)
+    
+    # Set FTS_RESULTS_DB to a batch queue database to browse its scores
+    results_db = os.environ.get("FTS_RESULTS_DB")
+    if results_db and os.path.exists(results_db):
+        with st.expander("📊 CORPUS DASHBOARD"):
+            modified = max(
+                os.path.getmtime(path) for path in (results_db, results_db + "-wal") if os.path.exists(path)
+            )
+            DataVisualizer.plot_dashboard(get_corpus_dashboard(results_db, modified))
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,9 +1,16 @@
 # Financial Text Summarizer 3000
 # Module initialization file
 
-from modules.extractive import ExtractiveSummarizer
-from modules.abstractive import AbstractiveSummarizer
+from modules.extractive import ExtractiveSummarizer, SentenceRanking, SentenceIndex
+from modules.abstractive import AbstractiveSummarizer, EncoderCache, InferenceSlots
 from modules.evaluation import SummaryEvaluator
 from modules.styles import RetroStyles
+from modules.registry import SummarizerRegistry, SummarizerMethod
+from modules.scheduler import LatencyScheduler, CostModel
+from modules.model_server import ModelServer, RemoteAbstractiveSummarizer
+from modules.boilerplate import BoilerplateFilter, FilterReport
+from modules.term_stats import TermStatistics
 
-__all__ = ['ExtractiveSummarizer', 'AbstractiveSummarizer', 'SummaryEvaluator', 'RetroStyles']
\ No newline at end of file
+__all__ = ['ExtractiveSummarizer', 'SentenceRanking', 'SentenceIndex', 'AbstractiveSummarizer', 'EncoderCache', 'InferenceSlots', 'SummaryEvaluator', 'RetroStyles',
+           'SummarizerRegistry', 'SummarizerMethod', 'LatencyScheduler', 'CostModel',
+           'ModelServer', 'RemoteAbstractiveSummarizer', 'BoilerplateFilter', 'FilterReport', 'TermStatistics']
\ No newline at end of file
@@ -2,21 +2,287 @@
 Abstractive summarization methods for the Financial Text Summarizer.
 """
 
+import hashlib
+import threading
+import time
+import warnings
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+
 import torch
 from transformers import pipeline
+from transformers.modeling_outputs import BaseModelOutput
+
+from modules.extractive import ExtractiveSummarizer
+
+# Rough number of subword tokens per English word, used to turn token budgets into word budgets
+TOKENS_PER_WORD = 1.3
+
+# Decoding profiles. Summary lengths are fractions of the input token count,
+# clamped to the caller's max_length/min_length, so short inputs get short decodes
+GENERATION_PROFILES = {
+    'fast': {
+        'num_beams': 1,
+        'min_ratio': 0.10,
+        'max_ratio': 0.35,
+        'no_repeat_ngram_size': 3,
+    },
+    'balanced': {
+        'num_beams': 2,
+        'min_ratio': 0.15,
+        'max_ratio': 0.50,
+        'no_repeat_ngram_size': 3,
+    },
+    'quality': {
+        'num_beams': 4,
+        'min_ratio': 0.20,
+        'max_ratio': 0.60,
+        'no_repeat_ngram_size': 3,
+    },
+    # Greedy decoding verified against draft-model proposals. The output is the
+    # same as greedy decoding; without a draft model it is plain greedy decoding
+    'assisted': {
+        'num_beams': 1,
+        'min_ratio': 0.10,
+        'max_ratio': 0.35,
+        'no_repeat_ngram_size': 3,
+        'assistant': True,
+    },
+}
+
+# Shortest summary a profile will ask for, in tokens
+MIN_PROFILE_LENGTH = 16
+
+
+def generation_kwargs(profile, input_tokens, max_length, min_length):
+    """
+    Build generate() arguments for a decoding profile and input size.
+    
+    Args:
+        profile (str or None): 'fast', 'balanced', 'quality', 'assisted', or None
+            for the model's default decoding settings
+        input_tokens (int): Number of tokens in the model input
+        max_length (int): Upper limit for the summary length in tokens
+        min_length (int): Upper limit for the minimum summary length in tokens
+        
+    Returns:
+        dict: Keyword arguments for model.generate()
+    """
+    if profile is None:
+        return {'max_length': max_length, 'min_length': min_length, 'do_sample': False}
+    
+    if profile not in GENERATION_PROFILES:
+        raise ValueError(f"Profile '{profile}' not supported. Choose from: {', '.join(GENERATION_PROFILES.keys())}")
+    
+    settings = GENERATION_PROFILES[profile]
+    profile_max = min(max(int(input_tokens * settings['max_ratio']), MIN_PROFILE_LENGTH), max_length)
+    profile_min = min(int(input_tokens * settings['min_ratio']), min_length, profile_max - 1)
+    
+    kwargs = {
+        'max_length': profile_max,
+        'min_length': max(profile_min, 0),
+        'do_sample': False,
+        'num_beams': settings['num_beams'],
+        'no_repeat_ngram_size': settings['no_repeat_ngram_size'],
+        # Early stopping only means something for beam search
+        'early_stopping': settings['num_beams'] > 1,
+        'assistant': settings.get('assistant', False),
+    }
+    
+    return kwargs
+
+
+class EncoderCache:
+    """
+    Byte-bounded LRU cache of tokenized inputs and encoder hidden states.
+    """
+    
+    def __init__(self, max_bytes=256 * 1024 * 1024):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            max_bytes (int): Maximum total size of the cached tensors
+        """
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """
+        Look up an entry and mark it as recently used.
+        
+        Args:
+            key (tuple): (model name, document hash)
+            
+        Returns:
+            tuple or None: (inputs, encoder hidden states) if cached
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+    
+    def put(self, key, value, nbytes):
+        """
+        Store an entry, evicting the least recently used ones to stay in budget.
+        
+        Args:
+            key (tuple): (model name, document hash)
+            value (tuple): (inputs, encoder hidden states)
+            nbytes (int): Size of the tensors in the entry
+        """
+        if nbytes > self.max_bytes:
+            return
+        
+        with self._lock:
+            if key in self._entries:
+                self.bytes -= self._entries.pop(key)[1]
+            
+            self._entries[key] = (value, nbytes)
+            self.bytes += nbytes
+            
+            while self.bytes > self.max_bytes:
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self.bytes -= evicted_bytes
+    
+    def stats(self):
+        """
+        Return hit and miss counts and the current size of the cache.
+        
+        Returns:
+            dict: Cache statistics
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+    
+    def clear(self):
+        """
+        Drop every entry.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+
+class InferenceSlots:
+    """
+    Counting semaphore that admits waiting threads strictly in arrival order.
+    """
+    
+    def __init__(self, size):
+        """
+        Initialize the slots.
+        
+        Args:
+            size (int): Threads that may hold a slot at once
+        """
+        self.size = size
+        self._running = 0
+        self._waiting = deque()
+        self._condition = threading.Condition()
+    
+    def acquire(self):
+        """
+        Wait until this thread is first in line and a slot is free, then take it.
+        """
+        with self._condition:
+            ticket = object()
+            self._waiting.append(ticket)
+            while self._waiting[0] is not ticket or self._running >= self.size:
+                self._condition.wait()
+            self._waiting.popleft()
+            self._running += 1
+            # The next thread in line may fit into another free slot
+            self._condition.notify_all()
+    
+    def release(self):
+        """
+        Give a slot back to the next thread in line.
+        """
+        with self._condition:
+            self._running -= 1
+            self._condition.notify_all()
 
 
 class AbstractiveSummarizer:
     """
     A class that implements various abstractive text summarization methods.
+    
+    One instance can be shared across threads. Each model is loaded once, by
+    the first thread that needs it, and at most max_concurrency requests run on
+    a model at a time; the others wait their turn.
     """
     
-    def __init__(self):
+    def __init__(self, encoder_cache_bytes=256 * 1024 * 1024, draft_model_path=None, max_concurrency=1):
         """
         Initialize the summarizer with models lazily loaded when needed.
+        
+        Args:
+            encoder_cache_bytes (int): Memory budget for reusing encoder outputs
+                across calls on the same document
+            draft_model_path (str, optional): Local directory of a distilled BART
+                model sharing bart-large-cnn's tokenizer, used by the 'assisted' profile
+            max_concurrency (int): Requests that may run on each model at once
         """
         self._bart_summarizer = None
         self._t5_summarizer = None
+        self._encoder_cache = EncoderCache(encoder_cache_bytes)
+        self.draft_model_path = draft_model_path
+        self._bart_draft = None
+        self._bart_draft_failed = False
+        self._assisted_totals = {'requests': 0, 'tokens': 0, 'target_forwards': 0, 'draft_forwards': 0}
+        
+        # One load lock per model, so loading T5 does not wait for BART
+        self._load_locks = {name: threading.Lock() for name in ('bart', 't5', 'bart-draft')}
+        
+        # Inference slots per model; waiting threads are served in arrival order
+        self.max_concurrency = max_concurrency
+        self._slots = {name: InferenceSlots(max_concurrency) for name in ('bart', 't5')}
+        self._stats_lock = threading.Lock()
+        self._inference_totals = {
+            name: {'requests': 0, 'waiting': 0, 'running': 0, 'wait_seconds': 0.0, 'max_wait_seconds': 0.0,
+                   'compute_seconds': 0.0}
+            for name in ('bart', 't5')
+        }
+        
+        # Statistics of the calling thread's last request
+        self._local = threading.local()
+    
+    @property
+    def last_assisted_stats(self):
+        """
+        dict or None: Statistics of the calling thread's last assisted request.
+        """
+        return getattr(self._local, 'assisted_stats', None)
+    
+    @property
+    def last_inference_stats(self):
+        """
+        dict or None: Model, wait and compute seconds of the calling thread's last request.
+        """
+        return getattr(self._local, 'inference_stats', None)
+    
+    def clear_last_stats(self):
+        """
+        Forget the calling thread's last request statistics, so that a later
+        read only sees requests that actually ran after this call.
+        """
+        self._local.assisted_stats = None
+        self._local.inference_stats = None
     
     def _get_bart_summarizer(self):
         """
@@ -26,11 +292,14 @@ class AbstractiveSummarizer:
             pipeline: The BART summarization pipeline
         """
         if self._bart_summarizer is None:
-            self._bart_summarizer = pipeline(
-                "summarization", 
-                model="facebook/bart-large-cnn",
-                device=0 if torch.cuda.is_available() else -1
-            )
+            # Threads arriving during the load wait for it instead of loading a second copy
+            with self._load_locks['bart']:
+                if self._bart_summarizer is None:
+                    self._bart_summarizer = pipeline(
+                        "summarization", 
+                        model="facebook/bart-large-cnn",
+                        device=0 if torch.cuda.is_available() else -1
+                    )
         return self._bart_summarizer
     
     def _get_t5_summarizer(self):
@@ -41,14 +310,306 @@ class AbstractiveSummarizer:
             pipeline: The T5 summarization pipeline
         """
         if self._t5_summarizer is None:
-            self._t5_summarizer = pipeline(
-                "summarization", 
-                model="t5-small",
-                device=0 if torch.cuda.is_available() else -1
-            )
+            with self._load_locks['t5']:
+                if self._t5_summarizer is None:
+                    self._t5_summarizer = pipeline(
+                        "summarization", 
+                        model="t5-small",
+                        device=0 if torch.cuda.is_available() else -1
+                    )
         return self._t5_summarizer
     
-    def bart(self, text, max_length=150, min_length=50):
+    def _get_bart_draft(self):
+        """
+        Lazily load the BART draft model for assisted decoding.
+        
+        Returns:
+            pipeline or None: The draft pipeline, or None when no usable draft
+            model is configured
+        """
+        if self._bart_draft is not None or self._bart_draft_failed or not self.draft_model_path:
+            return self._bart_draft
+        
+        with self._load_locks['bart-draft']:
+            if self._bart_draft is not None or self._bart_draft_failed:
+                return self._bart_draft
+            
+            try:
+                draft = pipeline(
+                    "summarization",
+                    model=self.draft_model_path,
+                    device=0 if torch.cuda.is_available() else -1,
+                    model_kwargs={'local_files_only': True}
+                )
+            except (OSError, ValueError) as e:
+                warnings.warn(f"Could not load draft model from {self.draft_model_path}: {e}; "
+                              f"falling back to greedy decoding")
+                self._bart_draft_failed = True
+                return None
+            
+            # Draft tokens are verified by id, so both models must share a vocabulary
+            if draft.tokenizer.get_vocab() != self._get_bart_summarizer().tokenizer.get_vocab():
+                warnings.warn(f"Draft model at {self.draft_model_path} does not share bart-large-cnn's "
+                              f"tokenizer; falling back to greedy decoding")
+                self._bart_draft_failed = True
+                return None
+            
+            self._bart_draft = draft
+            return draft
+    
+    def _get_draft(self, model_name):
+        """
+        Return the draft pipeline for a model, if one is configured.
+        """
+        if model_name == 'bart':
+            return self._get_bart_draft()
+        return None
+    
+    def _encode(self, model_name, summarizer, text):
+        """
+        Tokenize and encode a document, reusing cached encoder outputs.
+        
+        Args:
+            model_name (str): Name of the model, part of the cache key
+            summarizer (pipeline): Pipeline providing the model and tokenizer
+            text (str): The (already truncated and prefixed) model input
+            
+        Returns:
+            tuple: (attention mask, encoder last hidden state)
+        """
+        key = (model_name, hashlib.sha1(text.encode('utf-8')).hexdigest())
+        cached = self._encoder_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        model = summarizer.model
+        tokenizer = summarizer.tokenizer
+        inputs = tokenizer(
+            text,
+            return_tensors='pt',
+            truncation=True,
+            max_length=tokenizer.model_max_length
+        ).to(model.device)
+        
+        with torch.no_grad():
+            hidden_state = model.get_encoder()(
+                input_ids=inputs['input_ids'],
+                attention_mask=inputs['attention_mask'],
+                return_dict=True
+            ).last_hidden_state
+        
+        attention_mask = inputs['attention_mask']
+        nbytes = sum(t.element_size() * t.nelement() for t in (attention_mask, hidden_state))
+        self._encoder_cache.put(key, (attention_mask, hidden_state), nbytes)
+        
+        return attention_mask, hidden_state
+    
+    @contextmanager
+    def _inference_slot(self, model_name):
+        """
+        Hold one of a model's inference slots, recording queue wait and compute time.
+        
+        Args:
+            model_name (str): 'bart' or 't5'
+        """
+        totals = self._inference_totals[model_name]
+        with self._stats_lock:
+            totals['waiting'] += 1
+        
+        start = time.perf_counter()
+        self._slots[model_name].acquire()
+        acquired = time.perf_counter()
+        wait = acquired - start
+        with self._stats_lock:
+            totals['waiting'] -= 1
+            totals['running'] += 1
+            totals['wait_seconds'] += wait
+            totals['max_wait_seconds'] = max(totals['max_wait_seconds'], wait)
+        
+        try:
+            yield
+        finally:
+            self._slots[model_name].release()
+            compute = time.perf_counter() - acquired
+            with self._stats_lock:
+                totals['running'] -= 1
+                totals['requests'] += 1
+                totals['compute_seconds'] += compute
+            self._local.inference_stats = {'model': model_name, 'wait_seconds': wait, 'compute_seconds': compute}
+    
+    def inference_stats(self):
+        """
+        Return per-model request counts and the time spent queueing versus computing.
+        
+        Returns:
+            dict: For 'bart' and 't5', completed requests, requests waiting and
+            running now, total, mean and maximum wait seconds, total and mean
+            compute seconds, and the share of request time spent waiting
+        """
+        with self._stats_lock:
+            stats = {name: dict(totals) for name, totals in self._inference_totals.items()}
+        
+        for totals in stats.values():
+            requests = totals['requests']
+            busy = totals['wait_seconds'] + totals['compute_seconds']
+            totals['mean_wait_seconds'] = totals['wait_seconds'] / requests if requests else 0.0
+            totals['mean_compute_seconds'] = totals['compute_seconds'] / requests if requests else 0.0
+            totals['wait_share'] = totals['wait_seconds'] / busy if busy else 0.0
+        return stats
+    
+    def _generate(self, model_name, summarizer, text, max_length, min_length, profile=None):
+        """
+        Generate a summary, paying only for decoding when the document was seen before.
+        
+        Args:
+            model_name (str): Name of the model, part of the cache key
+            summarizer (pipeline): Pipeline providing the model and tokenizer
+            text (str): The (already truncated and prefixed) model input
+            max_length (int): Maximum length of the summary in tokens
+            min_length (int): Minimum length of the summary in tokens
+            profile (str, optional): Decoding profile from GENERATION_PROFILES
+            
+        Returns:
+            str: The summarized text
+        """
+        # Requests beyond the model's concurrency limit queue here
+        with self._inference_slot(model_name):
+            attention_mask, hidden_state = self._encode(model_name, summarizer, text)
+            kwargs = generation_kwargs(profile, int(attention_mask.sum()), max_length, min_length)
+            
+            draft = self._get_draft(model_name) if kwargs.pop('assistant', False) else None
+            if draft is not None:
+                output_ids = self._generate_assisted(
+                    model_name, summarizer, draft, text, attention_mask, hidden_state, kwargs
+                )
+            else:
+                # generate() expands the encoder outputs for beam search in place, so
+                # hand it a fresh wrapper around the cached tensor every time
+                with torch.no_grad():
+                    output_ids = summarizer.model.generate(
+                        attention_mask=attention_mask,
+                        encoder_outputs=BaseModelOutput(last_hidden_state=hidden_state),
+                        **kwargs
+                    )
+            
+            return summarizer.tokenizer.decode(
+                output_ids[0],
+                skip_special_tokens=True,
+                clean_up_tokenization_spaces=True
+            )
+    
+    def _generate_assisted(self, model_name, summarizer, draft, text, attention_mask, hidden_state, kwargs):
+        """
+        Decode greedily with the draft model proposing tokens for the target to verify.
+        
+        Forward passes of both models are counted with hooks to report how many
+        draft tokens were accepted and how many target passes were saved; the
+        result is kept in last_assisted_stats.
+        
+        Args:
+            model_name (str): Name of the target model, part of the cache key
+            summarizer (pipeline): Target pipeline
+            draft (pipeline): Draft pipeline sharing the target's tokenizer
+            text (str): The model input
+            attention_mask (torch.Tensor): Attention mask of the target input
+            hidden_state (torch.Tensor): Target encoder output
+            kwargs (dict): Greedy generate() arguments
+            
+        Returns:
+            torch.Tensor: Generated token ids
+        """
+        _, draft_hidden_state = self._encode(f'{model_name}-draft', draft, text)
+        counts = {'target': 0, 'draft': 0}
+        
+        # Only count this thread's passes; other requests may share the models
+        thread = threading.get_ident()
+        
+        def counter(name):
+            def hook(module, inputs, output):
+                if threading.get_ident() == thread:
+                    counts[name] += 1
+            return hook
+        
+        handles = [
+            summarizer.model.register_forward_hook(counter('target')),
+            draft.model.register_forward_hook(counter('draft')),
+        ]
+        start = time.perf_counter()
+        try:
+            with torch.no_grad():
+                output_ids = summarizer.model.generate(
+                    attention_mask=attention_mask,
+                    encoder_outputs=BaseModelOutput(last_hidden_state=hidden_state),
+                    assistant_model=draft.model,
+                    assistant_encoder_outputs=BaseModelOutput(last_hidden_state=draft_hidden_state),
+                    **kwargs
+                )
+        finally:
+            for handle in handles:
+                handle.remove()
+        seconds = time.perf_counter() - start
+        
+        # Each target pass verifies the pending draft tokens and adds one token of its own,
+        # so every generated token beyond one per target pass is an accepted draft token
+        tokens = output_ids.shape[-1] - 1
+        accepted = max(tokens - counts['target'], 0)
+        self._local.assisted_stats = {
+            'tokens': tokens,
+            'target_forwards': counts['target'],
+            'draft_forwards': counts['draft'],
+            'acceptance_rate': accepted / counts['draft'] if counts['draft'] else 0.0,
+            'estimated_speedup': tokens / counts['target'] if counts['target'] else 1.0,
+            'seconds': seconds,
+        }
+        
+        with self._stats_lock:
+            totals = self._assisted_totals
+            totals['requests'] += 1
+            totals['tokens'] += tokens
+            totals['target_forwards'] += counts['target']
+            totals['draft_forwards'] += counts['draft']
+        
+        return output_ids
+    
+    def assisted_stats(self):
+        """
+        Return aggregate statistics of assisted decoding.
+        
+        The estimated speedup is the number of target decoder passes plain greedy
+        decoding would have needed (one per token) over the number actually run;
+        measure wall-clock speedup with `python -m modules.benchmarks assisted`.
+        
+        Returns:
+            dict: Requests, tokens, forward pass counts, acceptance rate and speedup,
+            plus the statistics of the last request
+        """
+        with self._stats_lock:
+            totals = dict(self._assisted_totals)
+        accepted = max(totals['tokens'] - totals['target_forwards'], 0)
+        totals['acceptance_rate'] = accepted / totals['draft_forwards'] if totals['draft_forwards'] else 0.0
+        totals['estimated_speedup'] = (
+            totals['tokens'] / totals['target_forwards'] if totals['target_forwards'] else 1.0
+        )
+        totals['draft_model'] = self.draft_model_path if self._bart_draft is not None else None
+        totals['last'] = self.last_assisted_stats
+        return totals
+    
+    def encoder_cache_stats(self):
+        """
+        Return statistics of the encoder output cache.
+        
+        Returns:
+            dict: Entries, bytes, hits and misses
+        """
+        return self._encoder_cache.stats()
+    
+    def clear_encoder_cache(self):
+        """
+        Drop all cached encoder outputs, e.g. to time cold requests.
+        """
+        self._encoder_cache.clear()
+    
+    def bart(self, text, max_length=150, min_length=50, profile=None):
         """
         Summarize text using the BART model.
         
@@ -56,6 +617,7 @@ class AbstractiveSummarizer:
             text (str): The text to summarize
             max_length (int): Maximum length of the summary in tokens
             min_length (int): Minimum length of the summary in tokens
+            profile (str, optional): Decoding profile from GENERATION_PROFILES
             
         Returns:
             str: The summarized text
@@ -68,16 +630,9 @@ class AbstractiveSummarizer:
             words = text.split()
             text = " ".join(words[:max_input_length])
         
-        summary = summarizer(
-            text, 
-            max_length=max_length, 
-            min_length=min_length, 
-            do_sample=False
-        )
-        
-        return summary[0]['summary_text']
+        return self._generate('bart', summarizer, text, max_length, min_length, profile)
     
-    def t5(self, text, max_length=150, min_length=50):
+    def t5(self, text, max_length=150, min_length=50, profile=None):
         """
         Summarize text using the T5 model.
         
@@ -85,6 +640,7 @@ class AbstractiveSummarizer:
             text (str): The text to summarize
             max_length (int): Maximum length of the summary in tokens
             min_length (int): Minimum length of the summary in tokens
+            profile (str, optional): Decoding profile from GENERATION_PROFILES
             
         Returns:
             str: The summarized text
@@ -100,34 +656,120 @@ class AbstractiveSummarizer:
         # T5 requires a "summarize: " prefix
         prefixed_text = "summarize: " + text
         
-        summary = summarizer(
-            prefixed_text, 
-            max_length=max_length, 
-            min_length=min_length, 
-            do_sample=False
-        )
+        return self._generate('t5', summarizer, prefixed_text, max_length, min_length, profile)
+    
+    def t5_chunked(self, text, max_length=150, min_length=50, profile=None, chunk_words=400, max_chunks=8):
+        """
+        Summarize long text with T5 by summarizing consecutive chunks.
+        
+        Covers more of a long document than a single truncated T5 call while
+        staying much cheaper than BART, so it is the usual downgrade target.
+        
+        Args:
+            text (str): The text to summarize
+            max_length (int): Maximum length of the whole summary in tokens
+            min_length (int): Minimum length of the whole summary in tokens
+            profile (str, optional): Decoding profile used for every chunk
+            chunk_words (int): Number of words per chunk
+            max_chunks (int): Maximum number of chunks summarized
+            
+        Returns:
+            str: The summarized text
+        """
+        words = text.split()
+        chunks = [
+            " ".join(words[i:i + chunk_words])
+            for i in range(0, min(len(words), chunk_words * max_chunks), chunk_words)
+        ]
+        
+        if len(chunks) <= 1:
+            return self.t5(text, max_length, min_length, profile)
+        
+        # Spread the length budget over the chunks
+        chunk_max_length = max(max_length // len(chunks), 20)
+        chunk_min_length = min(max(min_length // len(chunks), 5), chunk_max_length)
+        
+        summaries = [self.t5(chunk, chunk_max_length, chunk_min_length, profile) for chunk in chunks]
         
-        return summary[0]['summary_text']
+        return " ".join(summaries)
     
-    def summarize(self, text, method='bart', max_length=150, min_length=50):
+    @staticmethod
+    def condense(text, token_budget=512, ranker='tfidf', splitter='punkt', query=None):
+        """
+        Shrink a document to its most salient sentences within a token budget.
+        
+        Args:
+            text (str): The text to condense
+            token_budget (int): Approximate maximum number of model input tokens
+            ranker (str): Extractive method used to rank sentences
+            splitter (str): Sentence splitter, 'punkt' or 'finance'
+            query (str, optional): Rank sentences by BM25 relevance to this query
+                instead; the ranker is used when no sentence matches
+            
+        Returns:
+            str: The selected sentences in document order
+        """
+        if query:
+            ranking = ExtractiveSummarizer.query_ranking(text, query, splitter, fallback=ranker)
+        else:
+            ranking = ExtractiveSummarizer.rank(text, ranker, splitter=splitter)
+        condensed = ranking.cut_words(int(token_budget / TOKENS_PER_WORD))
+        
+        # Keep at least the best sentence even if it is longer than the budget
+        return condensed or ranking.cut(1)
+    
+    def hybrid(self, text, max_length=150, min_length=50, profile=None, model='bart', token_budget=512,
+               ranker='tfidf', splitter='punkt', query=None):
+        """
+        Summarize text by extracting salient sentences first and then running
+        the abstractive model on that shorter input only.
+        
+        Args:
+            text (str): The text to summarize
+            max_length (int): Maximum length of the summary in tokens
+            min_length (int): Minimum length of the summary in tokens
+            profile (str, optional): Decoding profile from GENERATION_PROFILES
+            model (str): 'bart' or 't5'
+            token_budget (int): Approximate model input size in tokens
+            ranker (str): Extractive method used to select sentences
+            splitter (str): Sentence splitter, 'punkt' or 'finance'
+            query (str, optional): Select the sentences most relevant to this query
+            
+        Returns:
+            str: The summarized text
+        """
+        models = {
+            'bart': self.bart,
+            't5': self.t5
+        }
+        
+        if model not in models:
+            raise ValueError(f"Model '{model}' not supported. Choose from: {', '.join(models.keys())}")
+        
+        condensed = self.condense(text, token_budget, ranker, splitter, query)
+        return models[model](condensed, max_length, min_length, profile)
+    
+    def summarize(self, text, method='bart', max_length=150, min_length=50, profile=None):
         """
         Summarize text using the specified method.
         
         Args:
             text (str): The text to summarize
-            method (str): The summarization method to use ('bart' or 't5')
+            method (str): The summarization method to use ('bart', 't5' or 't5_chunked')
             max_length (int): Maximum length of the summary in tokens
             min_length (int): Minimum length of the summary in tokens
+            profile (str, optional): Decoding profile from GENERATION_PROFILES
             
         Returns:
             str: The summarized text
         """
         methods = {
             'bart': self.bart,
-            't5': self.t5
+            't5': self.t5,
+            't5_chunked': self.t5_chunked
         }
         
         if method not in methods:
             raise ValueError(f"Method '{method}' not supported. Choose from: {', '.join(methods.keys())}")
         
-        return methods[method](text, max_length, min_length)
\ No newline at end of file
+        return methods[method](text, max_length, min_length, profile)
\ No newline at end of file
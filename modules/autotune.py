@@ -0,0 +1,291 @@
+"""
+Quality/latency autotuning for the Financial Text Summarizer.
+
+Sweeps the parameters of each registered method over a reference set, scores
+every configuration with ROUGE, latency and peak memory, and reports the Pareto
+frontier plus a recommended configuration per document-length bucket.
+
+Each method pays its cold cost (sentence ranking, or model encoding) once per
+document: the first call fills the ranking or encoder cache, and every other
+configuration of the sweep is timed warm and charged the measured cold overhead.
+
+Usage:
+    python -m modules.autotune --input references.jsonl --methods tfidf lsa bart --output tuned.json
+"""
+
+import argparse
+import itertools
+import json
+import time
+import tracemalloc
+
+import pandas as pd
+
+from modules.benchmarks import ROUGE_METRICS, load_reference_set
+
+# Parameter grid swept for each method family
+DEFAULT_GRID = {
+    'extractive': {
+        'num_sentences': [1, 2, 3, 5, 7, 10],
+    },
+    'abstractive': {
+        'max_length': [60, 100, 150, 200],
+        'min_length': [20, 50],
+        'profile': [None, 'fast', 'balanced'],
+    },
+}
+
+# Document length buckets in words: (name, lower bound inclusive, upper bound exclusive)
+LENGTH_BUCKETS = [
+    ('short', 0, 300),
+    ('medium', 300, 1000),
+    ('long', 1000, float('inf')),
+]
+
+
+def length_bucket(num_words):
+    """
+    Name the length bucket of a document.
+
+    Args:
+        num_words (int): Document length in words
+
+    Returns:
+        str: Bucket name from LENGTH_BUCKETS
+    """
+    for name, low, high in LENGTH_BUCKETS:
+        if low <= num_words < high:
+            return name
+    return LENGTH_BUCKETS[-1][0]
+
+
+def _configs(grid):
+    """
+    Expand a parameter grid into a list of parameter dicts, skipping invalid ones.
+    """
+    keys = list(grid)
+    configs = []
+    for values in itertools.product(*(grid[key] for key in keys)):
+        config = dict(zip(keys, values))
+        if config.get('min_length', 0) >= config.get('max_length', float('inf')):
+            continue
+        configs.append(config)
+    return configs
+
+
+def pareto_frontier(frame, metric='ROUGE-L', cost='Seconds'):
+    """
+    Keep the rows no other row beats on both quality and cost.
+
+    Args:
+        frame (pd.DataFrame): One row per configuration
+        metric (str): Quality column, higher is better
+        cost (str): Cost column, lower is better
+
+    Returns:
+        pd.DataFrame: Non-dominated rows, cheapest first
+    """
+    ordered = frame.sort_values([cost, metric], ascending=[True, False])
+    best = float('-inf')
+    keep = []
+    for index, value in zip(ordered.index, ordered[metric]):
+        if value > best:
+            keep.append(index)
+            best = value
+    return ordered.loc[keep].reset_index(drop=True)
+
+
+class Autotuner:
+    """
+    Sweeps method parameters against a reference set.
+    """
+
+    def __init__(self, methods, registry=None, evaluator=None, grid=None, **fixed_params):
+        """
+        Initialize the autotuner.
+
+        Args:
+            methods (list): Registry method names or labels to tune
+            registry (SummarizerRegistry, optional): Registry providing the methods
+            evaluator (SummaryEvaluator, optional): ROUGE scorer
+            grid (dict, optional): Family mapped to {parameter: values}; defaults to DEFAULT_GRID
+            **fixed_params: Parameters held constant across the sweep (e.g. splitter)
+        """
+        if registry is None:
+            from modules.registry import SummarizerRegistry
+            registry = SummarizerRegistry()
+        if evaluator is None:
+            from modules.evaluation import SummaryEvaluator
+            evaluator = SummaryEvaluator()
+
+        self.registry = registry
+        self.evaluator = evaluator
+        self.methods = [registry.get(method) for method in methods]
+        self.grid = DEFAULT_GRID if grid is None else grid
+        self.fixed_params = fixed_params
+        self.results = pd.DataFrame()
+
+    def _clear_caches(self, method):
+        """
+        Drop the ranking or encoder cache a method would reuse.
+        """
+        if method.family == 'extractive':
+            self.registry.extractive.clear_ranking_cache()
+        elif hasattr(self.registry.abstractive, 'clear_encoder_cache'):
+            self.registry.abstractive.clear_encoder_cache()
+
+    def _sweep_document(self, method, configs, doc_id, text, reference):
+        """
+        Run every configuration of one method on one document.
+        """
+        resolved = [method.resolve_params(**dict(self.fixed_params, **config)) for config in configs]
+
+        # Peak Python-heap allocations of a cold call (torch tensors are not traced)
+        self._clear_caches(method)
+        tracemalloc.start()
+        method.func(text, **resolved[0])
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # Cold call minus the same call warm is the cost every request pays once
+        self._clear_caches(method)
+        start = time.perf_counter()
+        method.func(text, **resolved[0])
+        cold_seconds = time.perf_counter() - start
+
+        rows = []
+        for config, params in zip(configs, resolved):
+            start = time.perf_counter()
+            summary = method.func(text, **params)
+            warm_seconds = time.perf_counter() - start
+            if not rows:
+                overhead = max(cold_seconds - warm_seconds, 0.0)
+
+            row = {
+                'Method': method.label,
+                'Config': json.dumps(config, sort_keys=True),
+                'Document': doc_id,
+                'Bucket': length_bucket(len(text.split())),
+                'Seconds': warm_seconds + overhead,
+                'Peak MB': peak / 1e6,
+            }
+            row.update(self.evaluator.calculate_rouge(reference, summary))
+            rows.append(row)
+
+        return rows
+
+    def run(self, reference_set):
+        """
+        Sweep every method over the reference set.
+
+        Args:
+            reference_set (list): (doc_id, text, reference) tuples
+
+        Returns:
+            pd.DataFrame: One row per (method, configuration, document)
+        """
+        rows = []
+        for method in self.methods:
+            configs = _configs(self.grid.get(method.family, {})) or [{}]
+            for doc_id, text, reference in reference_set:
+                rows.extend(self._sweep_document(method, configs, doc_id, text, reference))
+
+        self.results = pd.DataFrame(rows)
+        return self.results
+
+    def aggregate(self, bucket=None):
+        """
+        Average the results per method and configuration.
+
+        Args:
+            bucket (str, optional): Only use documents of this length bucket
+
+        Returns:
+            pd.DataFrame: Mean ROUGE, seconds and peak memory per configuration
+        """
+        results = self.results if bucket is None else self.results[self.results['Bucket'] == bucket]
+        return results.groupby(['Method', 'Config'], sort=False).agg(
+            **{metric: (metric, 'mean') for metric in ROUGE_METRICS},
+            Seconds=('Seconds', 'mean'),
+            **{'Peak MB': ('Peak MB', 'max')},
+            Documents=('Document', 'nunique')
+        ).reset_index()
+
+    def frontier(self, metric='ROUGE-L', bucket=None):
+        """
+        Pareto frontier of quality against latency.
+
+        Args:
+            metric (str): Quality metric
+            bucket (str, optional): Only use documents of this length bucket
+
+        Returns:
+            pd.DataFrame: Non-dominated configurations, fastest first
+        """
+        return pareto_frontier(self.aggregate(bucket), metric)
+
+    def recommend(self, metric='ROUGE-L', tolerance=0.01, max_seconds=None):
+        """
+        Recommend a configuration per length bucket.
+
+        The recommendation is the fastest frontier configuration whose score is
+        within `tolerance` of the best one that fits the latency budget.
+
+        Args:
+            metric (str): Quality metric
+            tolerance (float): Absolute score a faster configuration may give up
+            max_seconds (float, optional): Latency budget per document
+
+        Returns:
+            dict: Bucket name mapped to method, registry name, params, score and seconds
+        """
+        recommendations = {}
+        for bucket in self.results['Bucket'].unique():
+            frontier = self.frontier(metric, bucket)
+            if max_seconds is not None:
+                frontier = frontier[frontier['Seconds'] <= max_seconds]
+            if frontier.empty:
+                continue
+
+            good_enough = frontier[frontier[metric] >= frontier[metric].max() - tolerance]
+            choice = good_enough.iloc[0]
+            recommendations[bucket] = {
+                'method': self.registry.get(choice['Method']).name,
+                'label': choice['Method'],
+                'params': json.loads(choice['Config']),
+                metric: float(choice[metric]),
+                'seconds': float(choice['Seconds']),
+                'documents': int(choice['Documents']),
+            }
+        return recommendations
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tune summarizer parameters against a reference set")
+    parser.add_argument('--input', help="JSON Lines reference set; defaults to the bundled samples")
+    parser.add_argument('--methods', nargs='+', default=['text_rank', 'lex_rank', 'lsa', 'tfidf'])
+    parser.add_argument('--metric', choices=ROUGE_METRICS, default='ROUGE-L')
+    parser.add_argument('--tolerance', type=float, default=0.01)
+    parser.add_argument('--max-seconds', type=float)
+    parser.add_argument('--splitter', choices=['punkt', 'finance'], default='punkt')
+    parser.add_argument('--results', help="CSV file for the per-document results")
+    parser.add_argument('--output', help="JSON file for the recommended configurations")
+    args = parser.parse_args(argv)
+
+    tuner = Autotuner(args.methods, splitter=args.splitter)
+    tuner.run(load_reference_set(args.input))
+
+    if args.results:
+        tuner.results.to_csv(args.results, index=False)
+
+    print(tuner.frontier(args.metric).to_string(index=False))
+    recommendations = tuner.recommend(args.metric, args.tolerance, args.max_seconds)
+    print(json.dumps(recommendations, indent=2))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(recommendations, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,800 @@
+"""
+Sharded batch summarization for the Financial Text Summarizer.
+
+A corpus is loaded into a SQLite work queue and split into shards. Any number of
+worker processes, on one host or on several hosts sharing the database file,
+claim documents under a lease, summarize them through the method registry, score
+them with SummaryEvaluator and publish results. A crashed worker's lease expires
+and its documents are claimed again, and re-publishing a result is idempotent,
+so workers can be killed and restarted at any time. A document that fails or
+outlives its lease too many times is marked failed instead of being retried forever.
+
+Usage:
+    python -m modules.batch enqueue --queue corpus.db --input corpus.jsonl --shards 8
+    python -m modules.batch run --queue corpus.db --workers 8 --methods tfidf lsa --strip-boilerplate
+    python -m modules.batch work --queue corpus.db --shard 3 --methods tfidf lsa
+    python -m modules.batch report --queue corpus.db --output report.csv
+"""
+
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import re
+import socket
+import sqlite3
+import time
+import uuid
+import zlib
+
+import pandas as pd
+
+from utils.threads import get_thread_budget, limit_threads
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    doc_id TEXT PRIMARY KEY,
+    shard INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    reference TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    worker TEXT,
+    lease_until REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS documents_claim ON documents (status, shard);
+CREATE TABLE IF NOT EXISTS results (
+    doc_id TEXT NOT NULL,
+    method TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    rouge1 REAL,
+    rouge2 REAL,
+    rougeL REAL,
+    seconds REAL NOT NULL,
+    worker TEXT NOT NULL,
+    PRIMARY KEY (doc_id, method)
+);
+CREATE TABLE IF NOT EXISTS boilerplate (
+    doc_id TEXT PRIMARY KEY,
+    sentences INTEGER NOT NULL,
+    removed INTEGER NOT NULL,
+    words_before INTEGER NOT NULL,
+    words_after INTEGER NOT NULL,
+    seconds REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    worker TEXT PRIMARY KEY,
+    shard INTEGER,
+    completed INTEGER NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+def shard_of(doc_id, num_shards):
+    """
+    Map a document id to its shard with a hash that is stable across processes.
+
+    Args:
+        doc_id (str): Document identifier
+        num_shards (int): Number of shards
+
+    Returns:
+        int: Shard index
+    """
+    return zlib.crc32(doc_id.encode('utf-8')) % num_shards
+
+
+class WorkQueue:
+    """
+    SQLite-backed work queue shared by batch workers.
+    """
+
+    def __init__(self, path, lease_seconds=600, max_attempts=3):
+        """
+        Open (and create if needed) the queue database.
+
+        Args:
+            path (str): Path to the SQLite file; must be on a filesystem with
+                working POSIX locks when shared between hosts
+            lease_seconds (float): How long a claim lasts before it can be reclaimed
+            max_attempts (int): Claims of a document before a failure or an expired
+                lease marks it failed
+        """
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._conn = sqlite3.connect(path, timeout=60, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+        # Queues created before failures were recorded lack the error column
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(documents)")}
+        if 'error' not in columns:
+            self._conn.execute("ALTER TABLE documents ADD COLUMN error TEXT")
+
+    def close(self):
+        self._conn.close()
+
+    def enqueue(self, documents, num_shards=1):
+        """
+        Add documents to the queue. Documents already present are left untouched.
+
+        Args:
+            documents (iterable): (doc_id, text, reference) tuples; reference may be None
+            num_shards (int): Number of shards to spread the documents over
+
+        Returns:
+            int: Number of newly added documents
+        """
+        rows = ((doc_id, shard_of(doc_id, num_shards), text, reference)
+                for doc_id, text, reference in documents)
+
+        before = self._conn.total_changes
+        self._conn.execute("BEGIN IMMEDIATE")
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO documents (doc_id, shard, text, reference) VALUES (?, ?, ?, ?)",
+            rows
+        )
+        self._conn.execute("COMMIT")
+        return self._conn.total_changes - before
+
+    def claim(self, worker_id, shard=None, limit=16, steal=True):
+        """
+        Claim a batch of pending or expired documents.
+
+        Expired documents that have used up their attempts are marked failed
+        instead, so a document that keeps killing its worker is not claimed forever.
+
+        Args:
+            worker_id (str): Identifier of the claiming worker
+            shard (int, optional): Preferred shard; None claims from any shard
+            limit (int): Maximum number of documents to claim
+            steal (bool): Fall back to other shards once the preferred one is empty
+
+        Returns:
+            list: (doc_id, text, reference) tuples
+        """
+        now = time.time()
+        claimable = "(status = 'pending' OR (status = 'claimed' AND lease_until < ?))"
+
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.execute(
+                "UPDATE documents SET status = 'failed', lease_until = NULL, "
+                "error = COALESCE(error, 'lease expired') "
+                "WHERE status = 'claimed' AND lease_until < ? AND attempts >= ?",
+                (now, self.max_attempts)
+            )
+
+            if shard is not None:
+                rows = self._conn.execute(
+                    f"SELECT doc_id, text, reference FROM documents WHERE {claimable} AND shard = ? LIMIT ?",
+                    (now, shard, limit)
+                ).fetchall()
+                if not rows and steal:
+                    rows = self._conn.execute(
+                        f"SELECT doc_id, text, reference FROM documents WHERE {claimable} LIMIT ?",
+                        (now, limit)
+                    ).fetchall()
+            else:
+                rows = self._conn.execute(
+                    f"SELECT doc_id, text, reference FROM documents WHERE {claimable} LIMIT ?",
+                    (now, limit)
+                ).fetchall()
+
+            self._conn.executemany(
+                "UPDATE documents SET status = 'claimed', worker = ?, lease_until = ?, "
+                "attempts = attempts + 1 WHERE doc_id = ?",
+                [(worker_id, now + self.lease_seconds, row[0]) for row in rows]
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+
+        return rows
+
+    def renew(self, worker_id, doc_ids):
+        """
+        Extend the leases of documents this worker still holds.
+
+        Args:
+            worker_id (str): Identifier of the worker
+            doc_ids (list): Documents claimed by the worker
+
+        Returns:
+            set: The documents whose lease was renewed; the others were reclaimed
+                by another worker after their lease expired
+        """
+        if not doc_ids:
+            return set()
+
+        placeholders = ", ".join("?" * len(doc_ids))
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.execute(
+                f"UPDATE documents SET lease_until = ? "
+                f"WHERE worker = ? AND status = 'claimed' AND doc_id IN ({placeholders})",
+                (time.time() + self.lease_seconds, worker_id, *doc_ids)
+            )
+            held = self._conn.execute(
+                f"SELECT doc_id FROM documents "
+                f"WHERE worker = ? AND status = 'claimed' AND doc_id IN ({placeholders})",
+                (worker_id, *doc_ids)
+            ).fetchall()
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+
+        return {row[0] for row in held}
+
+    def fail(self, worker_id, doc_id, error):
+        """
+        Give up a document after an error.
+
+        The document goes back to pending for another attempt, or is marked
+        failed once it has been claimed max_attempts times.
+
+        Args:
+            worker_id (str): Identifier of the worker
+            doc_id (str): Document identifier
+            error (str): Description of the error
+
+        Returns:
+            bool: True if the document is now marked failed
+        """
+        self._conn.execute(
+            "UPDATE documents SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+            "lease_until = NULL, error = ? WHERE doc_id = ? AND worker = ? AND status = 'claimed'",
+            (self.max_attempts, error, doc_id, worker_id)
+        )
+        status = self._conn.execute("SELECT status FROM documents WHERE doc_id = ?", (doc_id,)).fetchone()
+        return status is not None and status[0] == 'failed'
+
+    def complete(self, worker_id, doc_id, results, filter_report=None):
+        """
+        Publish the results for a document and mark it done.
+
+        Results are only published while the worker still holds the document.
+        If its lease expired and another worker claimed it, that worker publishes
+        instead, so the document appears once in the report and its terms are
+        counted once.
+
+        Args:
+            worker_id (str): Identifier of the publishing worker
+            doc_id (str): Document identifier
+            results (list): Dicts with keys method, summary, seconds and
+                optionally ROUGE-1, ROUGE-2 and ROUGE-L
+            filter_report (FilterReport, optional): Boilerplate removed before summarizing
+
+        Returns:
+            bool: True if the results were published
+        """
+        self._conn.execute("BEGIN IMMEDIATE")
+        held = self._conn.execute(
+            "UPDATE documents SET status = 'done', lease_until = NULL, error = NULL "
+            "WHERE doc_id = ? AND worker = ? AND status = 'claimed'",
+            (doc_id, worker_id)
+        ).rowcount
+        if not held:
+            self._conn.execute("ROLLBACK")
+            return False
+
+        if filter_report is not None:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO boilerplate (doc_id, sentences, removed, words_before, words_after, seconds) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (doc_id, filter_report.sentences, filter_report.removed, filter_report.words_before,
+                 filter_report.words_after, filter_report.seconds)
+            )
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO results (doc_id, method, summary, rouge1, rouge2, rougeL, seconds, worker) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (doc_id, r['method'], r['summary'], r.get('ROUGE-1'), r.get('ROUGE-2'),
+                 r.get('ROUGE-L'), r['seconds'], worker_id)
+                for r in results
+            ]
+        )
+        self._conn.execute("COMMIT")
+        return True
+
+    def checkpoint(self, worker_id, shard, completed):
+        """
+        Record a worker's progress.
+
+        Args:
+            worker_id (str): Identifier of the worker
+            shard (int): Shard the worker is assigned to
+            completed (int): Documents completed by the worker so far
+        """
+        self._conn.execute(
+            "INSERT OR REPLACE INTO checkpoints (worker, shard, completed, updated_at) VALUES (?, ?, ?, ?)",
+            (worker_id, shard, completed, time.time())
+        )
+
+    def failures(self):
+        """
+        List the documents marked failed.
+
+        Returns:
+            list: (doc_id, attempts, error) tuples
+        """
+        return self._conn.execute(
+            "SELECT doc_id, attempts, error FROM documents WHERE status = 'failed' ORDER BY doc_id"
+        ).fetchall()
+
+    def progress(self):
+        """
+        Count documents by status.
+
+        Returns:
+            dict: Mapping of status to document count
+        """
+        rows = self._conn.execute("SELECT status, COUNT(*) FROM documents GROUP BY status").fetchall()
+        return dict(rows)
+
+    def boilerplate_frame(self):
+        """
+        Load the boilerplate removed from each document, with the methods run on it.
+
+        Returns:
+            pd.DataFrame: One row per (document, method) with the filter counts
+        """
+        return pd.read_sql_query(
+            "SELECT b.doc_id, r.method, b.sentences, b.removed, b.words_before, b.words_after, b.seconds "
+            "FROM boilerplate b JOIN results r ON r.doc_id = b.doc_id",
+            self._conn
+        )
+
+    def results_frame(self):
+        """
+        Load all published results.
+
+        Returns:
+            pd.DataFrame: One row per (document, method)
+        """
+        return pd.read_sql_query(
+            "SELECT r.doc_id, d.shard, r.method, r.summary, r.rouge1 AS \"ROUGE-1\", "
+            "r.rouge2 AS \"ROUGE-2\", r.rougeL AS \"ROUGE-L\", r.seconds, r.worker "
+            "FROM results r JOIN documents d ON d.doc_id = r.doc_id",
+            self._conn
+        )
+
+    def scores_frame(self):
+        """
+        Load the scores and runtimes of all published results, without the summaries.
+
+        Aggregate reports only need these columns, so large corpora never load
+        their summary text into memory.
+
+        Returns:
+            pd.DataFrame: doc_id, shard, method, ROUGE scores and seconds per (document, method)
+        """
+        return pd.read_sql_query(
+            "SELECT r.doc_id, d.shard, r.method, r.rouge1 AS \"ROUGE-1\", r.rouge2 AS \"ROUGE-2\", "
+            "r.rougeL AS \"ROUGE-L\", r.seconds "
+            "FROM results r JOIN documents d ON d.doc_id = r.doc_id",
+            self._conn,
+            # Scores are NULL without references; keep the columns numeric anyway
+            dtype={'ROUGE-1': 'float64', 'ROUGE-2': 'float64', 'ROUGE-L': 'float64', 'seconds': 'float64'}
+        )
+
+
+class BatchWorker:
+    """
+    Worker that drains a WorkQueue through the method registry.
+    """
+
+    def __init__(self, queue_path, methods, shard=None, worker_id=None, batch_size=16, boilerplate=None,
+                 term_stats=None, lease_seconds=600, max_attempts=3, **params):
+        """
+        Initialize the worker.
+
+        Args:
+            queue_path (str): Path to the queue database
+            methods (list): Registry method names to run on every document
+            shard (int, optional): Preferred shard
+            worker_id (str, optional): Identifier; defaults to host:pid
+            batch_size (int): Documents claimed per round trip
+            boilerplate (str or bool, optional): Strip boilerplate before summarizing;
+                True uses the built-in patterns, a path also loads learned hashes
+            term_stats (str, optional): Count-min sketch of corpus document frequencies
+                (modules.term_stats). TF-IDF takes its IDF from it, the sketch is
+                updated as documents arrive, and the documents this worker counted
+                are saved next to it for merging
+            lease_seconds (float): How long a claim lasts; renewed before each document
+            max_attempts (int): Claims of a document before it is marked failed
+            **params: Method parameters passed to the registry
+        """
+        self.queue_path = queue_path
+        self.methods = list(methods)
+        self.shard = shard
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.batch_size = batch_size
+        self.boilerplate = boilerplate
+        self.term_stats = term_stats
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.params = params
+
+    def _summarize(self, registry, evaluator, name, text, reference, corpus_tfidf, tfidf_params):
+        """
+        Run one method on one document and score it.
+        """
+        start = time.perf_counter()
+        if name == 'tfidf' and corpus_tfidf is not None:
+            summary, seconds = corpus_tfidf
+        elif name == 'tfidf':
+            # The batch pass failed; retry this document on its own with the same IDF
+            summary = registry.summarize_corpus('tfidf', [text], **tfidf_params)[0]
+            seconds = time.perf_counter() - start
+        else:
+            summary = registry.summarize(name, text, **self.params)
+            seconds = time.perf_counter() - start
+        result = {'method': name, 'summary': summary, 'seconds': seconds}
+
+        # Score in the worker so ROUGE scales with the pool too
+        if reference:
+            result.update(evaluator.calculate_rouge(reference, summary))
+        return result
+
+    def run(self):
+        """
+        Process documents until the queue is drained.
+
+        A document whose filtering, summarizing or scoring raises is handed back
+        to the queue, which marks it failed after max_attempts claims; the other
+        documents of the batch carry on.
+
+        Returns:
+            int: Number of documents completed by this worker
+        """
+        from modules.registry import SummarizerRegistry
+        from modules.evaluation import SummaryEvaluator
+        from modules.boilerplate import BoilerplateFilter
+        from modules.term_stats import TermStatistics, document_terms
+
+        queue = WorkQueue(self.queue_path, self.lease_seconds, self.max_attempts)
+        registry = SummarizerRegistry()
+        evaluator = SummaryEvaluator()
+        completed = 0
+
+        # Split sentences for the filter the same way the methods will
+        splitter = self.params.get('splitter', 'punkt')
+        boilerplate_filter = None
+        if isinstance(self.boilerplate, str):
+            boilerplate_filter = BoilerplateFilter.load(self.boilerplate, splitter=splitter)
+        elif self.boilerplate:
+            boilerplate_filter = BoilerplateFilter(splitter=splitter)
+        
+        # Corpus sketch used for IDF, and a delta of what this worker completed
+        corpus_stats = worker_stats = None
+        counted = set()
+        if self.term_stats:
+            if os.path.exists(self.term_stats):
+                corpus_stats = TermStatistics.load(self.term_stats)
+            else:
+                corpus_stats = TermStatistics()
+            worker_stats = TermStatistics(
+                corpus_stats.width, corpus_stats.depth, corpus_stats.heavy_hitters, corpus_stats.seed
+            )
+        tfidf_params = dict(
+            self.params, idf='document' if corpus_stats is None else 'stream', term_stats=corpus_stats
+        )
+
+        def fail(doc_id, error):
+            queue.fail(self.worker_id, doc_id, f"{type(error).__name__}: {error}")
+
+        try:
+            while True:
+                batch = queue.claim(self.worker_id, self.shard, self.batch_size)
+                if not batch:
+                    break
+
+                # Drop boilerplate before any method scores the sentences
+                filter_reports = {}
+                if boilerplate_filter is not None:
+                    filtered_batch = []
+                    for doc_id, text, reference in batch:
+                        try:
+                            text, filter_reports[doc_id] = boilerplate_filter.filter(text)
+                        except Exception as e:
+                            fail(doc_id, e)
+                            continue
+                        filtered_batch.append((doc_id, text, reference))
+                    batch = filtered_batch
+
+                # Count the new documents before they are scored, so TF-IDF sees
+                # them; the worker's delta only gets documents it completes
+                terms = {}
+                if corpus_stats is not None:
+                    for doc_id, text, _ in batch:
+                        terms[doc_id] = document_terms(text)
+                        if doc_id not in counted:
+                            corpus_stats.update_terms(terms[doc_id])
+                            counted.add(doc_id)
+                
+                # TF-IDF runs over the whole claimed batch in one vectorized pass
+                corpus_tfidf = {}
+                if 'tfidf' in self.methods and batch:
+                    start = time.perf_counter()
+                    try:
+                        summaries = registry.summarize_corpus(
+                            'tfidf', [text for _, text, _ in batch], **tfidf_params
+                        )
+                    except Exception:
+                        # Find the failing document by running them one at a time
+                        summaries = None
+                    if summaries is not None:
+                        seconds = (time.perf_counter() - start) / len(batch)
+                        corpus_tfidf = {
+                            doc_id: (summary, seconds) for (doc_id, _, _), summary in zip(batch, summaries)
+                        }
+
+                for i, (doc_id, text, reference) in enumerate(batch):
+                    # Long batches can outlive the claim; keep the rest of the batch
+                    # leased, and drop this document if another worker took it over
+                    if doc_id not in queue.renew(self.worker_id, [row[0] for row in batch[i:]]):
+                        continue
+
+                    try:
+                        results = [
+                            self._summarize(
+                                registry, evaluator, name, text, reference, corpus_tfidf.get(doc_id), tfidf_params
+                            )
+                            for name in self.methods
+                        ]
+                    except Exception as e:
+                        fail(doc_id, e)
+                        continue
+
+                    if queue.complete(self.worker_id, doc_id, results, filter_reports.get(doc_id)):
+                        completed += 1
+                        if worker_stats is not None:
+                            worker_stats.update_terms(terms[doc_id])
+
+                queue.checkpoint(self.worker_id, self.shard, completed)
+        finally:
+            queue.close()
+            if worker_stats is not None and worker_stats.num_documents:
+                # One file per run: a pool process may run several shards in turn
+                run_id = f"{self.shard if self.shard is not None else 'any'}-{uuid.uuid4().hex}"
+                worker_stats.save(worker_stats_path(self.term_stats, self.worker_id, run_id))
+
+        return completed
+
+
+def _stats_base(term_stats):
+    return term_stats[:-len('.npz')] if term_stats.endswith('.npz') else term_stats
+
+
+def worker_stats_path(term_stats, worker_id, run_id):
+    """
+    Path of the term statistics a worker run counted, next to the corpus sketch.
+
+    Args:
+        term_stats (str): Path of the corpus sketch
+        worker_id (str): Worker identifier
+        run_id (str): Identifier of the run, unique across runs of the same worker
+
+    Returns:
+        str: Path of the run's sketch
+    """
+    name = re.sub(r'[^A-Za-z0-9_-]+', '-', f"{worker_id}-{run_id}")
+    return f"{_stats_base(term_stats)}.{name}.npz"
+
+
+def merge_term_stats(term_stats):
+    """
+    Fold the sketches saved by workers into the corpus sketch and delete them.
+
+    Args:
+        term_stats (str): Path of the corpus sketch
+
+    Returns:
+        int: Number of documents added
+    """
+    from modules.term_stats import TermStatistics
+
+    paths = sorted(glob.glob(f"{glob.escape(_stats_base(term_stats))}.*.npz"))
+    if not paths:
+        return 0
+
+    corpus_stats = TermStatistics.load(term_stats) if os.path.exists(term_stats) else None
+    added = 0
+    for path in paths:
+        stats = TermStatistics.load(path)
+        added += stats.num_documents
+        corpus_stats = stats if corpus_stats is None else corpus_stats.merge(stats)
+
+    corpus_stats.save(term_stats)
+    for path in paths:
+        os.remove(path)
+    return added
+
+
+def _run_worker(queue_path, methods, shard, params):
+    return BatchWorker(queue_path, methods, shard=shard, **params).run()
+
+
+def run_sharded(queue_path, methods, num_workers, **params):
+    """
+    Drain the queue with one local worker process per shard.
+
+    Each worker's torch and BLAS threads are capped to its share of the cores.
+
+    Args:
+        queue_path (str): Path to the queue database
+        methods (list): Registry method names
+        num_workers (int): Number of worker processes
+        **params: Method parameters
+
+    Returns:
+        int: Total number of documents completed
+    """
+    context = multiprocessing.get_context('spawn')
+    with get_thread_budget().pool('batch', num_workers) as threads, \
+            context.Pool(num_workers, initializer=limit_threads, initargs=(threads,)) as pool:
+        counts = pool.starmap(
+            _run_worker,
+            [(queue_path, methods, shard, params) for shard in range(num_workers)]
+        )
+    return sum(counts)
+
+
+def build_report(queue_path):
+    """
+    Merge the per-shard results into one metrics report.
+
+    Args:
+        queue_path (str): Path to the queue database
+
+    Returns:
+        pd.DataFrame: Per-method mean ROUGE scores, document counts and mean runtime,
+            in the same layout as SummaryEvaluator.evaluate_summaries
+    """
+    queue = WorkQueue(queue_path)
+    try:
+        results = queue.scores_frame()
+    finally:
+        queue.close()
+
+    metrics = ['ROUGE-1', 'ROUGE-2', 'ROUGE-L']
+    report = results.groupby('method').agg(
+        **{metric: (metric, 'mean') for metric in metrics},
+        Documents=('doc_id', 'nunique'),
+        Seconds=('seconds', 'mean')
+    ).reset_index().rename(columns={'method': 'Method'})
+    report.insert(4, 'Average', report[metrics].mean(axis=1))
+
+    return report
+
+
+def build_boilerplate_report(queue_path, cost_model=None):
+    """
+    Summarize the boilerplate removed across the corpus and the time it saved.
+
+    Args:
+        queue_path (str): Path to the queue database
+        cost_model (CostModel, optional): Runtime model used to estimate the saving
+
+    Returns:
+        dict: Documents, sentences, removed sentences and estimated seconds saved
+    """
+    from modules.scheduler import CostModel
+
+    cost_model = cost_model or CostModel()
+    queue = WorkQueue(queue_path)
+    try:
+        frame = queue.boilerplate_frame()
+    finally:
+        queue.close()
+
+    if frame.empty:
+        return {'documents': 0, 'sentences': 0, 'removed': 0, 'seconds_saved': 0.0}
+
+    saved = sum(
+        cost_model.estimate(row.method, row.words_before) - cost_model.estimate(row.method, row.words_after)
+        for row in frame.itertuples()
+    )
+    documents = frame.drop_duplicates('doc_id')
+    return {
+        'documents': len(documents),
+        'sentences': int(documents['sentences'].sum()),
+        'removed': int(documents['removed'].sum()),
+        'seconds_saved': float(saved - documents['seconds'].sum()),
+    }
+
+
+def _read_corpus(path):
+    """
+    Read a JSON Lines corpus with doc_id, text and optional reference fields.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                yield str(record['doc_id']), record['text'], record.get('reference')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sharded batch summarization")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    enqueue = subparsers.add_parser('enqueue', help="Load a JSON Lines corpus into the queue")
+    enqueue.add_argument('--queue', required=True)
+    enqueue.add_argument('--input', required=True)
+    enqueue.add_argument('--shards', type=int, default=1)
+
+    for name in ('work', 'run'):
+        command = subparsers.add_parser(name, help="Run one worker" if name == 'work' else "Run local workers")
+        command.add_argument('--queue', required=True)
+        command.add_argument('--methods', nargs='+', default=['tfidf'])
+        command.add_argument('--num-sentences', type=int, default=5)
+        command.add_argument('--max-length', type=int, default=150)
+        command.add_argument('--splitter', choices=['punkt', 'finance'], default='punkt')
+        command.add_argument('--strip-boilerplate', action='store_true')
+        command.add_argument('--boilerplate-hashes', help="Learned hashes from modules.boilerplate learn")
+        command.add_argument('--term-stats', help="Corpus document frequencies (.npz) for TF-IDF, updated as it runs")
+        command.add_argument('--lease-seconds', type=float, default=600)
+        command.add_argument('--max-attempts', type=int, default=3)
+        if name == 'work':
+            command.add_argument('--shard', type=int)
+        else:
+            command.add_argument('--workers', type=int, default=os.cpu_count())
+
+    report = subparsers.add_parser('report', help="Merge results into one metrics report")
+    report.add_argument('--queue', required=True)
+    report.add_argument('--output')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'enqueue':
+        queue = WorkQueue(args.queue)
+        added = queue.enqueue(_read_corpus(args.input), args.shards)
+        queue.close()
+        print(f"Enqueued {added} documents")
+    elif args.command in ('work', 'run'):
+        params = {
+            'num_sentences': args.num_sentences,
+            'max_length': args.max_length,
+            'splitter': args.splitter,
+            'boilerplate': args.boilerplate_hashes or args.strip_boilerplate,
+            'term_stats': args.term_stats,
+            'lease_seconds': args.lease_seconds,
+            'max_attempts': args.max_attempts,
+        }
+        if args.command == 'work':
+            completed = BatchWorker(args.queue, args.methods, shard=args.shard, **params).run()
+        else:
+            completed = run_sharded(args.queue, args.methods, args.workers, **params)
+        print(f"Completed {completed} documents")
+
+        queue = WorkQueue(args.queue)
+        for doc_id, attempts, error in queue.failures():
+            print(f"Failed {doc_id} after {attempts} attempts: {error}")
+        queue.close()
+        
+        # Local workers are done, so their term counts can be folded in now; remote
+        # workers' files are merged with `python -m modules.term_stats merge`
+        if args.command == 'run' and args.term_stats:
+            print(f"Added {merge_term_stats(args.term_stats)} documents to {args.term_stats}")
+    else:
+        report_df = build_report(args.queue)
+        if args.output:
+            report_df.to_csv(args.output, index=False)
+        print(report_df.to_string(index=False))
+
+        boilerplate = build_boilerplate_report(args.queue)
+        if boilerplate['documents']:
+            print(f"Boilerplate: removed {boilerplate['removed']} of {boilerplate['sentences']} sentences "
+                  f"in {boilerplate['documents']} documents, ~{boilerplate['seconds_saved']:.1f}s saved")
+
+
+if __name__ == '__main__':
+    main()
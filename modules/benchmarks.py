@@ -0,0 +1,574 @@
+"""
+Benchmarks and quality reports for the Financial Text Summarizer.
+
+Usage:
+    python -m modules.benchmarks hybrid --input references.jsonl --model bart --token-budget 512
+    python -m modules.benchmarks profiles --model t5
+    python -m modules.benchmarks assisted --draft-model ./distilbart-cnn-6-6
+    python -m modules.benchmarks splitters --repeat 200
+    python -m modules.benchmarks corpus --input references.jsonl --methods tfidf lsa --checkpoint eval.jsonl
+    python -m modules.benchmarks threads --workers 4 --model bart
+    python -m modules.benchmarks styles --url http://localhost:8501
+
+Reference sets are JSON Lines files with `text` and `reference` fields (and an
+optional `doc_id`). Without --input the bundled samples are used, with each
+article's title standing in as its reference.
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+import pandas as pd
+
+SAMPLES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets', 'samples.json')
+
+ROUGE_METRICS = ['ROUGE-1', 'ROUGE-2', 'ROUGE-L']
+
+
+def load_reference_set(path=None):
+    """
+    Load (doc_id, text, reference) triples for benchmarking.
+
+    Args:
+        path (str, optional): JSON Lines reference set; defaults to the bundled samples
+
+    Returns:
+        list: (doc_id, text, reference) tuples
+    """
+    if path is None:
+        with open(SAMPLES_PATH, 'r', encoding='utf-8') as f:
+            samples = json.load(f)
+        return [(name, sample['text'], sample['title']) for name, sample in samples.items()]
+
+    reference_set = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for i, line in enumerate(f):
+            if line.strip():
+                record = json.loads(line)
+                reference_set.append((str(record.get('doc_id', i)), record['text'], record['reference']))
+    return reference_set
+
+
+def _timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def _with_mean_row(df, label_column):
+    """
+    Append a row with the column means, labelled 'MEAN'.
+    """
+    means = df.mean(numeric_only=True).to_frame().T
+    means[label_column] = 'MEAN'
+    return pd.concat([df, means], ignore_index=True)
+
+
+def compare_hybrid(reference_set, model='bart', token_budget=512, max_length=150, min_length=50,
+                   summarizer=None, evaluator=None):
+    """
+    Compare extract-then-abstract summaries with full-input summaries.
+
+    Both runs start with empty encoder and ranking caches, so neither reuses
+    the other's work. Documents that already fit in the token budget are left
+    unchanged by condensing; they are marked in the 'Condensed' column and
+    averaged in a separate 'MEAN UNCHANGED' row, so the 'MEAN' row covers only
+    documents the hybrid method actually shortened.
+
+    Args:
+        reference_set (list): (doc_id, text, reference) tuples
+        model (str): 'bart' or 't5'
+        token_budget (int): Input budget of the hybrid method in tokens
+        max_length (int): Maximum length of the summaries in tokens
+        min_length (int): Minimum length of the summaries in tokens
+        summarizer (AbstractiveSummarizer, optional): Summarizer to benchmark
+        evaluator (SummaryEvaluator, optional): ROUGE scorer
+
+    Returns:
+        pd.DataFrame: Per-document latency saving and ROUGE deltas, plus the mean rows
+    """
+    from modules.abstractive import AbstractiveSummarizer
+    from modules.evaluation import SummaryEvaluator
+    from modules.extractive import ExtractiveSummarizer
+
+    summarizer = summarizer or AbstractiveSummarizer()
+    evaluator = evaluator or SummaryEvaluator()
+    full = getattr(summarizer, model)
+
+    def clear_caches():
+        ExtractiveSummarizer.clear_ranking_cache()
+        if hasattr(summarizer, 'clear_encoder_cache'):
+            summarizer.clear_encoder_cache()
+
+    # Load the model before timing anything
+    if reference_set:
+        full(reference_set[0][1][:200], max_length, min(min_length, 10))
+
+    rows = []
+    for doc_id, text, reference in reference_set:
+        words = len(text.split())
+        condensed_words = len(AbstractiveSummarizer.condense(text, token_budget).split())
+
+        clear_caches()
+        full_summary, full_seconds = _timed(full, text, max_length, min_length)
+        clear_caches()
+        hybrid_summary, hybrid_seconds = _timed(
+            summarizer.hybrid, text, max_length, min_length, model=model, token_budget=token_budget
+        )
+        full_scores = evaluator.calculate_rouge(reference, full_summary)
+        hybrid_scores = evaluator.calculate_rouge(reference, hybrid_summary)
+
+        row = {
+            'Document': doc_id,
+            'Words': words,
+            'Condensed Words': condensed_words,
+            'Condensed': condensed_words < words,
+            'Full Seconds': full_seconds,
+            'Hybrid Seconds': hybrid_seconds,
+            'Latency Saving': 1 - hybrid_seconds / full_seconds if full_seconds else 0.0,
+        }
+        for metric in ROUGE_METRICS:
+            row[f'{metric} Delta'] = hybrid_scores[metric] - full_scores[metric]
+        rows.append(row)
+
+    df = pd.DataFrame(rows)
+    if df.empty:
+        return df
+
+    report = [df]
+    for label, group in (('MEAN', df[df['Condensed']]), ('MEAN UNCHANGED', df[~df['Condensed']])):
+        if not group.empty:
+            means = group.drop(columns='Condensed').mean(numeric_only=True).to_frame().T
+            means['Document'] = label
+            means['Condensed'] = label == 'MEAN'
+            report.append(means)
+    return pd.concat(report, ignore_index=True)
+
+
+def compare_profiles(reference_set, model='bart', profiles=None, max_length=150, min_length=50,
+                     summarizer=None, evaluator=None):
+    """
+    Measure latency and ROUGE of each decoding profile.
+
+    Args:
+        reference_set (list): (doc_id, text, reference) tuples
+        model (str): 'bart', 't5' or 't5_chunked'
+        profiles (list, optional): Profile names; defaults to the model default
+            followed by every entry of GENERATION_PROFILES
+        max_length (int): Maximum length of the summaries in tokens
+        min_length (int): Minimum length of the summaries in tokens
+        summarizer (AbstractiveSummarizer, optional): Summarizer to benchmark
+        evaluator (SummaryEvaluator, optional): ROUGE scorer
+
+    Returns:
+        pd.DataFrame: Mean latency, summary length and ROUGE per profile
+    """
+    from modules.abstractive import AbstractiveSummarizer, GENERATION_PROFILES
+    from modules.evaluation import SummaryEvaluator
+
+    summarizer = summarizer or AbstractiveSummarizer()
+    evaluator = evaluator or SummaryEvaluator()
+    profiles = profiles or [None] + list(GENERATION_PROFILES)
+    generate = getattr(summarizer, model)
+
+    # Load the model and encode every document before timing anything, so
+    # every profile pays only for decoding
+    for _, text, _ in reference_set:
+        generate(text, max_length, min_length, 'fast')
+
+    rows = []
+    for profile in profiles:
+        for doc_id, text, reference in reference_set:
+            summary, seconds = _timed(generate, text, max_length, min_length, profile)
+            scores = evaluator.calculate_rouge(reference, summary)
+            row = {
+                'Profile': profile or 'default',
+                'Document': doc_id,
+                'Seconds': seconds,
+                'Summary Words': len(summary.split()),
+            }
+            row.update({metric: scores[metric] for metric in ROUGE_METRICS})
+            rows.append(row)
+
+    df = pd.DataFrame(rows)
+    report = df.groupby('Profile', sort=False).mean(numeric_only=True).reset_index()
+    report.insert(1, 'Documents', df.groupby('Profile', sort=False).size().values)
+    return report
+
+
+def compare_assisted(reference_set, draft_model_path, max_length=150, min_length=50, summarizer=None):
+    """
+    Measure wall-clock speedup and draft acceptance of assisted BART decoding
+    against plain greedy decoding.
+
+    Args:
+        reference_set (list): (doc_id, text, reference) tuples
+        draft_model_path (str): Local directory of the draft model
+        max_length (int): Maximum length of the summaries in tokens
+        min_length (int): Minimum length of the summaries in tokens
+        summarizer (AbstractiveSummarizer, optional): Summarizer to benchmark
+
+    Returns:
+        pd.DataFrame: Per-document latency, speedup and acceptance rate, plus a MEAN row
+    """
+    from modules.abstractive import AbstractiveSummarizer
+
+    summarizer = summarizer or AbstractiveSummarizer(draft_model_path=draft_model_path)
+
+    # Load both models and encode every document before timing anything, so
+    # both runs pay only for decoding
+    for _, text, _ in reference_set:
+        summarizer.bart(text, max_length, min_length, 'assisted')
+
+    rows = []
+    for doc_id, text, _ in reference_set:
+        greedy_summary, greedy_seconds = _timed(summarizer.bart, text, max_length, min_length, 'fast')
+        assisted_summary, assisted_seconds = _timed(summarizer.bart, text, max_length, min_length, 'assisted')
+        stats = summarizer.last_assisted_stats or {}
+        rows.append({
+            'Document': doc_id,
+            'Greedy Seconds': greedy_seconds,
+            'Assisted Seconds': assisted_seconds,
+            'Speedup': greedy_seconds / assisted_seconds if assisted_seconds else 0.0,
+            'Acceptance Rate': stats.get('acceptance_rate', 0.0),
+            'Same Output': float(greedy_summary == assisted_summary),
+        })
+
+    return _with_mean_row(pd.DataFrame(rows), 'Document')
+
+
+# Hand-labelled financial sentences that trip up general-purpose splitters
+SPLITTER_CASES = [
+    ("Apple Inc. reported EPS of $1.28. Shares rose 3% after hours.", 2),
+    ("Revenue grew 12% in Q2. The company raised its full-year guidance.", 2),
+    ("Major U.S. indices fell sharply. The S&P 500 dropped 2.3%.", 2),
+    ("Demand is weakest in the U.S. The outlook for Europe is better.", 2),
+    ("Quantum Computing Inc. beat estimates of $1.15 per share.", 1),
+    ("Mr. J. Smith, CFO of Acme Corp., said margins improved.", 1),
+    ("The deal closes in Jan. 2025 pending approval by the F.T.C. and other agencies.", 1),
+    ("Gold rose 1.5% to $2,150 per ounce. The 10-year yield fell to 3.42%.", 2),
+    ("Analysts at Morgan Stanley Co. maintained their rating. They see 15% upside.", 2),
+    ("\"We are prepared to act,\" Powell said. Markets rallied.", 2),
+]
+
+
+def _boundaries(spans):
+    return {end for _, end in spans[:-1]}
+
+
+def compare_splitters(reference_set, repeat=50, splitters=('punkt', 'finance')):
+    """
+    Compare sentence splitters on accuracy and throughput.
+
+    Accuracy is measured on SPLITTER_CASES, which carry the correct sentence
+    count. On the reference set, boundary agreement with punkt is reported
+    as precision and recall of each splitter's sentence ends against punkt's.
+    Throughput is measured on the reference set concatenated `repeat` times.
+
+    Args:
+        reference_set (list): (doc_id, text, reference) tuples
+        repeat (int): Copies of the corpus in the throughput run
+        splitters (tuple): Splitter names
+
+    Returns:
+        pd.DataFrame: One row per splitter
+    """
+    from utils.sentence_splitter import get_splitter
+
+    texts = [text for _, text, _ in reference_set]
+    corpus = "\n\n".join(texts * repeat)
+    punkt = get_splitter('punkt')
+    punkt_boundaries = [_boundaries(punkt.spans(text)) for text in texts]
+
+    rows = []
+    for name in splitters:
+        splitter = get_splitter(name)
+        correct = sum(len(splitter.spans(text)) == expected for text, expected in SPLITTER_CASES)
+
+        agreed = found = expected = 0
+        for text, reference_boundaries in zip(texts, punkt_boundaries):
+            boundaries = _boundaries(splitter.spans(text))
+            agreed += len(boundaries & reference_boundaries)
+            found += len(boundaries)
+            expected += len(reference_boundaries)
+
+        spans, seconds = _timed(splitter.spans, corpus)
+        rows.append({
+            'Splitter': name,
+            'Case Accuracy': correct / len(SPLITTER_CASES),
+            'Punkt Precision': agreed / found if found else 1.0,
+            'Punkt Recall': agreed / expected if expected else 1.0,
+            'Sentences': len(spans),
+            'MB/s': len(corpus) / seconds / 1e6 if seconds else 0.0,
+        })
+
+    return pd.DataFrame(rows)
+
+
+def _rank_lsa(texts):
+    """
+    Pool task of compare_threads: LSA rankings, timed inside the worker.
+    """
+    from modules.extractive import ExtractiveSummarizer
+
+    start = time.perf_counter()
+    for text in texts:
+        ExtractiveSummarizer.rank(text, 'lsa', use_cache=False)
+    return time.perf_counter() - start
+
+
+def _mixed_load(texts, workers, rounds, inference, threads=None):
+    """
+    Run LSA in a process pool while this process runs inference, and time both.
+    """
+    import multiprocessing
+
+    from utils.threads import limit_threads
+
+    initializer, initargs = (limit_threads, (threads,)) if threads else (None, ())
+    with multiprocessing.get_context('spawn').Pool(workers, initializer=initializer, initargs=initargs) as pool:
+        # Start every worker and load its libraries before timing
+        pool.map(_rank_lsa, [texts[:1]] * workers, chunksize=1)
+
+        start = time.perf_counter()
+        pending = pool.map_async(_rank_lsa, [texts] * workers, chunksize=1)
+        for _ in range(rounds):
+            inference()
+        main_seconds = time.perf_counter() - start
+        worker_seconds = pending.get()
+        wall_seconds = time.perf_counter() - start
+
+    return main_seconds, max(worker_seconds), wall_seconds
+
+
+def compare_threads(reference_set, workers=2, rounds=20, scale=20, model=None, max_length=150):
+    """
+    Throughput under mixed load with library default thread counts and with a ThreadBudget.
+
+    A pool of worker processes ranks long documents with LSA (LAPACK) while this
+    process runs inference: the abstractive model if one is given, otherwise
+    matrix products of the size of a transformer layer. The default run goes
+    first, since a budget stays applied to this process.
+
+    Args:
+        reference_set (list): (doc_id, text, reference) tuples
+        workers (int): Worker processes in the pool
+        rounds (int): Inference calls in this process
+        scale (int): Copies of each document, to make long documents
+        model (str, optional): 'bart' or 't5' to run real inference
+        max_length (int): Maximum summary length for model inference
+
+    Returns:
+        pd.DataFrame: Thread counts, throughput and wall time of each run
+    """
+    import numpy as np
+
+    from utils.threads import available_cores, get_thread_budget
+
+    texts = [" ".join([text] * scale) for _, text, _ in reference_set]
+
+    if model:
+        from modules.abstractive import AbstractiveSummarizer
+
+        summarizer = AbstractiveSummarizer()
+        sample = reference_set[0][1]
+
+        def inference():
+            summarizer.summarize(sample, method=model, max_length=max_length, min_length=min(50, max_length - 1))
+        # Load the model and encode the sample before timing
+        inference()
+    else:
+        weights = np.random.default_rng(0).standard_normal((1024, 1024), dtype=np.float32)
+        activations = np.ones((512, 1024), dtype=np.float32)
+
+        def inference():
+            for _ in range(12):
+                activations @ weights
+
+    def row(name, main_threads, worker_threads, seconds):
+        main_seconds, worker_seconds, wall_seconds = seconds
+        return {
+            'Threads': name,
+            'Main Threads': main_threads,
+            'Worker Threads': worker_threads,
+            'Inference/s': rounds / main_seconds,
+            'Documents/s': workers * len(texts) / worker_seconds,
+            'Wall Seconds': wall_seconds,
+        }
+
+    cores = available_cores()
+    rows = [row('default', cores, cores, _mixed_load(texts, workers, rounds, inference))]
+
+    budget = get_thread_budget()
+    with budget.pool('benchmark', workers) as threads:
+        seconds = _mixed_load(texts, workers, rounds, inference, threads=threads)
+        rows.append(row('budgeted', budget.allocation()['main'], threads, seconds))
+
+    report = pd.DataFrame(rows)
+    report['Speedup'] = report['Wall Seconds'].iloc[0] / report['Wall Seconds']
+    return report
+
+
+_STYLE_REFERENCE = re.compile(r"""(?:@import\s+(?:url\()?|url\()\s*['"]?([^'")\s;]+)""")
+
+
+def _fetch(url, timeout):
+    """
+    GET a URL and time it.
+
+    Returns:
+        tuple: (status, body bytes, seconds); status is the error for failed requests
+    """
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return response.status, response.read(), time.perf_counter() - start
+    except urllib.error.HTTPError as e:
+        return e.code, b'', time.perf_counter() - start
+    except (urllib.error.URLError, OSError) as e:
+        return type(getattr(e, 'reason', e)).__name__, b'', time.perf_counter() - start
+
+
+def measure_styles(url=None, css_path=None, timeout=10):
+    """
+    Time what a browser must fetch before the retro styles render.
+
+    Starts from the stylesheet served by a running app (or a CSS file) and
+    fetches every @import and url() it references, following imported
+    stylesheets, one after another. A browser blocks rendering on imported
+    stylesheets and swaps fonts in as they arrive, so the sum is an upper
+    bound on the time until the page is styled, without a browser.
+
+    Args:
+        url (str, optional): Base URL of a running app, e.g. http://localhost:8501
+        css_path (str, optional): CSS file to start from instead, e.g. an older inline stylesheet
+        timeout (float): Seconds to wait for each request
+
+    Returns:
+        pd.DataFrame: Status, bytes and seconds per resource, plus a TOTAL row
+    """
+    from modules.styles import STYLESHEET
+
+    rows = []
+    if css_path:
+        with open(css_path, 'r', encoding='utf-8') as f:
+            stylesheets = [(None, f.read())]
+    else:
+        stylesheet_url = urllib.parse.urljoin(url.rstrip('/') + '/', f'app/static/{STYLESHEET}')
+        status, body, seconds = _fetch(stylesheet_url, timeout)
+        rows.append({'Resource': stylesheet_url, 'Status': status, 'Bytes': len(body), 'Seconds': seconds})
+        stylesheets = [(stylesheet_url, body.decode('utf-8', 'replace'))]
+
+    seen = set()
+    while stylesheets:
+        base, css = stylesheets.pop(0)
+        for reference in _STYLE_REFERENCE.findall(css):
+            if reference.startswith('data:'):
+                continue
+            resource = urllib.parse.urljoin(base, reference) if base else reference
+            if resource in seen or not urllib.parse.urlparse(resource).scheme:
+                continue
+            seen.add(resource)
+
+            status, body, seconds = _fetch(resource, timeout)
+            rows.append({'Resource': resource, 'Status': status, 'Bytes': len(body), 'Seconds': seconds})
+            if status == 200 and (reference.endswith('.css') or 'css' in urllib.parse.urlparse(resource).path):
+                stylesheets.append((resource, body.decode('utf-8', 'replace')))
+
+    report = pd.DataFrame(rows, columns=['Resource', 'Status', 'Bytes', 'Seconds'])
+    local = urllib.parse.urlparse(url).netloc if url else None
+    report.insert(1, 'External', [urllib.parse.urlparse(r).netloc != local for r in report['Resource']])
+    total = {'Resource': 'TOTAL', 'External': report['External'].any(), 'Status': '',
+             'Bytes': report['Bytes'].sum(), 'Seconds': report['Seconds'].sum()}
+    return pd.concat([report, pd.DataFrame([total])], ignore_index=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Financial Text Summarizer benchmarks")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    hybrid = subparsers.add_parser('hybrid', help="Hybrid vs full-input abstractive summaries")
+    hybrid.add_argument('--input')
+    hybrid.add_argument('--model', choices=['bart', 't5'], default='bart')
+    hybrid.add_argument('--token-budget', type=int, default=512)
+    hybrid.add_argument('--max-length', type=int, default=150)
+
+    profiles = subparsers.add_parser('profiles', help="Latency and ROUGE per decoding profile")
+    profiles.add_argument('--input')
+    profiles.add_argument('--model', choices=['bart', 't5', 't5_chunked'], default='bart')
+    profiles.add_argument('--max-length', type=int, default=150)
+
+    assisted = subparsers.add_parser('assisted', help="Assisted vs plain greedy BART decoding")
+    assisted.add_argument('--input')
+    assisted.add_argument('--draft-model', required=True)
+    assisted.add_argument('--max-length', type=int, default=150)
+
+    splitters = subparsers.add_parser('splitters', help="Sentence splitter accuracy and throughput")
+    splitters.add_argument('--input')
+    splitters.add_argument('--repeat', type=int, default=50)
+
+    corpus = subparsers.add_parser('corpus', help="Corpus ROUGE with bootstrap intervals and paired tests")
+    corpus.add_argument('--input')
+    corpus.add_argument('--methods', nargs='+', default=['text_rank', 'lex_rank', 'lsa', 'tfidf'])
+    corpus.add_argument('--metric', choices=ROUGE_METRICS, default='ROUGE-L')
+    corpus.add_argument('--num-sentences', type=int, default=5)
+    corpus.add_argument('--max-length', type=int, default=150)
+    corpus.add_argument('--workers', type=int)
+    corpus.add_argument('--checkpoint')
+
+    threads = subparsers.add_parser('threads', help="Mixed inference and pool load with and without thread budgets")
+    threads.add_argument('--input')
+    threads.add_argument('--workers', type=int, default=2)
+    threads.add_argument('--rounds', type=int, default=20)
+    threads.add_argument('--scale', type=int, default=20)
+    threads.add_argument('--model', choices=['bart', 't5'])
+    threads.add_argument('--max-length', type=int, default=150)
+
+    styles = subparsers.add_parser('styles', help="Requests and time needed before the styles render")
+    styles.add_argument('--url', default='http://localhost:8501')
+    styles.add_argument('--css', help="Measure a CSS file instead of the running app's stylesheet")
+    styles.add_argument('--timeout', type=float, default=10)
+
+    args = parser.parse_args(argv)
+    if args.command == 'styles':
+        print(measure_styles(None if args.css else args.url, args.css, args.timeout).to_string(index=False))
+        return
+    reference_set = load_reference_set(args.input)
+
+    if args.command == 'hybrid':
+        report = compare_hybrid(
+            reference_set, model=args.model, token_budget=args.token_budget, max_length=args.max_length
+        )
+    elif args.command == 'profiles':
+        report = compare_profiles(reference_set, model=args.model, max_length=args.max_length)
+    elif args.command == 'assisted':
+        report = compare_assisted(reference_set, args.draft_model, max_length=args.max_length)
+    elif args.command == 'splitters':
+        report = compare_splitters(reference_set, repeat=args.repeat)
+    elif args.command == 'corpus':
+        from modules.evaluation import CorpusEvaluator
+
+        evaluator = CorpusEvaluator(
+            args.methods, workers=args.workers, checkpoint_path=args.checkpoint,
+            num_sentences=args.num_sentences, max_length=args.max_length
+        )
+        evaluator.evaluate(reference_set)
+        print(evaluator.paired_tests(args.metric).to_string(index=False))
+        report = evaluator.summary(args.metric)
+    elif args.command == 'threads':
+        report = compare_threads(
+            reference_set, workers=args.workers, rounds=args.rounds, scale=args.scale, model=args.model,
+            max_length=args.max_length
+        )
+
+    print(report.to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
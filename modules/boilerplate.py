@@ -0,0 +1,288 @@
+"""
+Boilerplate pruning for the Financial Text Summarizer.
+
+Safe-harbor statements, forward-looking-statement disclaimers and contact blocks
+are removed before any sentence is scored. Two matchers are used: a fixed set of
+patterns compiled into one regular expression, and a set of hashes of sentences
+learned from a corpus because they recur across many documents.
+
+Usage:
+    python -m modules.boilerplate learn --input corpus.jsonl --output boilerplate.json --min-documents 3
+    python -m modules.boilerplate learn --input corpus.jsonl --output boilerplate.json --splitter finance
+
+Learned hashes only match sentences split the same way, so learn with the
+splitter the app or batch run will use.
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import time
+import warnings
+from collections import Counter
+
+from utils.sentence_splitter import split_sentences
+
+# Phrases that only occur in legal disclaimers, wire-service footers and contact blocks
+BOILERPLATE_PATTERNS = [
+    r"forward[- ]looking (?:statements?|information)",
+    r"safe[- ]harbou?r",
+    r"private securities litigation reform act",
+    r"undue reliance",
+    r"(?:undertakes?|assumes?) no (?:obligation|duty|responsibility) to (?:publicly )?(?:update|revise)",
+    r"actual results (?:may|could|might) differ materially",
+    r"(?:does not|shall not) constitute an offer to (?:sell|buy)",
+    r"this (?:press|news) release (?:contains|includes|may contain)",
+    r"(?:media|investor|press) (?:contacts?|relations|inquiries)\s*:",
+    r"for (?:further|more|additional) information,? (?:please )?contact",
+    r"view (?:original|source) (?:content|version)",
+    r"all rights reserved",
+    r"[\w.+-]+@[\w-]+\.[a-z]{2,}",
+    r"\(?\b\d{3}\)?[ .-]\d{3}[ .-]\d{4}\b",
+]
+
+BOILERPLATE_REGEX = re.compile('|'.join(f'(?:{pattern})' for pattern in BOILERPLATE_PATTERNS), re.IGNORECASE)
+
+# Sentences are compared with numbers and punctuation folded away, so dated or
+# numbered copies of the same disclaimer share a hash
+NORMALIZE_DIGITS = re.compile(r'\d+')
+NORMALIZE_PUNCTUATION = re.compile(r'[^a-z0 ]+')
+NORMALIZE_SPACES = re.compile(r'\s+')
+
+
+def sentence_hash(sentence):
+    """
+    Hash a sentence for the learned boilerplate set.
+
+    Args:
+        sentence (str): The sentence to hash
+
+    Returns:
+        int: 64-bit hash of the normalized sentence
+    """
+    normalized = NORMALIZE_DIGITS.sub('0', sentence.lower())
+    normalized = NORMALIZE_SPACES.sub(' ', NORMALIZE_PUNCTUATION.sub(' ', normalized)).strip()
+    return int.from_bytes(hashlib.blake2b(normalized.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+class FilterReport:
+    """
+    What a BoilerplateFilter removed from one or more documents.
+    """
+
+    def __init__(self, sentences=0, pattern_removed=0, learned_removed=0, words_before=0, words_after=0,
+                 seconds=0.0):
+        self.sentences = sentences
+        self.pattern_removed = pattern_removed
+        self.learned_removed = learned_removed
+        self.words_before = words_before
+        self.words_after = words_after
+        self.seconds = seconds
+
+    @property
+    def removed(self):
+        return self.pattern_removed + self.learned_removed
+
+    def __add__(self, other):
+        return FilterReport(
+            self.sentences + other.sentences,
+            self.pattern_removed + other.pattern_removed,
+            self.learned_removed + other.learned_removed,
+            self.words_before + other.words_before,
+            self.words_after + other.words_after,
+            self.seconds + other.seconds
+        )
+
+    def time_saved(self, cost_model, methods):
+        """
+        Estimate the runtime saved by summarizing the filtered text.
+
+        Args:
+            cost_model (CostModel): Runtime model of the methods
+            methods (list): Registry names of the methods run on the text
+
+        Returns:
+            float: Estimated seconds saved, net of the filtering time
+        """
+        saved = sum(
+            cost_model.estimate(method, self.words_before) - cost_model.estimate(method, self.words_after)
+            for method in methods
+        )
+        return saved - self.seconds
+
+    def to_dict(self):
+        return {
+            'sentences': self.sentences,
+            'removed': self.removed,
+            'pattern_removed': self.pattern_removed,
+            'learned_removed': self.learned_removed,
+            'words_before': self.words_before,
+            'words_after': self.words_after,
+            'seconds': self.seconds,
+        }
+
+    def __repr__(self):
+        return f"FilterReport(removed={self.removed}/{self.sentences}, seconds={self.seconds:.4f})"
+
+
+class BoilerplateFilter:
+    """
+    Removes boilerplate sentences from a document before it is summarized.
+    """
+
+    def __init__(self, learned_hashes=None, use_patterns=True, splitter='punkt'):
+        """
+        Initialize the filter.
+
+        Args:
+            learned_hashes (iterable, optional): Hashes of known boilerplate sentences,
+                as produced by sentence_hash()
+            use_patterns (bool): Whether to apply BOILERPLATE_PATTERNS
+            splitter (str): Sentence splitter, 'punkt' or 'finance'
+        """
+        self.learned_hashes = set(learned_hashes or ())
+        self.use_patterns = use_patterns
+        self.splitter = splitter
+
+    def is_boilerplate(self, sentence):
+        """
+        Tell whether a sentence is boilerplate.
+
+        Args:
+            sentence (str): The sentence to check
+
+        Returns:
+            str or None: 'pattern' or 'learned' if the sentence is boilerplate, else None
+        """
+        if self.use_patterns and BOILERPLATE_REGEX.search(sentence):
+            return 'pattern'
+        if self.learned_hashes and sentence_hash(sentence) in self.learned_hashes:
+            return 'learned'
+        return None
+
+    def filter(self, text):
+        """
+        Remove boilerplate sentences from a document.
+
+        The text is returned unchanged when nothing is removed, and as the kept
+        sentences joined by spaces otherwise. A document made only of boilerplate
+        is returned unchanged so that there is still something to summarize.
+
+        Args:
+            text (str): The document
+
+        Returns:
+            tuple: (filtered text, FilterReport)
+        """
+        start = time.perf_counter()
+        sentences = split_sentences(text, self.splitter)
+        kept = []
+        counts = Counter()
+
+        for sentence in sentences:
+            kind = self.is_boilerplate(sentence)
+            if kind is None:
+                kept.append(sentence)
+            else:
+                counts[kind] += 1
+
+        words_before = len(text.split())
+        if counts and kept:
+            filtered = " ".join(kept)
+        else:
+            filtered = text
+            counts.clear()
+
+        report = FilterReport(
+            len(sentences), counts['pattern'], counts['learned'],
+            words_before, len(filtered.split()), time.perf_counter() - start
+        )
+        return filtered, report
+
+    def learn(self, texts, min_documents=3, min_words=5):
+        """
+        Add sentences that recur across documents to the learned set.
+
+        Args:
+            texts (iterable): Corpus documents
+            min_documents (int): Number of documents a sentence must appear in
+            min_words (int): Shorter sentences are never learned
+
+        Returns:
+            int: Number of hashes added
+        """
+        document_counts = Counter()
+        for text in texts:
+            document_counts.update({
+                sentence_hash(sentence) for sentence in split_sentences(text, self.splitter)
+                if len(sentence.split()) >= min_words
+            })
+
+        learned = {digest for digest, count in document_counts.items() if count >= min_documents}
+        added = len(learned - self.learned_hashes)
+        self.learned_hashes |= learned
+        return added
+
+    def save(self, path):
+        """
+        Save the learned hashes, and the splitter they were learned with, to a JSON file.
+
+        Args:
+            path (str): Output file path
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'splitter': self.splitter, 'hashes': sorted(self.learned_hashes)}, f)
+
+    @classmethod
+    def load(cls, path, use_patterns=True, splitter=None):
+        """
+        Load a filter saved with save().
+
+        Args:
+            path (str): Input file path
+            use_patterns (bool): Whether to apply BOILERPLATE_PATTERNS
+            splitter (str, optional): Sentence splitter, 'punkt' or 'finance'; defaults
+                to the one the hashes were learned with. A different splitter
+                cuts sentences differently, so most learned hashes will not match,
+                and a warning is issued
+
+        Returns:
+            BoilerplateFilter: The loaded filter
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        # Files saved before the splitter was recorded were always learned with punkt
+        learned_with = data.get('splitter', 'punkt')
+        if splitter is None:
+            splitter = learned_with
+        elif splitter != learned_with:
+            warnings.warn(f"Boilerplate hashes in {path} were learned with the '{learned_with}' splitter "
+                          f"but are used with '{splitter}'; relearn them with --splitter {splitter}")
+        return cls(data['hashes'], use_patterns, splitter)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Learn boilerplate sentences from a corpus")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    learn = subparsers.add_parser('learn', help="Learn recurring sentences from a JSON Lines corpus")
+    learn.add_argument('--input', required=True)
+    learn.add_argument('--output', required=True)
+    learn.add_argument('--min-documents', type=int, default=3)
+    learn.add_argument('--min-words', type=int, default=5)
+    learn.add_argument('--splitter', choices=['punkt', 'finance'], default='punkt')
+
+    args = parser.parse_args(argv)
+
+    boilerplate_filter = BoilerplateFilter(splitter=args.splitter)
+    with open(args.input, 'r', encoding='utf-8') as f:
+        texts = (json.loads(line)['text'] for line in f if line.strip())
+        added = boilerplate_filter.learn(texts, args.min_documents, args.min_words)
+    boilerplate_filter.save(args.output)
+    print(f"Learned {added} boilerplate sentences with the {args.splitter} splitter")
+
+
+if __name__ == '__main__':
+    main()
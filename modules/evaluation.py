@@ -2,22 +2,43 @@
 Evaluation metrics for summarization in the Financial Text Summarizer.
 """
 
+import itertools
+import json
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
 from rouge_score import rouge_scorer
+from scipy import stats
+import numpy as np
 import pandas as pd
 
+from utils.normalization import get_normalizer
+from utils.threads import get_thread_budget, limit_threads
+
 
 class SummaryEvaluator:
     """
     A class for evaluating summarization quality using various metrics.
     """
     
-    def __init__(self):
+    def __init__(self, normalizer=None):
         """
         Initialize the evaluator with the ROUGE scorer.
+        
+        Args:
+            normalizer (Normalizer, optional): Shared stemmer; defaults to the
+                process-wide instance
         """
+        self.normalizer = normalizer if normalizer is not None else get_normalizer()
+        # Same tokens as use_stemmer=True, with stems memoized across calls
         self.scorer = rouge_scorer.RougeScorer(
             ['rouge1', 'rouge2', 'rougeL'],
-            use_stemmer=True
+            use_stemmer=True,
+            tokenizer=self.normalizer.rouge_tokenizer()
         )
     
     def calculate_rouge(self, reference, summary):
@@ -90,4 +111,296 @@ class SummaryEvaluator:
         best_method = evaluation_df.loc[best_idx, 'Method']
         best_score = evaluation_df.loc[best_idx, 'Average']
         
-        return best_method, best_score
\ No newline at end of file
+        return best_method, best_score
+
+
+ROUGE_METRICS = ['ROUGE-1', 'ROUGE-2', 'ROUGE-L']
+
+# Evaluator of the current process, created on first use in each pool worker
+_worker_evaluator = None
+
+
+def _score_records(records):
+    """
+    Add ROUGE scores to (doc_id, method, reference, summary, seconds) records; runs in pool workers.
+    """
+    global _worker_evaluator
+    if _worker_evaluator is None:
+        _worker_evaluator = SummaryEvaluator()
+    
+    evaluator = _worker_evaluator
+    scored = []
+    for doc_id, method, reference, summary, seconds in records:
+        result = {'doc_id': doc_id, 'method': method, 'summary': summary, 'seconds': seconds}
+        result.update(evaluator.calculate_rouge(reference, summary))
+        scored.append(result)
+    return scored
+
+
+def bootstrap_means(values, n_resamples=2000, seed=0, max_elements=1 << 22):
+    """
+    Bootstrap the column means of a (documents x methods) score matrix.
+    
+    The same resampled documents are used for every column, so differences
+    between columns are paired. Resampled scores are gathered at most
+    max_elements at a time, so memory stays bounded however large the corpus.
+    
+    Args:
+        values (np.ndarray): Scores, one row per document and one column per method
+        n_resamples (int): Number of bootstrap resamples
+        seed (int): Random seed
+        max_elements (int): Resampled scores held in memory at a time
+        
+    Returns:
+        np.ndarray: (n_resamples x methods) resampled means; NaN without documents
+    """
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        values = values[:, None]
+    
+    n, columns = values.shape
+    if n == 0:
+        return np.full((n_resamples, columns), np.nan)
+    
+    rng = np.random.default_rng(seed)
+    means = np.empty((n_resamples, columns))
+    
+    # Whole resamples per block while they fit, otherwise one resample in document chunks
+    block_size = max(1, max_elements // (n * columns))
+    chunk_size = max(1, max_elements // columns)
+    
+    for start in range(0, n_resamples, block_size):
+        stop = min(start + block_size, n_resamples)
+        totals = np.zeros((stop - start, columns))
+        for offset in range(0, n, chunk_size):
+            indices = rng.integers(0, n, size=(stop - start, min(chunk_size, n - offset)))
+            totals += values[indices].sum(axis=1)
+        means[start:stop] = totals / n
+    
+    return means
+
+
+class CorpusEvaluator:
+    """
+    Evaluates summarization methods over a corpus of (document, reference) pairs.
+    """
+    
+    def __init__(self, methods, registry=None, workers=None, checkpoint_path=None, chunk_size=64, **params):
+        """
+        Initialize the corpus evaluator.
+        
+        Args:
+            methods (list): Registry method names or labels to evaluate
+            registry (SummarizerRegistry, optional): Registry used to generate
+                summaries through its result cache
+            workers (int, optional): ROUGE scoring processes; defaults to the CPU count,
+                and 1 scores in the calling process
+            checkpoint_path (str, optional): JSON Lines file of scored results; an
+                interrupted evaluation resumes from it
+            chunk_size (int): Documents generated and scored at a time
+            **params: Method parameters
+        """
+        if registry is None:
+            from modules.registry import SummarizerRegistry
+            registry = SummarizerRegistry()
+        
+        self.registry = registry
+        self.methods = [registry.get(method).name for method in methods]
+        self.workers = workers or os.cpu_count() or 1
+        self.checkpoint_path = checkpoint_path
+        self.chunk_size = chunk_size
+        self.params = params
+        self.scores = pd.DataFrame(columns=['doc_id', 'method', 'summary', 'seconds'] + ROUGE_METRICS)
+    
+    def _load_checkpoint(self):
+        """
+        Read scored results from the checkpoint, checking they used the same parameters.
+        """
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return []
+        
+        with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+            records = [json.loads(line) for line in f if line.strip()]
+        
+        if records and records[0].get('params') != self.params:
+            raise ValueError(
+                f"Checkpoint {self.checkpoint_path} was written with parameters {records[0].get('params')}, "
+                f"not {self.params}"
+            )
+        return records[1:]
+    
+    def _generate(self, chunk, done):
+        """
+        Generate the missing summaries of a chunk of documents.
+        """
+        records = []
+        for doc_id, text, reference in chunk:
+            for method in self.methods:
+                if (doc_id, method) in done:
+                    continue
+                start = time.perf_counter()
+                summary = self.registry.summarize(method, text, **self.params)
+                records.append((doc_id, method, reference, summary, time.perf_counter() - start))
+        return records
+    
+    def evaluate(self, reference_set):
+        """
+        Generate and score summaries for every document and method.
+        
+        Summaries are generated in this process, chunk by chunk, while earlier
+        chunks are scored in the process pool. Scored chunks are appended to the
+        checkpoint as they complete.
+        
+        Args:
+            reference_set (iterable): (doc_id, text, reference) tuples
+            
+        Returns:
+            pd.DataFrame: One row per (document, method) with summary, seconds and ROUGE scores
+        """
+        results = self._load_checkpoint()
+        done = {(record['doc_id'], record['method']) for record in results}
+        
+        checkpoint = None
+        if self.checkpoint_path:
+            is_new = not os.path.exists(self.checkpoint_path) or os.path.getsize(self.checkpoint_path) == 0
+            checkpoint = open(self.checkpoint_path, 'a', encoding='utf-8')
+            if is_new:
+                checkpoint.write(json.dumps({'params': self.params}) + '\n')
+        
+        def publish(scored):
+            results.extend(scored)
+            if checkpoint is not None:
+                checkpoint.writelines(json.dumps(record) + '\n' for record in scored)
+                checkpoint.flush()
+        
+        reference_set = iter(reference_set)
+        try:
+            if self.workers == 1:
+                for chunk in iter(lambda: list(islice(reference_set, self.chunk_size)), []):
+                    publish(_score_records(self._generate(chunk, done)))
+            else:
+                context = multiprocessing.get_context('spawn')
+                # Scoring workers and summary generation here share the cores
+                with get_thread_budget().pool('evaluation', self.workers) as threads, \
+                        ProcessPoolExecutor(self.workers, mp_context=context, initializer=limit_threads,
+                                            initargs=(threads,)) as pool:
+                    pending = deque()
+                    for chunk in iter(lambda: list(islice(reference_set, self.chunk_size)), []):
+                        pending.append(pool.submit(_score_records, self._generate(chunk, done)))
+                        # Keep generating while the pool scores, but bound the backlog
+                        while len(pending) > 2 * self.workers or (pending and pending[0].done()):
+                            publish(pending.popleft().result())
+                    while pending:
+                        publish(pending.popleft().result())
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+        
+        self.scores = pd.DataFrame(results, columns=self.scores.columns)
+        return self.scores
+    
+    def _matrix(self, metric):
+        """
+        Pivot scores into a (documents x methods) matrix over documents scored by every method.
+        """
+        matrix = self.scores.pivot_table(index='doc_id', columns='method', values=metric, aggfunc='first')
+        methods = [method for method in self.methods if method in matrix.columns]
+        return matrix[methods].dropna()
+    
+    def summary(self, metric='ROUGE-L', n_resamples=2000, confidence=0.95, seed=0):
+        """
+        Per-method mean scores with bootstrap confidence intervals.
+        
+        Args:
+            metric (str): 'ROUGE-1', 'ROUGE-2' or 'ROUGE-L'
+            n_resamples (int): Number of bootstrap resamples
+            confidence (float): Confidence level of the intervals
+            seed (int): Random seed
+            
+        Returns:
+            pd.DataFrame: Method, Documents, mean score, CI bounds and mean seconds,
+                best method first; empty before anything is scored
+        """
+        if self.scores.empty:
+            return pd.DataFrame(columns=['Method', 'Documents', metric, 'CI Low', 'CI High', 'Seconds'])
+        
+        matrix = self._matrix(metric)
+        means = bootstrap_means(matrix.values, n_resamples, seed)
+        alpha = (1 - confidence) / 2
+        seconds = self.scores.groupby('method')['seconds'].mean()
+        
+        report = pd.DataFrame({
+            'Method': [self.registry.get(method).label for method in matrix.columns],
+            'Documents': len(matrix),
+            metric: matrix.values.mean(axis=0),
+            'CI Low': np.quantile(means, alpha, axis=0),
+            'CI High': np.quantile(means, 1 - alpha, axis=0),
+            'Seconds': [seconds[method] for method in matrix.columns],
+        })
+        return report.sort_values(metric, ascending=False, ignore_index=True)
+    
+    def paired_tests(self, metric='ROUGE-L', n_resamples=2000, seed=0):
+        """
+        Paired significance tests between every pair of methods.
+        
+        Args:
+            metric (str): 'ROUGE-1', 'ROUGE-2' or 'ROUGE-L'
+            n_resamples (int): Number of bootstrap resamples
+            seed (int): Random seed
+            
+        Returns:
+            pd.DataFrame: Mean difference with its 95% bootstrap interval, the
+                two-sided paired bootstrap p-value and the paired t-test p-value;
+                empty before anything is scored
+        """
+        if self.scores.empty:
+            return pd.DataFrame(columns=['Method A', 'Method B', 'Mean Difference', 'CI Low', 'CI High',
+                                         'p (bootstrap)', 'p (t-test)'])
+        
+        matrix = self._matrix(metric)
+        values = matrix.values
+        means = bootstrap_means(values, n_resamples, seed)
+        rows = []
+        
+        for i, j in itertools.combinations(range(values.shape[1]), 2):
+            differences = means[:, i] - means[:, j]
+            p_bootstrap = min(1.0, 2 * min((differences <= 0).mean(), (differences >= 0).mean()))
+            rows.append({
+                'Method A': self.registry.get(matrix.columns[i]).label,
+                'Method B': self.registry.get(matrix.columns[j]).label,
+                'Mean Difference': (values[:, i] - values[:, j]).mean(),
+                'CI Low': np.quantile(differences, 0.025),
+                'CI High': np.quantile(differences, 0.975),
+                'p (bootstrap)': p_bootstrap,
+                'p (t-test)': stats.ttest_rel(values[:, i], values[:, j]).pvalue,
+            })
+        
+        return pd.DataFrame(rows)
+    
+    def find_best_method(self, metric='ROUGE-L', alpha=0.05, n_resamples=2000, seed=0):
+        """
+        Find the best method over the corpus and whether it beats the runner-up significantly.
+        
+        Args:
+            metric (str): 'ROUGE-1', 'ROUGE-2' or 'ROUGE-L'
+            alpha (float): Significance level
+            n_resamples (int): Number of bootstrap resamples
+            seed (int): Random seed
+            
+        Returns:
+            str: Label of the best method
+            float: Its mean score
+            bool: True if it is significantly better than the runner-up
+        """
+        report = self.summary(metric, n_resamples, seed=seed)
+        if report.empty:
+            raise ValueError("No scores to compare; run evaluate() first")
+        best = report.iloc[0]
+        if len(report) < 2:
+            return best['Method'], float(best[metric]), False
+        
+        tests = self.paired_tests(metric, n_resamples, seed)
+        pair = {best['Method'], report.iloc[1]['Method']}
+        test = tests[tests.apply(lambda row: {row['Method A'], row['Method B']} == pair, axis=1)].iloc[0]
+        
+        return best['Method'], float(best[metric]), bool(test['p (bootstrap)'] < alpha)
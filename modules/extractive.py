@@ -2,16 +2,24 @@
 Extractive summarization methods for the Financial Text Summarizer.
 """
 
+import hashlib
+import heapq
+import math
+import re
+import threading
+from collections import Counter, OrderedDict
+
 import nltk
-from nltk.tokenize import sent_tokenize
 from sumy.parsers.plaintext import PlaintextParser
-from sumy.nlp.tokenizers import Tokenizer
 from sumy.summarizers.lsa import LsaSummarizer
 from sumy.summarizers.lex_rank import LexRankSummarizer
 from sumy.summarizers.text_rank import TextRankSummarizer
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer, ENGLISH_STOP_WORDS
 import numpy as np
 
+from utils.normalization import get_normalizer
+from utils.sentence_splitter import split_sentences, sumy_tokenizer
+
 # Make sure NLTK resources are available
 try:
     nltk.data.find('tokenizers/punkt')
@@ -22,103 +30,692 @@ try:
 except LookupError:
     nltk.download('stopwords')
 
+# Sentence boundary used when reading a stream: terminal punctuation, optional
+# closing quotes or brackets, whitespace, then the start of the next sentence
+STREAM_BOUNDARY = re.compile(r'(?<=[.!?])["\')\]]*\s+(?=["\'(\[]?[A-Z0-9])')
+
+# Same term definition as TfidfVectorizer's default token pattern
+TERM_PATTERN = re.compile(r'(?u)\b\w\w+\b')
+
+
+def iter_stream_sentences(source, chunk_size=65536, max_sentence_chars=20000):
+    """
+    Yield sentences from a string, an iterable of text chunks or a text file handle.
+    
+    Only the unfinished tail of the stream is buffered, so memory is bounded by
+    the longest sentence rather than by the document.
+    
+    Args:
+        source (str, file or iterable): The text to split
+        chunk_size (int): Characters read per call when source is a file handle
+        max_sentence_chars (int): Force a break when a sentence grows past this size
+        
+    Yields:
+        str: One sentence at a time
+    """
+    if isinstance(source, str):
+        chunks = (source[i:i + chunk_size] for i in range(0, len(source), chunk_size))
+    elif hasattr(source, 'read'):
+        chunks = iter(lambda: source.read(chunk_size), '')
+    else:
+        chunks = source
+    
+    buffer = ''
+    for chunk in chunks:
+        if isinstance(chunk, bytes):
+            chunk = chunk.decode('utf-8')
+        buffer += chunk
+        
+        # Emit every complete sentence, keep the last (possibly unfinished) one
+        start = 0
+        for match in STREAM_BOUNDARY.finditer(buffer):
+            sentence = buffer[start:match.start()].strip()
+            if sentence:
+                yield sentence
+            start = match.end()
+        buffer = buffer[start:]
+        
+        if len(buffer) > max_sentence_chars:
+            yield buffer.strip()
+            buffer = ''
+    
+    if buffer.strip():
+        yield buffer.strip()
+
+
+class SentenceRanking:
+    """
+    Per-sentence scores from a single scoring pass, cut to any summary length.
+    """
+    
+    def __init__(self, sentences, scores, method, lengths=None):
+        """
+        Initialize the ranking.
+        
+        Args:
+            sentences (list): Sentences in document order
+            scores (array-like): One score per sentence, higher is more important
+            method (str): Name of the method that produced the scores
+            lengths (tuple, optional): Word and character counts of the sentences in
+                document order, if already known
+        """
+        self.sentences = list(sentences)
+        self.scores = np.asarray(scores, dtype=float)
+        self.method = method
+        
+        # Best first; the stable sort keeps document order among ties
+        self.order = np.argsort(-self.scores, kind='stable')
+        
+        # Lengths in ranked order, for budgeted cuts
+        if lengths is None:
+            words = np.array([len(sentence.split()) for sentence in self.sentences], dtype=int)
+            chars = np.array([len(sentence) for sentence in self.sentences], dtype=int)
+        else:
+            words, chars = lengths
+        self._ranked_words = words[self.order]
+        self._ranked_chars = chars[self.order] + 1
+    
+    def __len__(self):
+        return len(self.sentences)
+    
+    def top(self, num_sentences):
+        """
+        Get the indices of the best sentences in document order.
+        
+        Args:
+            num_sentences (int): Number of sentences to select
+            
+        Returns:
+            np.ndarray: Sentence indices sorted by position
+        """
+        return np.sort(self.order[:max(num_sentences, 0)])
+    
+    def _join(self, indices):
+        return " ".join(self.sentences[i] for i in indices)
+    
+    def cut(self, num_sentences):
+        """
+        Build a summary from the best sentences.
+        
+        Args:
+            num_sentences (int): Number of sentences to include
+            
+        Returns:
+            str: The summarized text
+        """
+        return self._join(self.top(num_sentences))
+    
+    def cut_words(self, max_words):
+        """
+        Build a summary from the longest prefix of the ranking within a word budget.
+        
+        Args:
+            max_words (int): Maximum number of words in the summary
+            
+        Returns:
+            str: The summarized text
+        """
+        count = int(np.searchsorted(np.cumsum(self._ranked_words), max_words, side='right'))
+        return self.cut(count)
+    
+    def cut_chars(self, max_chars):
+        """
+        Build a summary from the longest prefix of the ranking within a character budget.
+        
+        Args:
+            max_chars (int): Maximum number of characters in the summary
+            
+        Returns:
+            str: The summarized text
+        """
+        # Each sentence was counted with its joining space, which the first one does not need
+        count = int(np.searchsorted(np.cumsum(self._ranked_chars), max_chars + 1, side='right'))
+        return self.cut(count)
+    
+    def cuts(self, lengths):
+        """
+        Build summaries for several lengths at once.
+        
+        Args:
+            lengths (iterable): Numbers of sentences
+            
+        Returns:
+            dict: Mapping of length to summary
+        """
+        return {n: self.cut(n) for n in lengths}
+
+
+class SentenceIndex:
+    """
+    Inverted BM25 index over the sentences of one document.
+    
+    Built once per document, it answers any number of queries: each query only
+    touches the postings of its own terms.
+    """
+    
+    def __init__(self, sentences, k1=1.2, b=0.75):
+        """
+        Index the sentences of a document.
+        
+        Args:
+            sentences (list): Sentences in document order
+            k1 (float): BM25 term frequency saturation
+            b (float): BM25 sentence length normalization
+        """
+        self.sentences = sentences
+        self.k1 = k1
+        
+        postings = {}
+        lengths = np.zeros(len(sentences))
+        for i, sentence in enumerate(sentences):
+            terms = self.terms(sentence)
+            lengths[i] = len(terms)
+            for term, count in Counter(terms).items():
+                postings.setdefault(term, []).append((i, count))
+        
+        # Per term: sentence ids, term frequencies and the idf weight
+        num_sentences = len(sentences)
+        self._postings = {}
+        for term, entries in postings.items():
+            ids, counts = zip(*entries)
+            idf = math.log(1 + (num_sentences - len(ids) + 0.5) / (len(ids) + 0.5))
+            self._postings[term] = (np.array(ids), np.array(counts, dtype=float), idf)
+        
+        # Length normalization of every sentence, computed once
+        average = lengths.mean() if num_sentences and lengths.mean() > 0 else 1.0
+        self._norms = k1 * (1 - b + b * lengths / average)
+        
+        # Sentence lengths handed to every ranking, so a query does not recount them
+        self._lengths = (
+            np.array([len(sentence.split()) for sentence in sentences], dtype=int),
+            np.array([len(sentence) for sentence in sentences], dtype=int)
+        )
+    
+    @staticmethod
+    def terms(text):
+        """
+        Split text into stemmed index terms, without English stopwords.
+        
+        Args:
+            text (str): Sentence or query
+            
+        Returns:
+            list: Stemmed terms
+        """
+        stem = get_normalizer().stem
+        return [stem(term) for term in TERM_PATTERN.findall(text.lower()) if term not in ENGLISH_STOP_WORDS]
+    
+    def __len__(self):
+        return len(self.sentences)
+    
+    def scores(self, query):
+        """
+        Score every sentence against a query.
+        
+        Args:
+            query (str): Free-text query, e.g. 'guidance' or 'liquidity and cash flow'
+            
+        Returns:
+            np.ndarray: BM25 score of each sentence, 0 where no query term occurs
+        """
+        scores = np.zeros(len(self.sentences))
+        for term in set(self.terms(query)):
+            if term not in self._postings:
+                continue
+            ids, counts, idf = self._postings[term]
+            scores[ids] += idf * counts * (self.k1 + 1) / (counts + self._norms[ids])
+        return scores
+    
+    def search(self, query):
+        """
+        Rank the sentences of the document by relevance to a query.
+        
+        Args:
+            query (str): Free-text query
+            
+        Returns:
+            SentenceRanking: Sentences with their BM25 scores in document order
+        """
+        # Rounded so that equal scores tie exactly and keep document order
+        return SentenceRanking(self.sentences, np.round(self.scores(query), 10), 'bm25', self._lengths)
+
 
 class ExtractiveSummarizer:
     """
     A class that implements various extractive text summarization methods.
     """
     
+    # Rankings of recently seen documents, so changing only the summary length
+    # does not re-run parsing, similarity graphs or SVD
+    RANKING_CACHE_SIZE = 32
+    _ranking_cache = OrderedDict()
+    
+    # BM25 indexes of recently seen documents, so each new query is a lookup
+    INDEX_CACHE_SIZE = 32
+    _index_cache = OrderedDict()
+    
+    # Both caches are shared by every session thread
+    _cache_lock = threading.Lock()
+    
+    SUMY_SUMMARIZERS = {
+        'text_rank': TextRankSummarizer,
+        'lex_rank': LexRankSummarizer,
+        'lsa': LsaSummarizer,
+    }
+    
     @staticmethod
-    def text_rank(text, num_sentences=5):
+    def _score_sumy(text, method, splitter='punkt'):
+        """
+        Score every sentence with one of the sumy summarizers.
+        """
+        parser = PlaintextParser.from_string(text, sumy_tokenizer(splitter))
+        summarizer = ExtractiveSummarizer.SUMY_SUMMARIZERS[method](get_normalizer().sumy_stemmer())
+        sentences = parser.document.sentences
+        scores = np.zeros(len(sentences))
+        
+        # sumy hands the rated sentences, best first, to the sentence count
+        # callable; record every rating instead of keeping only the top ones
+        def capture(infos):
+            for info in infos:
+                scores[info.order] = info.rating
+            return infos
+        
+        summarizer(parser.document, capture)
+        
+        return [str(sentence) for sentence in sentences], scores
+    
+    @staticmethod
+    def _score_tfidf(text, splitter='punkt', term_stats=None):
+        """
+        Score every sentence by the sum of its TF-IDF weights.
+        
+        IDF is fitted over the sentences of the text, or read from term_stats
+        (a TermStatistics sketch of corpus document frequencies) when given.
+        """
+        sentences = split_sentences(text, splitter)
+        if not sentences:
+            return sentences, np.zeros(0)
+        
+        if term_stats is None:
+            vectorizer = TfidfVectorizer(stop_words='english')
+        else:
+            vectorizer = CountVectorizer(stop_words='english')
+        try:
+            tfidf_matrix = vectorizer.fit_transform(sentences)
+        except ValueError:
+            # Only stopwords, nothing to score
+            return sentences, np.zeros(len(sentences))
+        
+        if term_stats is not None:
+            # Corpus IDF, then the same L2 row normalization as TfidfVectorizer
+            weighted = tfidf_matrix.multiply(term_stats.idf(vectorizer.get_feature_names_out())).tocsr()
+            norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+            sums = np.asarray(weighted.sum(axis=1)).ravel()
+            scores = np.divide(sums, norms, out=np.zeros(len(sentences)), where=norms > 0)
+            return sentences, np.round(scores, 10)
+        
+        # Rounded so that sentences with equal weights tie exactly and keep document order
+        return sentences, np.round(np.asarray(tfidf_matrix.sum(axis=1)).ravel(), 10)
+    
+    @classmethod
+    def _cache_get(cls, cache, key):
+        """
+        Look up a cache entry and mark it as recently used.
+        """
+        with cls._cache_lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            return value
+    
+    @classmethod
+    def _cache_put(cls, cache, key, value, max_size):
+        """
+        Store a cache entry, evicting the least recently used one past max_size.
+        """
+        with cls._cache_lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            if len(cache) > max_size:
+                cache.popitem(last=False)
+    
+    @classmethod
+    def rank(cls, text, method='text_rank', use_cache=True, splitter='punkt'):
+        """
+        Score every sentence of a text once, for cutting at any length.
+        
+        Args:
+            text (str): The text to rank
+            method (str): 'text_rank', 'lex_rank', 'lsa' or 'tfidf'
+            use_cache (bool): Reuse the ranking of a recently seen text
+            splitter (str): Sentence splitter, 'punkt' or 'finance'
+            
+        Returns:
+            SentenceRanking: Sentences with their scores in document order
+        """
+        if method not in cls.SUMY_SUMMARIZERS and method != 'tfidf':
+            raise ValueError(
+                f"Method '{method}' not supported. Choose from: "
+                f"{', '.join(list(cls.SUMY_SUMMARIZERS.keys()) + ['tfidf'])}"
+            )
+        
+        key = (method, splitter, get_normalizer().stem_sumy, hashlib.sha1(text.encode('utf-8')).hexdigest())
+        cached = cls._cache_get(cls._ranking_cache, key) if use_cache else None
+        if cached is not None:
+            return cached
+        
+        if method == 'tfidf':
+            sentences, scores = cls._score_tfidf(text, splitter)
+        else:
+            sentences, scores = cls._score_sumy(text, method, splitter)
+        
+        ranking = SentenceRanking(sentences, scores, method)
+        if use_cache:
+            cls._cache_put(cls._ranking_cache, key, ranking, cls.RANKING_CACHE_SIZE)
+        
+        return ranking
+    
+    @classmethod
+    def clear_ranking_cache(cls):
+        """
+        Drop all cached rankings and sentence indexes, e.g. to time cold requests.
+        """
+        with cls._cache_lock:
+            cls._ranking_cache.clear()
+            cls._index_cache.clear()
+    
+    @classmethod
+    def sentence_index(cls, text, splitter='punkt', use_cache=True):
+        """
+        Build or reuse the BM25 sentence index of a text.
+        
+        Args:
+            text (str): The document
+            splitter (str): Sentence splitter, 'punkt' or 'finance'
+            use_cache (bool): Reuse the index of a recently seen text
+            
+        Returns:
+            SentenceIndex: The index
+        """
+        key = (splitter, hashlib.sha1(text.encode('utf-8')).hexdigest())
+        cached = cls._cache_get(cls._index_cache, key) if use_cache else None
+        if cached is not None:
+            return cached
+        
+        index = SentenceIndex(split_sentences(text, splitter))
+        if use_cache:
+            cls._cache_put(cls._index_cache, key, index, cls.INDEX_CACHE_SIZE)
+        
+        return index
+    
+    @classmethod
+    def query_ranking(cls, text, query, splitter='punkt', fallback='tfidf'):
+        """
+        Rank sentences by relevance to a query.
+        
+        Args:
+            text (str): The document
+            query (str): Free-text query
+            splitter (str): Sentence splitter, 'punkt' or 'finance'
+            fallback (str): Method ranking the document when no sentence matches the query
+            
+        Returns:
+            SentenceRanking: BM25 ranking, or the fallback ranking if nothing matched
+        """
+        ranking = cls.sentence_index(text, splitter).search(query) if query else None
+        if ranking is None or not ranking.scores.any():
+            return cls.rank(text, fallback, splitter=splitter)
+        return ranking
+    
+    @staticmethod
+    def text_rank(text, num_sentences=5, splitter='punkt'):
         """
         Summarize text using the TextRank algorithm.
         
         Args:
             text (str): The text to summarize
             num_sentences (int): Number of sentences to include in the summary
+            splitter (str): Sentence splitter, 'punkt' or 'finance'
             
         Returns:
             str: The summarized text
         """
-        parser = PlaintextParser.from_string(text, Tokenizer("english"))
-        summarizer = TextRankSummarizer()
-        summary = summarizer(parser.document, num_sentences)
-        return " ".join([str(sentence) for sentence in summary])
+        return ExtractiveSummarizer.rank(text, 'text_rank', splitter=splitter).cut(num_sentences)
     
     @staticmethod
-    def lex_rank(text, num_sentences=5):
+    def lex_rank(text, num_sentences=5, splitter='punkt'):
         """
         Summarize text using the LexRank algorithm.
         
         Args:
             text (str): The text to summarize
             num_sentences (int): Number of sentences to include in the summary
+            splitter (str): Sentence splitter, 'punkt' or 'finance'
             
         Returns:
             str: The summarized text
         """
-        parser = PlaintextParser.from_string(text, Tokenizer("english"))
-        summarizer = LexRankSummarizer()
-        summary = summarizer(parser.document, num_sentences)
-        return " ".join([str(sentence) for sentence in summary])
+        return ExtractiveSummarizer.rank(text, 'lex_rank', splitter=splitter).cut(num_sentences)
     
     @staticmethod
-    def lsa(text, num_sentences=5):
+    def lsa(text, num_sentences=5, splitter='punkt'):
         """
         Summarize text using Latent Semantic Analysis.
         
         Args:
             text (str): The text to summarize
             num_sentences (int): Number of sentences to include in the summary
+            splitter (str): Sentence splitter, 'punkt' or 'finance'
             
         Returns:
             str: The summarized text
         """
-        parser = PlaintextParser.from_string(text, Tokenizer("english"))
-        summarizer = LsaSummarizer()
-        summary = summarizer(parser.document, num_sentences)
-        return " ".join([str(sentence) for sentence in summary])
+        return ExtractiveSummarizer.rank(text, 'lsa', splitter=splitter).cut(num_sentences)
     
     @staticmethod
-    def tfidf(text, num_sentences=5):
+    def tfidf(text, num_sentences=5, splitter='punkt', term_stats=None):
         """
         Summarize text using TF-IDF scoring.
         
         Args:
             text (str): The text to summarize
             num_sentences (int): Number of sentences to include in the summary
+            splitter (str): Sentence splitter, 'punkt' or 'finance'
+            term_stats (TermStatistics, optional): Corpus document frequencies to
+                take the IDF from, instead of the sentences of this text
             
         Returns:
             str: The summarized text
         """
-        # Tokenize the text into sentences
-        sentences = sent_tokenize(text)
+        if term_stats is None:
+            ranking = ExtractiveSummarizer.rank(text, 'tfidf', splitter=splitter)
+        else:
+            # Not cached: the sketch keeps changing as documents arrive
+            ranking = SentenceRanking(*ExtractiveSummarizer._score_tfidf(text, splitter, term_stats), 'tfidf')
         
         # If there are fewer sentences than requested, return all sentences
-        if len(sentences) <= num_sentences:
+        if len(ranking) <= num_sentences:
             return text
         
-        # Create a TF-IDF vectorizer
-        vectorizer = TfidfVectorizer(stop_words='english')
+        return ranking.cut(num_sentences)
+    
+    @staticmethod
+    def query(text, query=None, num_sentences=5, splitter='punkt'):
+        """
+        Summarize text with the sentences most relevant to a query.
         
-        # Fit and transform the sentences
-        tfidf_matrix = vectorizer.fit_transform(sentences)
+        Sentences are ranked by BM25 against an index of the document that is
+        built once and cached, so asking several questions of the same document
+        does not re-read it. Only sentences that match the query are returned;
+        without a query, or if no sentence matches, this is a TF-IDF summary.
         
-        # Calculate sentence scores based on TF-IDF values
-        sentence_scores = np.array([tfidf_matrix[i].sum() for i in range(len(sentences))])
+        Args:
+            text (str): The text to summarize
+            query (str, optional): Free-text query, e.g. 'guidance' or 'liquidity'
+            num_sentences (int): Maximum number of sentences in the summary
+            splitter (str): Sentence splitter, 'punkt' or 'finance'
+            
+        Returns:
+            str: The summarized text
+        """
+        ranking = ExtractiveSummarizer.query_ranking(text, query, splitter)
+        if ranking.method == 'bm25':
+            num_sentences = min(num_sentences, int(np.count_nonzero(ranking.scores)))
+        return ranking.cut(num_sentences)
+    
+    @staticmethod
+    def tfidf_corpus(texts, num_sentences=5, idf='document', splitter='punkt', term_stats=None):
+        """
+        Summarize many documents with TF-IDF in one vectorized pass.
+        
+        All sentences of all documents are stacked into one sparse count matrix
+        with a segment index mapping each row to its document. Weighting, row
+        scores and the per-document top-k selection are computed with array
+        operations over the whole corpus instead of one vectorizer per document.
         
-        # Get the indices of the top N sentences
-        top_indices = sentence_scores.argsort()[-num_sentences:]
+        Args:
+            texts (iterable): The documents to summarize
+            num_sentences (int): Number of sentences per summary
+            idf (str): 'document' weights terms by their frequency inside each
+                document, giving the same result as tfidf(); 'corpus' uses one
+                IDF fitted over all sentences of the corpus; 'stream' uses the
+                document frequencies in term_stats
+            splitter (str): Sentence splitter, 'punkt' or 'finance'
+            term_stats (TermStatistics, optional): Corpus sketch for idf='stream'
+                
+        Returns:
+            list: One summary per document, in input order
+        """
+        if idf not in ('document', 'corpus', 'stream'):
+            raise ValueError(f"IDF mode '{idf}' not supported. Choose from: document, corpus, stream")
+        if idf == 'stream' and term_stats is None:
+            raise ValueError("IDF mode 'stream' needs term_stats")
+        
+        texts = list(texts)
+        sentence_lists = [split_sentences(text, splitter) for text in texts]
+        counts = np.array([len(sentences) for sentences in sentence_lists], dtype=np.int64)
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+        all_sentences = [sentence for sentences in sentence_lists for sentence in sentences]
+        segment = np.repeat(np.arange(len(texts)), counts)
+        num_rows = len(all_sentences)
+        
+        vectorizer = CountVectorizer(stop_words='english')
+        try:
+            tf = vectorizer.fit_transform(all_sentences).tocsr()
+        except ValueError:
+            # Empty corpus or only stopwords
+            tf = None
+        
+        scores = np.zeros(num_rows)
+        if tf is not None and tf.nnz:
+            rows = np.repeat(np.arange(num_rows), np.diff(tf.indptr))
+            
+            if idf == 'stream':
+                # Sketch IDF per vocabulary term, already smoothed the same way
+                idf_weights = term_stats.idf(vectorizer.get_feature_names_out())[tf.indices]
+            elif idf == 'corpus':
+                doc_freq = np.bincount(tf.indices, minlength=tf.shape[1])[tf.indices]
+                num_docs = num_rows
+            else:
+                # Count each (document, term) pair once per sentence it occurs in
+                docs = segment[rows]
+                keys = docs * tf.shape[1] + tf.indices
+                _, inverse, pair_counts = np.unique(keys, return_inverse=True, return_counts=True)
+                doc_freq = pair_counts[inverse]
+                num_docs = counts[docs]
+            
+            # Same smoothed IDF and L2 row normalization as TfidfVectorizer
+            if idf != 'stream':
+                idf_weights = np.log((1 + num_docs) / (1 + doc_freq)) + 1
+            weights = tf.data * idf_weights
+            sums = np.bincount(rows, weights=weights, minlength=num_rows)
+            norms = np.sqrt(np.bincount(rows, weights=weights ** 2, minlength=num_rows))
+            np.divide(sums, norms, out=scores, where=norms > 0)
+            
+            # Rounded like tfidf() so ties break by position in both
+            scores = np.round(scores, 10)
+        
+        # Per-document top-k: order by document, then score, then position
+        order = np.lexsort((np.arange(num_rows), -scores, segment))
+        rank_in_document = np.arange(num_rows) - offsets[segment[order]]
+        selected = np.sort(order[rank_in_document < num_sentences])
+        boundaries = np.searchsorted(selected, offsets[1:-1])
+        
+        summaries = []
+        for i, indices in enumerate(np.split(selected, boundaries)):
+            # If there are fewer sentences than requested, return all sentences
+            if counts[i] <= num_sentences:
+                summaries.append(texts[i])
+            else:
+                summaries.append(' '.join(all_sentences[j] for j in indices))
+        
+        return summaries
+    
+    @staticmethod
+    def streaming_tfidf(source, num_sentences=5, pool_size=None, max_terms=200000):
+        """
+        Summarize an arbitrarily long document with TF-IDF in bounded memory.
+        
+        Sentences are read one at a time. Running document frequencies are kept
+        for the terms seen so far, and a fixed-size heap holds the best candidate
+        sentences under the provisional IDF. At the end of the stream the
+        candidates are re-scored with the final IDF and the top sentences are
+        returned in document order. Scores follow the same smoothed, L2-normalized
+        weighting as tfidf().
+        
+        Args:
+            source (str, file or iterable): Text, text file handle or iterable of chunks
+            num_sentences (int): Number of sentences to include in the summary
+            pool_size (int, optional): Candidates kept in the heap; defaults to
+                four times num_sentences
+            max_terms (int): Vocabulary size at which the rarest terms are pruned
+            
+        Returns:
+            str: The summarized text
+        """
+        pool_size = max(pool_size or 4 * num_sentences, num_sentences)
+        doc_freq = Counter()
+        num_seen = 0
+        heap = []
+        
+        def score(term_counts, total):
+            weights = [
+                count * (math.log((1 + total) / (1 + doc_freq.get(term, 0))) + 1)
+                for term, count in term_counts.items()
+            ]
+            norm = math.sqrt(sum(w * w for w in weights))
+            return sum(weights) / norm if norm else 0.0
+        
+        for position, sentence in enumerate(iter_stream_sentences(source)):
+            terms = [t for t in TERM_PATTERN.findall(sentence.lower()) if t not in ENGLISH_STOP_WORDS]
+            term_counts = Counter(terms)
+            doc_freq.update(term_counts.keys())
+            num_seen += 1
+            
+            # Keep the vocabulary bounded by dropping the rarest terms
+            if len(doc_freq) > max_terms:
+                for term, _ in doc_freq.most_common()[max_terms // 2:]:
+                    del doc_freq[term]
+            
+            entry = (score(term_counts, num_seen), -position, sentence, term_counts)
+            if len(heap) < pool_size:
+                heapq.heappush(heap, entry)
+            elif entry[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, entry)
         
-        # Sort indices to maintain original order
-        top_indices = sorted(top_indices)
+        # Re-normalize the candidates against the final document frequencies
+        rescored = sorted(
+            ((score(term_counts, num_seen), neg_position, sentence)
+             for _, neg_position, sentence, term_counts in heap),
+            reverse=True
+        )[:num_sentences]
         
-        # Combine the top sentences
-        summary = ' '.join([sentences[i] for i in top_indices])
+        # Restore the original order
+        rescored.sort(key=lambda entry: -entry[1])
         
-        return summary
+        return ' '.join(sentence for _, _, sentence in rescored)
     
-    def summarize(self, text, method='text_rank', num_sentences=5):
+    def summarize(self, text, method='text_rank', num_sentences=5, splitter='punkt'):
         """
         Summarize text using the specified method.
         
@@ -127,6 +724,7 @@ class ExtractiveSummarizer:
             method (str): The summarization method to use
                 ('text_rank', 'lex_rank', 'lsa', or 'tfidf')
             num_sentences (int): Number of sentences to include in the summary
+            splitter (str): Sentence splitter, 'punkt' or 'finance'
             
         Returns:
             str: The summarized text
@@ -141,4 +739,4 @@ class ExtractiveSummarizer:
         if method not in methods:
             raise ValueError(f"Method '{method}' not supported. Choose from: {', '.join(methods.keys())}")
         
-        return methods[method](text, num_sentences)
\ No newline at end of file
+        return methods[method](text, num_sentences, splitter)
\ No newline at end of file
@@ -0,0 +1,417 @@
+"""
+Shared model server for multi-user deployments of the Financial Text Summarizer.
+
+The abstractive models are loaded once in a single server subprocess. Sessions
+submit requests through a local IPC queue; the parent process schedules them
+round-robin across sessions with a per-session concurrency cap, so memory stays
+flat no matter how many analysts are connected.
+"""
+
+import atexit
+import itertools
+import multiprocessing
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError
+from queue import Empty
+
+from utils.threads import get_thread_budget, limit_threads
+
+# Seconds a session waits for a result before giving up, queueing included
+DEFAULT_TIMEOUT = 300
+
+
+def _serve(request_queue, response_queue, models, workers, draft_model_path=None, threads=None):
+    """
+    Entry point of the server subprocess.
+
+    Args:
+        request_queue (multiprocessing.Queue): Incoming (request_id, method, text, params)
+        response_queue (multiprocessing.Queue): Outgoing (request_id, ok, payload)
+        models (tuple): Models to preload ('bart', 't5')
+        workers (int): Number of inference threads sharing the loaded models
+        draft_model_path (str, optional): Local BART draft model for assisted decoding
+        threads (int, optional): torch and BLAS threads per inference thread
+    """
+    # Before torch is imported, so its thread pool starts at this size
+    if threads:
+        limit_threads(threads)
+
+    from modules.abstractive import AbstractiveSummarizer
+
+    # Every inference thread may run on the same model at once
+    summarizer = AbstractiveSummarizer(draft_model_path=draft_model_path, max_concurrency=workers)
+    loaders = {
+        'bart': summarizer._get_bart_summarizer,
+        't5': summarizer._get_t5_summarizer,
+    }
+
+    # Load the models up front so the first request does not pay for it
+    try:
+        for model in models:
+            loaders[model]()
+    except Exception as e:
+        response_queue.put((None, False, f"Model preload failed: {e!r}"))
+        return
+    response_queue.put((None, True, 'ready'))
+
+    def handle(request_id, method, text, params):
+        try:
+            summary = summarizer.summarize(text, method=method, **params)
+            response_queue.put((request_id, True, summary))
+        except Exception as e:
+            response_queue.put((request_id, False, repr(e)))
+
+    # Threads share one copy of the weights; torch releases the GIL during inference
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while True:
+            request = request_queue.get()
+            if request is None:
+                break
+            pool.submit(handle, *request)
+
+
+class ModelServer:
+    """
+    Client side of the shared model server, with fair scheduling across sessions.
+    """
+
+    def __init__(self, models=('bart', 't5'), workers=2, session_limit=1, start_timeout=600,
+                 draft_model_path=None):
+        """
+        Initialize the server client. Call start() to launch the subprocess.
+
+        Args:
+            models (tuple): Models to preload in the server ('bart', 't5')
+            workers (int): Requests the server runs concurrently
+            session_limit (int): Maximum in-flight requests per session
+            start_timeout (float): Seconds to wait for the models to load
+            draft_model_path (str, optional): Local BART draft model for assisted decoding
+        """
+        self.models = tuple(models)
+        self.workers = workers
+        self.session_limit = session_limit
+        self.start_timeout = start_timeout
+        self.draft_model_path = draft_model_path
+
+        self._context = multiprocessing.get_context('spawn')
+        self._process = None
+        self._request_queue = None
+        self._response_queue = None
+
+        self._condition = threading.Condition()
+        self._pending = OrderedDict()
+        self._rotation = deque()
+        self._in_flight = {}
+        self._futures = {}
+        self._request_ids = itertools.count()
+        self._running = False
+        self._completed = 0
+
+    def start(self):
+        """
+        Launch the server subprocess and wait until the models are loaded.
+
+        Returns:
+            ModelServer: self, for chaining
+        """
+        if self._running:
+            return self
+
+        # Each inference thread runs its own torch thread pool, so they are budgeted like worker processes
+        threads = get_thread_budget().resize('model_server', self.workers)
+
+        self._request_queue = self._context.Queue()
+        self._response_queue = self._context.Queue()
+        self._process = self._context.Process(
+            target=_serve,
+            args=(self._request_queue, self._response_queue, self.models, self.workers, self.draft_model_path,
+                  threads),
+            daemon=True
+        )
+        self._process.start()
+
+        try:
+            ok, message = self._wait_ready()
+        except BaseException:
+            self._process.terminate()
+            self._process.join(timeout=5)
+            get_thread_budget().release('model_server')
+            raise
+        if not ok:
+            self._process.join(timeout=5)
+            get_thread_budget().release('model_server')
+            raise RuntimeError(message)
+
+        self._running = True
+        threading.Thread(target=self._dispatch_loop, name='model-server-dispatch', daemon=True).start()
+        threading.Thread(target=self._receive_loop, name='model-server-receive', daemon=True).start()
+        atexit.register(self.stop)
+        return self
+
+    def _wait_ready(self):
+        """
+        Wait for the server's ready message, failing early if the subprocess dies.
+
+        Returns:
+            tuple: (ok, message) sent by the server
+        """
+        deadline = time.monotonic() + self.start_timeout
+        while True:
+            try:
+                _, ok, message = self._response_queue.get(timeout=min(1.0, self.start_timeout))
+                return ok, message
+            except Empty:
+                if not self._process.is_alive():
+                    raise RuntimeError(f"Model server exited with code {self._process.exitcode} while loading")
+                if time.monotonic() >= deadline:
+                    raise RuntimeError(f"Model server did not load its models within {self.start_timeout}s")
+
+    def _shutdown(self):
+        """
+        Mark the server stopped and take every request still queued or running.
+        Must be called with the condition held.
+
+        Returns:
+            list: Futures of the requests, to be failed outside the lock
+        """
+        self._running = False
+        futures = [future for _, future in self._futures.values()]
+        for queue in self._pending.values():
+            futures.extend(future for _, future, _, _, _ in queue)
+        self._futures.clear()
+        self._pending.clear()
+        self._rotation.clear()
+        self._in_flight.clear()
+        self._condition.notify_all()
+        return futures
+
+    @staticmethod
+    def _fail(futures, message):
+        error = RuntimeError(message)
+        for future in futures:
+            # Sessions may have cancelled theirs after a timeout
+            if not future.done():
+                future.set_exception(error)
+
+    def stop(self):
+        """
+        Shut down the server subprocess and fail any requests still queued.
+        """
+        with self._condition:
+            if not self._running:
+                return
+            futures = self._shutdown()
+
+        self._request_queue.put(None)
+        self._process.join(timeout=30)
+        if self._process.is_alive():
+            self._process.terminate()
+        get_thread_budget().release('model_server')
+
+        self._fail(futures, "Model server stopped")
+
+    def submit(self, session_id, method, text, **params):
+        """
+        Queue a summarization request for a session.
+
+        Args:
+            session_id (str): Identifier of the submitting session
+            method (str): Abstractive method ('bart', 't5' or 't5_chunked')
+            text (str): The text to summarize
+            **params: Generation parameters such as max_length and min_length
+
+        Returns:
+            concurrent.futures.Future: Resolves to the summary text
+        """
+        future = Future()
+        with self._condition:
+            if not self._running:
+                raise RuntimeError("Model server is not running")
+
+            if session_id not in self._pending:
+                self._pending[session_id] = deque()
+            self._pending[session_id].append((next(self._request_ids), future, method, text, params))
+            if session_id not in self._rotation:
+                self._rotation.append(session_id)
+            self._condition.notify_all()
+
+        return future
+
+    def cancel(self, future):
+        """
+        Withdraw a request that has not been sent to the server yet.
+
+        Args:
+            future (concurrent.futures.Future): Future returned by submit()
+
+        Returns:
+            bool: True if the request was still queued and is now cancelled
+        """
+        with self._condition:
+            for session_id, queue in self._pending.items():
+                for request in queue:
+                    if request[1] is future:
+                        queue.remove(request)
+                        if not queue:
+                            del self._pending[session_id]
+                            self._rotation.remove(session_id)
+                        return future.cancel()
+        return False
+
+    def _next_request(self):
+        """
+        Pick the next request round-robin over sessions under their cap.
+        Must be called with the condition held.
+        """
+        for _ in range(len(self._rotation)):
+            session_id = self._rotation[0]
+            self._rotation.rotate(-1)
+            if self._in_flight.get(session_id, 0) < self.session_limit:
+                queue = self._pending[session_id]
+                request = queue.popleft()
+                if not queue:
+                    del self._pending[session_id]
+                    self._rotation.remove(session_id)
+                return session_id, request
+        return None
+
+    def _dispatch_loop(self):
+        """
+        Feed the server at most `workers` requests at a time, fairly across sessions.
+        """
+        while True:
+            with self._condition:
+                while self._running:
+                    if sum(self._in_flight.values()) < self.workers:
+                        selected = self._next_request()
+                        if selected is not None:
+                            break
+                    self._condition.wait()
+                else:
+                    return
+
+                session_id, (request_id, future, method, text, params) = selected
+                # Skip requests whose session stopped waiting before they were sent
+                if future.cancelled():
+                    continue
+                self._in_flight[session_id] = self._in_flight.get(session_id, 0) + 1
+                self._futures[request_id] = (session_id, future)
+
+            self._request_queue.put((request_id, method, text, params))
+
+    def _receive_loop(self):
+        """
+        Resolve futures as results come back from the server, and fail them
+        all if the server process dies.
+        """
+        while self._running:
+            try:
+                request_id, ok, payload = self._response_queue.get(timeout=1)
+            except Empty:
+                if self._process.is_alive():
+                    continue
+                with self._condition:
+                    if not self._running:
+                        return
+                    futures = self._shutdown()
+                get_thread_budget().release('model_server')
+                self._fail(futures, f"Model server exited with code {self._process.exitcode}")
+                return
+
+            with self._condition:
+                entry = self._futures.pop(request_id, None)
+                if entry is None:
+                    continue
+                session_id, future = entry
+                self._in_flight[session_id] -= 1
+                if not self._in_flight[session_id]:
+                    del self._in_flight[session_id]
+                self._completed += 1
+                self._condition.notify_all()
+
+            if future.done():
+                continue
+            if ok:
+                future.set_result(payload)
+            else:
+                future.set_exception(RuntimeError(payload))
+
+    def stats(self):
+        """
+        Return queue depth per session, in-flight counts and completed requests.
+
+        Returns:
+            dict: Scheduling statistics
+        """
+        with self._condition:
+            return {
+                'running': self._running,
+                'pending': {session: len(queue) for session, queue in self._pending.items()},
+                'in_flight': dict(self._in_flight),
+                'completed': self._completed,
+            }
+
+
+class RemoteAbstractiveSummarizer:
+    """
+    Drop-in replacement for AbstractiveSummarizer that runs on a ModelServer.
+    """
+
+    def __init__(self, server, session_resolver=None, timeout=DEFAULT_TIMEOUT):
+        """
+        Initialize the proxy.
+
+        Args:
+            server (ModelServer): A started model server
+            session_resolver (callable, optional): Returns the current session id;
+                defaults to the calling thread's id
+            timeout (float, optional): Seconds to wait for each result; None waits forever
+        """
+        self.server = server
+        self.session_resolver = session_resolver or threading.get_ident
+        self.timeout = timeout
+
+    def summarize(self, text, method='bart', max_length=150, min_length=50, profile=None):
+        """
+        Summarize text on the model server.
+
+        Args:
+            text (str): The text to summarize
+            method (str): 'bart', 't5' or 't5_chunked'
+            max_length (int): Maximum length of the summary in tokens
+            min_length (int): Minimum length of the summary in tokens
+            profile (str, optional): Decoding profile from GENERATION_PROFILES
+
+        Returns:
+            str: The summarized text
+        """
+        future = self.server.submit(
+            self.session_resolver(), method, text,
+            max_length=max_length, min_length=min_length, profile=profile
+        )
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            # Drop the request if it has not reached the server yet, and ignore its result if it has
+            if not self.server.cancel(future):
+                future.cancel()
+            raise
+
+    def bart(self, text, max_length=150, min_length=50, profile=None):
+        return self.summarize(text, 'bart', max_length, min_length, profile)
+
+    def t5(self, text, max_length=150, min_length=50, profile=None):
+        return self.summarize(text, 't5', max_length, min_length, profile)
+
+    def t5_chunked(self, text, max_length=150, min_length=50, profile=None):
+        return self.summarize(text, 't5_chunked', max_length, min_length, profile)
+
+    def hybrid(self, text, max_length=150, min_length=50, profile=None, model='bart', token_budget=512,
+               ranker='tfidf', splitter='punkt', query=None):
+        # Sentence selection is cheap, so only the condensed text crosses the queue
+        from modules.abstractive import AbstractiveSummarizer
+
+        condensed = AbstractiveSummarizer.condense(text, token_budget, ranker, splitter, query)
+        return self.summarize(condensed, model, max_length, min_length, profile)
@@ -0,0 +1,389 @@
+"""
+Summarization method registry for the Financial Text Summarizer.
+
+Every summarizer the app or the batch tools can run is registered here together
+with its cost class, its tunable parameters and whether its output can be cached.
+Dispatching through the registry means caching and timing apply to every method
+in one place.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from modules.extractive import ExtractiveSummarizer
+from modules.abstractive import AbstractiveSummarizer
+
+# Cost classes, from cheapest to most expensive
+CPU_LIGHT = 'cpu_light'
+CPU_HEAVY = 'cpu_heavy'
+MODEL_BOUND = 'model_bound'
+
+COST_CLASSES = (CPU_LIGHT, CPU_HEAVY, MODEL_BOUND)
+
+
+class SummarizerMethod:
+    """
+    Description of a single registered summarization method.
+    """
+
+    def __init__(self, name, label, family, func, cost_class, params,
+                 cacheable=True, description="", batch_func=None, batch_params=None):
+        """
+        Initialize the method description.
+
+        Args:
+            name (str): Registry key, e.g. 'text_rank'
+            label (str): Display name used by the UI, e.g. 'TextRank'
+            family (str): 'extractive' or 'abstractive'
+            func (callable): Called as func(text, **params) and returns the summary
+            cost_class (str): One of CPU_LIGHT, CPU_HEAVY or MODEL_BOUND
+            params (dict): Tunable parameters mapped to their default values
+            cacheable (bool): Whether identical inputs always give identical output
+            description (str): Short human readable description
+            batch_func (callable, optional): Called as batch_func(texts, **params, **batch_params)
+                and returns one summary per text, in one vectorized pass
+            batch_params (dict, optional): Options only batch_func accepts, mapped to the
+                defaults under which it gives the same summaries as func
+        """
+        if cost_class not in COST_CLASSES:
+            raise ValueError(f"Cost class '{cost_class}' not supported. Choose from: {', '.join(COST_CLASSES)}")
+
+        self.name = name
+        self.label = label
+        self.family = family
+        self.func = func
+        self.cost_class = cost_class
+        self.params = dict(params)
+        self.cacheable = cacheable
+        self.description = description
+        self.batch_func = batch_func
+        self.batch_params = dict(batch_params or {})
+
+    def resolve_params(self, **overrides):
+        """
+        Merge caller supplied parameters with the method defaults.
+
+        Parameters the method does not declare are ignored, so callers can pass
+        one shared parameter set to every method.
+
+        Args:
+            **overrides: Parameter values supplied by the caller
+
+        Returns:
+            dict: The full parameter set for this method
+        """
+        params = dict(self.params)
+        for key, value in overrides.items():
+            if key in params and value is not None:
+                params[key] = value
+        return params
+
+    def __repr__(self):
+        return f"SummarizerMethod(name={self.name!r}, cost_class={self.cost_class!r})"
+
+
+class SummarizerRegistry:
+    """
+    Registry of summarization methods with shared result caching and timing.
+    """
+
+    def __init__(self, extractive=None, abstractive=None, cache_size=256):
+        """
+        Initialize the registry with the built-in methods.
+
+        Args:
+            extractive (ExtractiveSummarizer, optional): Extractive backend
+            abstractive (AbstractiveSummarizer, optional): Abstractive backend; sharing
+                one instance keeps the lazily loaded models cached
+            cache_size (int): Maximum number of summaries kept in the result cache
+        """
+        self.extractive = extractive if extractive is not None else ExtractiveSummarizer()
+        self.abstractive = abstractive if abstractive is not None else AbstractiveSummarizer()
+        self.cache_size = cache_size
+
+        self._methods = OrderedDict()
+        self._cache = OrderedDict()
+        self._stats = {}
+
+        # Guards the cache and stats; sessions share the registry across threads
+        self._lock = threading.Lock()
+
+        self._register_defaults()
+
+    def _register_defaults(self):
+        """
+        Register the extractive and abstractive methods shipped with the app.
+        """
+        extractive_params = {'num_sentences': 5, 'splitter': 'punkt'}
+        abstractive_params = {'max_length': 150, 'min_length': 50, 'profile': None}
+
+        self.register(SummarizerMethod(
+            'text_rank', 'TextRank', 'extractive', self.extractive.text_rank,
+            CPU_HEAVY, extractive_params,
+            description="Graph-based ranking of sentences"
+        ))
+        self.register(SummarizerMethod(
+            'lex_rank', 'LexRank', 'extractive', self.extractive.lex_rank,
+            CPU_HEAVY, extractive_params,
+            description="Graph-based ranking using cosine similarity"
+        ))
+        self.register(SummarizerMethod(
+            'lsa', 'LSA', 'extractive', self.extractive.lsa,
+            CPU_HEAVY, extractive_params,
+            description="Latent Semantic Analysis of the term-sentence matrix"
+        ))
+        self.register(SummarizerMethod(
+            'tfidf', 'TF-IDF', 'extractive', self.extractive.tfidf,
+            CPU_LIGHT, extractive_params,
+            description="Sentences ranked by the sum of their TF-IDF weights",
+            batch_func=self.extractive.tfidf_corpus,
+            batch_params={'idf': 'document', 'term_stats': None}
+        ))
+        self.register(SummarizerMethod(
+            'query', 'BM25 (Query)', 'extractive', self.extractive.query,
+            CPU_LIGHT, dict(extractive_params, query=None),
+            description="Sentences most relevant to a query, from a cached BM25 index"
+        ))
+        self.register(SummarizerMethod(
+            'bart', 'BART', 'abstractive', self.abstractive.bart,
+            MODEL_BOUND, abstractive_params,
+            description="facebook/bart-large-cnn"
+        ))
+        self.register(SummarizerMethod(
+            't5', 'T5', 'abstractive', self.abstractive.t5,
+            MODEL_BOUND, abstractive_params,
+            description="t5-small"
+        ))
+        self.register(SummarizerMethod(
+            't5_chunked', 'T5 (Chunked)', 'abstractive', self.abstractive.t5_chunked,
+            MODEL_BOUND, abstractive_params,
+            description="t5-small over consecutive chunks of a long document"
+        ))
+        self.register(SummarizerMethod(
+            'hybrid_bart', 'BART (Hybrid)', 'abstractive',
+            lambda text, **params: self.abstractive.hybrid(text, model='bart', **params),
+            MODEL_BOUND, dict(abstractive_params, token_budget=512, splitter='punkt', query=None),
+            description="BART over the TF-IDF top sentences, or those matching a query, within a token budget"
+        ))
+        self.register(SummarizerMethod(
+            'hybrid_t5', 'T5 (Hybrid)', 'abstractive',
+            lambda text, **params: self.abstractive.hybrid(text, model='t5', **params),
+            MODEL_BOUND, dict(abstractive_params, token_budget=384, splitter='punkt', query=None),
+            description="T5 over the TF-IDF top sentences, or those matching a query, within a token budget"
+        ))
+
+    def register(self, method, replace=False):
+        """
+        Add a method to the registry.
+
+        Args:
+            method (SummarizerMethod): The method to register
+            replace (bool): Whether an existing method with the same name may be replaced
+
+        Returns:
+            SummarizerMethod: The registered method
+        """
+        if method.name in self._methods and not replace:
+            raise ValueError(f"Method '{method.name}' is already registered")
+
+        self._methods[method.name] = method
+        with self._lock:
+            self._stats[method.name] = {'calls': 0, 'cache_hits': 0, 'seconds': 0.0}
+        return method
+
+    def get(self, name):
+        """
+        Look up a method by registry name or display label.
+
+        Args:
+            name (str): Method name ('text_rank') or label ('TextRank')
+
+        Returns:
+            SummarizerMethod: The registered method
+        """
+        if name in self._methods:
+            return self._methods[name]
+
+        for method in self._methods.values():
+            if method.label == name:
+                return method
+
+        raise ValueError(f"Method '{name}' not supported. Choose from: {', '.join(self._methods.keys())}")
+
+    def methods(self, family=None, cost_class=None):
+        """
+        List registered methods, optionally filtered.
+
+        Args:
+            family (str, optional): Only return 'extractive' or 'abstractive' methods
+            cost_class (str, optional): Only return methods of this cost class
+
+        Returns:
+            list: SummarizerMethod objects in registration order
+        """
+        return [
+            method for method in self._methods.values()
+            if (family is None or method.family == family)
+            and (cost_class is None or method.cost_class == cost_class)
+        ]
+
+    @staticmethod
+    def _cache_key(name, text, params):
+        """
+        Build the result cache key for a method call.
+        """
+        digest = hashlib.sha1(text.encode('utf-8')).hexdigest()
+        return (name, digest, tuple(sorted(params.items())))
+
+    def is_cached(self, name, text, **params):
+        """
+        Tell whether a method call would be answered from the result cache.
+
+        Args:
+            name (str): Method name or label
+            text (str): The text to summarize
+            **params: Method parameters
+
+        Returns:
+            bool: True if the summary is already cached
+        """
+        method = self.get(name)
+        if not method.cacheable:
+            return False
+        key = self._cache_key(method.name, text, method.resolve_params(**params))
+        with self._lock:
+            return key in self._cache
+
+    def summarize(self, name, text, **params):
+        """
+        Summarize text with a registered method.
+
+        Args:
+            name (str): Method name or label
+            text (str): The text to summarize
+            **params: Method parameters; undeclared ones are ignored
+
+        Returns:
+            str: The summarized text
+        """
+        method = self.get(name)
+        params = method.resolve_params(**params)
+        key = self._cache_key(method.name, text, params) if method.cacheable else None
+
+        with self._lock:
+            stats = self._stats[method.name]
+            stats['calls'] += 1
+            summary = self._cache.get(key) if key is not None else None
+            if summary is not None:
+                self._cache.move_to_end(key)
+                stats['cache_hits'] += 1
+                return summary
+
+        # Outside the lock, so other sessions are not held up by this call
+        start = time.perf_counter()
+        summary = method.func(text, **params)
+        seconds = time.perf_counter() - start
+
+        with self._lock:
+            stats['seconds'] += seconds
+            if key is not None:
+                self._cache[key] = summary
+                self._cache.move_to_end(key)
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return summary
+
+    def summarize_corpus(self, name, texts, **params):
+        """
+        Summarize many texts with one method, in one pass where the method supports it.
+
+        Methods with a batch function (TF-IDF) also take its batch options, such as
+        idf and term_stats. Results are cached only while those options are at their
+        defaults, where each summary equals the one summarize() gives.
+
+        Args:
+            name (str): Method name or label
+            texts (list): The texts to summarize
+            **params: Method parameters and batch options; undeclared ones are ignored
+
+        Returns:
+            list: One summary per text, in input order
+        """
+        method = self.get(name)
+        if method.batch_func is None:
+            return [self.summarize(method.name, text, **params) for text in texts]
+
+        texts = list(texts)
+        options = dict(method.batch_params)
+        options.update({key: value for key, value in params.items() if key in options and value is not None})
+        params = method.resolve_params(**params)
+        cacheable = method.cacheable and options == method.batch_params
+        keys = [self._cache_key(method.name, text, params) if cacheable else None for text in texts]
+
+        summaries = [None] * len(texts)
+        with self._lock:
+            stats = self._stats[method.name]
+            stats['calls'] += len(texts)
+            for i, key in enumerate(keys):
+                if key is not None and key in self._cache:
+                    self._cache.move_to_end(key)
+                    summaries[i] = self._cache[key]
+                    stats['cache_hits'] += 1
+
+        missing = [i for i, summary in enumerate(summaries) if summary is None]
+        if not missing:
+            return summaries
+
+        start = time.perf_counter()
+        computed = method.batch_func([texts[i] for i in missing], **params, **options)
+        seconds = time.perf_counter() - start
+
+        with self._lock:
+            stats['seconds'] += seconds
+            for i, summary in zip(missing, computed):
+                summaries[i] = summary
+                if keys[i] is not None:
+                    self._cache[keys[i]] = summary
+                    self._cache.move_to_end(keys[i])
+                    if len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+
+        return summaries
+
+    def summarize_many(self, names, text, **params):
+        """
+        Summarize text with several methods.
+
+        Args:
+            names (list): Method names or labels
+            text (str): The text to summarize
+            **params: Shared method parameters
+
+        Returns:
+            OrderedDict: Mapping of method labels to summaries
+        """
+        summaries = OrderedDict()
+        for name in names:
+            method = self.get(name)
+            summaries[method.label] = self.summarize(method.name, text, **params)
+        return summaries
+
+    def stats(self):
+        """
+        Return call counts, cache hits and cumulative compute time per method.
+
+        Returns:
+            dict: Mapping of method names to their statistics
+        """
+        with self._lock:
+            return {name: dict(stats) for name, stats in self._stats.items()}
+
+    def clear_cache(self):
+        """
+        Drop all cached summaries.
+        """
+        with self._lock:
+            self._cache.clear()
@@ -0,0 +1,380 @@
+"""
+Latency-budgeted scheduling of summarization methods for the Financial Text Summarizer.
+
+A cost model predicts the runtime of each method from the document length. The
+scheduler runs the selected methods that fit a per-request deadline, downgrades
+the ones that do not to a cheaper substitute, and reports what it skipped and why.
+
+Usage:
+    python -m modules.scheduler fit --input references.jsonl --output cost_model.json
+    python -m modules.scheduler fit --methods tfidf lsa bart --scales 1 2 4 8 --output cost_model.json
+
+The app loads the fitted model from the file named by FTS_COST_MODEL.
+"""
+
+import argparse
+import json
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+# Rough starting coefficients (seconds, seconds per 1k words, seconds per 1k words squared),
+# used until a model fitted on the deployment hardware is loaded; see main()
+DEFAULT_COEFFICIENTS = {
+    'tfidf': (0.01, 0.02, 0.0),
+    'query': (0.01, 0.03, 0.0),
+    'text_rank': (0.02, 0.05, 0.25),
+    'lex_rank': (0.02, 0.05, 0.20),
+    'lsa': (0.02, 0.05, 0.05),
+    'bart': (2.0, 8.0, 0.0),
+    't5': (0.5, 1.5, 0.0),
+    't5_chunked': (0.5, 2.5, 0.0),
+    'hybrid_bart': (2.0, 8.0, 0.0),
+    'hybrid_t5': (0.5, 1.5, 0.0),
+}
+
+# Abstractive models truncate their input, so their cost stops growing at this many words
+INPUT_WORD_CAPS = {
+    'bart': 1024,
+    't5': 512,
+    't5_chunked': 3200,
+    'hybrid_bart': 400,
+    'hybrid_t5': 300,
+}
+
+# Cheaper substitutes to try, in order, when a method does not fit the budget
+DOWNGRADES = {
+    'bart': ['hybrid_bart', 't5_chunked', 't5'],
+    'hybrid_bart': ['hybrid_t5', 't5'],
+    't5_chunked': ['t5'],
+    'text_rank': ['tfidf'],
+    'lex_rank': ['tfidf'],
+    'lsa': ['tfidf'],
+}
+
+
+class CostModel:
+    """
+    Per-method runtime model of the form a + b*k + c*k^2, where k is the
+    document length in thousands of words.
+    """
+
+    def __init__(self, coefficients=None, word_caps=None, smoothing=0.3):
+        """
+        Initialize the cost model.
+
+        Args:
+            coefficients (dict, optional): Method name mapped to (a, b, c)
+            word_caps (dict, optional): Method name mapped to the input word cap
+            smoothing (float): Weight of each new observation in the online correction
+        """
+        self.coefficients = dict(DEFAULT_COEFFICIENTS if coefficients is None else coefficients)
+        self.word_caps = dict(INPUT_WORD_CAPS if word_caps is None else word_caps)
+        self.smoothing = smoothing
+        self._correction = {}
+
+    def estimate(self, method, num_words):
+        """
+        Estimate the runtime of a method.
+
+        Args:
+            method (str): Registry name of the method
+            num_words (int): Document length in words
+
+        Returns:
+            float: Estimated runtime in seconds
+        """
+        a, b, c = self.coefficients.get(method, (1.0, 1.0, 0.0))
+        k = min(num_words, self.word_caps.get(method, num_words)) / 1000.0
+        return (a + b * k + c * k * k) * self._correction.get(method, 1.0)
+
+    def observe(self, method, num_words, seconds):
+        """
+        Fold an observed runtime into the model.
+
+        Args:
+            method (str): Registry name of the method
+            num_words (int): Document length in words
+            seconds (float): Measured runtime
+        """
+        predicted = self.estimate(method, num_words) / self._correction.get(method, 1.0)
+        if predicted <= 0:
+            return
+
+        ratio = seconds / predicted
+        previous = self._correction.get(method, 1.0)
+        self._correction[method] = (1 - self.smoothing) * previous + self.smoothing * ratio
+
+    def fit(self, samples):
+        """
+        Fit the coefficients from benchmark timings by non-negative least squares.
+
+        Args:
+            samples (list): (method, num_words, seconds) tuples
+
+        Returns:
+            CostModel: self, for chaining
+        """
+        by_method = {}
+        for method, num_words, seconds in samples:
+            by_method.setdefault(method, []).append((num_words, seconds))
+
+        for method, points in by_method.items():
+            cap = self.word_caps.get(method)
+            k = np.array([min(w, cap) if cap else w for w, _ in points], dtype=float) / 1000.0
+            y = np.array([s for _, s in points], dtype=float)
+
+            # Fit the quadratic term only when there are enough distinct lengths
+            degree = 2 if len(np.unique(k)) >= 3 else 1
+            design = np.vander(k, degree + 1, increasing=True)
+            coef, _, _, _ = np.linalg.lstsq(design, y, rcond=None)
+            coef = np.clip(coef, 0.0, None)
+
+            self.coefficients[method] = tuple(coef.tolist()) + (0.0,) * (2 - degree)
+            self._correction.pop(method, None)
+
+        return self
+
+    def save(self, path):
+        """
+        Save the coefficients to a JSON file.
+
+        Args:
+            path (str): Output file path
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'coefficients': self.coefficients, 'word_caps': self.word_caps}, f, indent=2)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a cost model saved with save().
+
+        Args:
+            path (str): Input file path
+
+        Returns:
+            CostModel: The loaded model
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        coefficients = {k: tuple(v) for k, v in data['coefficients'].items()}
+        return cls(coefficients, data.get('word_caps'))
+
+
+def collect_timings(registry, texts, methods=None, repeat=1, **params):
+    """
+    Time registered methods on a set of documents for CostModel.fit.
+
+    Methods are called directly, bypassing the registry result cache.
+
+    Args:
+        registry (SummarizerRegistry): Registry holding the methods
+        texts (list): Documents of varying lengths
+        methods (list, optional): Method names; defaults to every registered method
+        repeat (int): Number of timed runs per document
+        **params: Method parameters
+
+    Returns:
+        list: (method, num_words, seconds) tuples
+    """
+    names = methods or [method.name for method in registry.methods()]
+    samples = []
+
+    for name in names:
+        method = registry.get(name)
+        method_params = method.resolve_params(**params)
+
+        # Warm up once so model loading is not counted as runtime
+        if texts:
+            method.func(texts[0], **method_params)
+
+        for text in texts:
+            num_words = len(text.split())
+            for _ in range(repeat):
+                start = time.perf_counter()
+                method.func(text, **method_params)
+                samples.append((method.name, num_words, time.perf_counter() - start))
+
+    return samples
+
+
+class ScheduleResult:
+    """
+    Outcome of a scheduled summarization request.
+
+    `assisted` maps the label of each method that ran assisted decoding in this
+    request to its statistics; cached results did not decode and are absent.
+    """
+
+    def __init__(self):
+        self.summaries = OrderedDict()
+        self.timings = OrderedDict()
+        self.assisted = OrderedDict()
+        self.downgraded = OrderedDict()
+        self.skipped = OrderedDict()
+        self.deferred = []
+
+    def __repr__(self):
+        return (f"ScheduleResult(ran={list(self.summaries)}, downgraded={dict(self.downgraded)}, "
+                f"skipped={list(self.skipped)})")
+
+
+class LatencyScheduler:
+    """
+    Runs registry methods under a per-request latency budget.
+    """
+
+    def __init__(self, registry, cost_model=None, downgrades=None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            registry (SummarizerRegistry): Registry used to run the methods
+            cost_model (CostModel, optional): Runtime model; defaults to CostModel()
+            downgrades (dict, optional): Method name mapped to substitutes to try
+        """
+        self.registry = registry
+        self.cost_model = cost_model if cost_model is not None else CostModel()
+        self.downgrades = DOWNGRADES if downgrades is None else downgrades
+
+    def estimate(self, name, text, **params):
+        """
+        Estimate the runtime of a method call, counting cached results as free.
+
+        Args:
+            name (str): Method name or label
+            text (str): The text to summarize
+            **params: Method parameters
+
+        Returns:
+            float: Estimated runtime in seconds
+        """
+        method = self.registry.get(name)
+        if self.registry.is_cached(method.name, text, **params):
+            return 0.0
+        return self.cost_model.estimate(method.name, len(text.split()))
+
+    def run(self, names, text, deadline, defer=False, **params):
+        """
+        Run the requested methods, fitting them into the deadline.
+
+        Methods run cheapest first. Before each one the remaining budget is
+        re-checked against the estimate; a method that does not fit is replaced
+        by the first substitute that does, or skipped (or deferred) otherwise.
+
+        Args:
+            names (list): Method names or labels requested by the user
+            text (str): The text to summarize
+            deadline (float): Latency budget in seconds
+            defer (bool): Return methods that do not fit in result.deferred
+                instead of dropping them
+            **params: Shared method parameters
+
+        Returns:
+            ScheduleResult: Summaries keyed by label, plus the scheduling report
+        """
+        result = ScheduleResult()
+        num_words = len(text.split())
+        requested = [self.registry.get(name).name for name in names]
+        planned = set(requested)
+        start = time.perf_counter()
+
+        for name in sorted(requested, key=lambda n: self.estimate(n, text, **params)):
+            remaining = deadline - (time.perf_counter() - start)
+            estimate = self.estimate(name, text, **params)
+            chosen = name
+
+            if estimate > remaining:
+                chosen = None
+                for substitute in self.downgrades.get(name, []):
+                    if substitute in planned:
+                        continue
+                    if self.estimate(substitute, text, **params) <= remaining:
+                        chosen = substitute
+                        break
+
+                if chosen is None:
+                    reason = f"estimated {estimate:.1f}s exceeds remaining budget of {max(remaining, 0):.1f}s"
+                    if defer:
+                        result.deferred.append(name)
+                    result.skipped[name] = reason
+                    continue
+
+                result.downgraded[name] = chosen
+                planned.add(chosen)
+
+            method = self.registry.get(chosen)
+            cached = self.registry.is_cached(chosen, text, **params)
+
+            # Decoding statistics are per thread; clear them so only this call's are read back
+            backend = self.registry.abstractive
+            track_stats = method.family == 'abstractive' and hasattr(backend, 'clear_last_stats')
+            if track_stats:
+                backend.clear_last_stats()
+
+            run_start = time.perf_counter()
+            result.summaries[method.label] = self.registry.summarize(chosen, text, **params)
+            elapsed = time.perf_counter() - run_start
+            result.timings[method.label] = elapsed
+
+            if track_stats and backend.last_assisted_stats:
+                result.assisted[method.label] = backend.last_assisted_stats
+
+            if not cached:
+                self.cost_model.observe(chosen, num_words, elapsed)
+
+        return result
+
+
+def scaled_texts(texts, scales=(1, 2, 4, 8)):
+    """
+    Build documents of several lengths by repeating each text.
+
+    Args:
+        texts (list): Source documents
+        scales (tuple): Copies of each document to join
+
+    Returns:
+        list: One document per text and scale
+    """
+    return [" ".join([text] * scale) for scale in scales for text in texts]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fit the scheduler's cost model on this machine")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    fit = subparsers.add_parser('fit', help="Time the methods on a reference set and fit the cost model")
+    fit.add_argument('--input')
+    fit.add_argument('--output', required=True)
+    fit.add_argument('--methods', nargs='+')
+    fit.add_argument('--scales', nargs='+', type=int, default=[1, 2, 4, 8])
+    fit.add_argument('--repeat', type=int, default=1)
+    fit.add_argument('--num-sentences', type=int, default=5)
+    fit.add_argument('--max-length', type=int, default=150)
+
+    args = parser.parse_args(argv)
+
+    from modules.benchmarks import load_reference_set
+    from modules.registry import SummarizerRegistry
+
+    registry = SummarizerRegistry()
+    texts = scaled_texts([text for _, text, _ in load_reference_set(args.input)], args.scales)
+    samples = collect_timings(
+        registry, texts, methods=args.methods, repeat=args.repeat,
+        num_sentences=args.num_sentences, max_length=args.max_length
+    )
+
+    cost_model = CostModel().fit(samples)
+    cost_model.save(args.output)
+    for method in sorted({method for method, _, _ in samples}):
+        a, b, c = cost_model.coefficients[method]
+        print(f"{method}: {a:.4f}s + {b:.4f}s/1k words + {c:.4f}s/(1k words)^2")
+    print(f"Saved cost model to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,9 +1,46 @@
 """
 Custom CSS styles for the retro gaming aesthetic in the Financial Text Summarizer.
+
+Usage:
+    python -m modules.styles fonts          # download the fonts into static/fonts
+    python -m modules.styles fonts --check  # list font files that are missing
 """
 
+import argparse
+import hashlib
+import os
+import sys
+import urllib.request
+from functools import lru_cache
+
 import streamlit as st
 
+# Stylesheet served by Streamlit from the app's static directory
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'static')
+STYLESHEET = 'retro.css'
+FONTS_DIR = os.path.join(STATIC_DIR, 'fonts')
+
+# Font files linked by retro.css and their licences, from the google/fonts repository (SIL OFL 1.1)
+FONT_SOURCES = {
+    'VT323-Regular.ttf': 'https://raw.githubusercontent.com/google/fonts/main/ofl/vt323/VT323-Regular.ttf',
+    'VT323-OFL.txt': 'https://raw.githubusercontent.com/google/fonts/main/ofl/vt323/OFL.txt',
+    'SpaceMono-Regular.ttf': 'https://raw.githubusercontent.com/google/fonts/main/ofl/spacemono/SpaceMono-Regular.ttf',
+    'SpaceMono-OFL.txt': 'https://raw.githubusercontent.com/google/fonts/main/ofl/spacemono/OFL.txt',
+}
+
+
+@lru_cache(maxsize=1)
+def _stylesheet():
+    """
+    Read the stylesheet once per process.
+    
+    Returns:
+        tuple: (CSS text, short content hash used to bust browser caches)
+    """
+    with open(os.path.join(STATIC_DIR, STYLESHEET), 'r', encoding='utf-8') as f:
+        css = f.read()
+    return css, hashlib.blake2b(css.encode('utf-8'), digest_size=6).hexdigest()
+
 
 class RetroStyles:
     """
@@ -25,170 +62,31 @@ class RetroStyles:
         "LSA": "#F9C80E",       # Yellow
         "TF-IDF": "#D65108",    # Orange
         "BART": "#3A86FF",      # Blue
-        "T5": "#8338EC"         # Purple
+        "T5": "#8338EC",        # Purple
+        "T5 (Chunked)": "#B388EB", # Lavender
+        "BART (Hybrid)": "#8AB6FF", # Light blue
+        "T5 (Hybrid)": "#C77DFF"   # Violet
     }
     
     @classmethod
     def apply_styles(cls):
         """
         Apply the retro gaming CSS styles to the Streamlit app.
-        """
-        st.markdown(f"""
-        <style>
-        @import url('https://fonts.googleapis.com/css2?family=VT323&family=Space+Mono&display=swap');
-        
-        /* Main styles */
-        .main {{
-            background-color: {cls.BACKGROUND_COLOR};
-            color: {cls.TEXT_COLOR};
-            font-family: 'Space Mono', monospace;
-            padding: 0;
-        }}
-        
-        /* Headings */
-        h1, h2, h3, h4, h5, h6 {{
-            font-family: 'VT323', monospace;
-            color: {cls.PRIMARY_COLOR};
-            text-shadow: 3px 3px 0px {cls.SECONDARY_COLOR};
-            letter-spacing: 2px;
-        }}
-        
-        /* Buttons */
-        .stButton button {{
-            background-color: {cls.TERTIARY_COLOR};
-            color: {cls.TEXT_COLOR};
-            border: 2px solid {cls.HIGHLIGHT_COLOR};
-            border-radius: 0;
-            font-family: 'VT323', monospace;
-            font-size: 18px;
-            padding: 8px 16px;
-            box-shadow: 4px 4px 0px {cls.HIGHLIGHT_COLOR};
-            transition: transform 0.1s, box-shadow 0.1s;
-        }}
-        
-        .stButton button:hover {{
-            transform: translate(2px, 2px);
-            box-shadow: 2px 2px 0px {cls.HIGHLIGHT_COLOR};
-        }}
-        
-        /* Text areas and inputs */
-        .stTextInput input, .stTextArea textarea, .stSelectbox, div[data-baseweb="select"] div {{
-            background-color: {cls.BACKGROUND_COLOR};
-            color: {cls.TEXT_COLOR};
-            border: 2px solid {cls.SECONDARY_COLOR};
-            border-radius: 0;
-            font-family: 'Space Mono', monospace;
-        }}
-        
-        /* Cards for summaries */
-        .summary-card {{
-            background-color: {cls.BACKGROUND_COLOR};
-            border: 2px solid {cls.PRIMARY_COLOR};
-            padding: 10px;
-            margin: 10px 0;
-            box-shadow: 5px 5px 0px {cls.HIGHLIGHT_COLOR};
-        }}
-        
-        .summary-card-title {{
-            font-family: 'VT323', monospace;
-            color: {cls.SECONDARY_COLOR};
-            font-size: 22px;
-            margin-bottom: 10px;
-            border-bottom: 2px solid {cls.SECONDARY_COLOR};
-            padding-bottom: 5px;
-        }}
-        
-        /* Loading animation */
-        .stProgress .st-bo {{
-            background-color: {cls.PRIMARY_COLOR};
-        }}
-        
-        /* Tables */
-        .dataframe {{
-            font-family: 'Space Mono', monospace;
-            border: 2px solid {cls.TERTIARY_COLOR};
-        }}
-        
-        .dataframe thead {{
-            background-color: {cls.TERTIARY_COLOR};
-            color: {cls.TEXT_COLOR};
-        }}
-        
-        /* Custom pixelated container */
-        .pixel-container {{
-            border: 4px solid {cls.PRIMARY_COLOR};
-            background-color: rgba(26, 26, 46, 0.7);
-            padding: 20px;
-            margin: 10px 0;
-            position: relative;
-        }}
-        
-        .pixel-container::before {{
-            content: '';
-            position: absolute;
-            top: -8px;
-            left: -8px;
-            right: -8px;
-            bottom: -8px;
-            border: 2px solid {cls.SECONDARY_COLOR};
-            z-index: -1;
-        }}
-        
-        /* For tabs */
-        .stTabs [data-baseweb="tab-list"] {{
-            gap: 2px;
-        }}
-        
-        .stTabs [data-baseweb="tab"] {{
-            background-color: {cls.BACKGROUND_COLOR};
-            border: 2px solid {cls.PRIMARY_COLOR};
-            border-radius: 0;
-            color: {cls.PRIMARY_COLOR};
-            font-family: 'VT323', monospace;
-            padding: 5px 15px;
-        }}
-        
-        .stTabs [aria-selected="true"] {{
-            background-color: {cls.PRIMARY_COLOR};
-            color: {cls.TEXT_COLOR};
-        }}
-        
-        /* Scoreboard style */
-        .scoreboard {{
-            background-color: {cls.BACKGROUND_COLOR};
-            border: 3px solid {cls.HIGHLIGHT_COLOR};
-            padding: 10px;
-            font-family: 'VT323', monospace;
-            color: {cls.HIGHLIGHT_COLOR};
-            margin: 10px 0;
-            text-align: center;
-        }}
         
-        .scoreboard-title {{
-            font-size: 24px;
-            margin-bottom: 5px;
-        }}
-        
-        .scoreboard-value {{
-            font-size: 36px;
-            color: {cls.SECONDARY_COLOR};
-        }}
-        
-        /* Pixel animation for loading */
-        @keyframes pixel-move {{
-            0% {{ transform: translateX(0); }}
-            100% {{ transform: translateX(20px); }}
-        }}
+        The styles live in static/retro.css. With Streamlit's static file serving
+        enabled, each rerun only sends a <link> tag and the browser reuses its
+        cached copy of the stylesheet; the version parameter changes whenever the
+        file does. Otherwise the stylesheet is inlined.
+        """
+        css, version = _stylesheet()
         
-        .pixel-loading {{
-            font-family: 'VT323', monospace;
-            font-size: 24px;
-            color: {cls.PRIMARY_COLOR};
-            display: inline-block;
-            animation: pixel-move 0.5s infinite alternate;
-        }}
-        </style>
-        """, unsafe_allow_html=True)
+        if st.get_option("server.enableStaticServing"):
+            st.markdown(
+                f'<link rel="stylesheet" href="app/static/{STYLESHEET}?v={version}">',
+                unsafe_allow_html=True
+            )
+        else:
+            st.markdown(f"<style>\n{css}</style>", unsafe_allow_html=True)
     
     @classmethod
     def create_title(cls):
@@ -311,4 +209,64 @@ class RetroStyles:
                 FINANCIAL TEXT SUMMARIZER 3000 © 2025 - INSERT COIN TO CONTINUE
             </p>
         </div>
-        """
\ No newline at end of file
+        """
+
+
+def missing_fonts(directory=FONTS_DIR):
+    """
+    List the font files and licences that are not in the fonts directory.
+
+    Args:
+        directory (str): Directory served at app/static/fonts
+
+    Returns:
+        list: Missing file names
+    """
+    return [name for name in FONT_SOURCES if not os.path.exists(os.path.join(directory, name))]
+
+
+def fetch_fonts(directory=FONTS_DIR, timeout=30):
+    """
+    Download the missing font files and licences, to be committed with the app.
+
+    Run once on a machine with internet access; deployments then serve the
+    fonts from static/fonts without any outbound request.
+
+    Args:
+        directory (str): Directory served at app/static/fonts
+        timeout (float): Seconds to wait for each download
+
+    Returns:
+        list: Names of the files written
+    """
+    written = []
+    for name in missing_fonts(directory):
+        with urllib.request.urlopen(FONT_SOURCES[name], timeout=timeout) as response:
+            data = response.read()
+        with open(os.path.join(directory, name), 'wb') as f:
+            f.write(data)
+        written.append(name)
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage the retro stylesheet's font files")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    fonts = subparsers.add_parser('fonts', help="Download VT323 and Space Mono into static/fonts")
+    fonts.add_argument('--check', action='store_true', help="Only list missing files")
+
+    args = parser.parse_args(argv)
+
+    if args.check:
+        missing = missing_fonts()
+        for name in missing:
+            print(f"Missing {name}")
+        sys.exit(1 if missing else 0)
+
+    for name in fetch_fonts():
+        print(f"Wrote {os.path.join(FONTS_DIR, name)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,321 @@
+"""
+Memory-bounded corpus term statistics for the Financial Text Summarizer.
+
+Document frequencies over an unbounded news stream are kept in a count-min
+sketch: a fixed table of counters, so memory does not grow with the vocabulary
+(tickers, names, numbers). Counts are never underestimated, and overestimated
+by at most about e / width of all (document, term) pairs counted, with high
+probability. A heavy-hitters table lists the most frequent terms with their counts.
+
+Sketches built by separate workers over the same settings can be merged by
+adding their tables, and are saved to and loaded from a single .npz file.
+
+Usage:
+    python -m modules.term_stats build --input shard0.jsonl --output shard0.npz
+    python -m modules.term_stats merge shard0.npz shard1.npz --output corpus.npz
+    python -m modules.term_stats top --stats corpus.npz --limit 20
+"""
+
+import argparse
+import hashlib
+import json
+from functools import lru_cache
+
+import numpy as np
+
+from modules.extractive import TERM_PATTERN, ENGLISH_STOP_WORDS
+
+
+@lru_cache(maxsize=1 << 16)
+def _term_hashes(term, seed):
+    """
+    Two independent 32-bit hashes of a term, stable across processes.
+    """
+    digest = hashlib.blake2b(term.encode('utf-8'), digest_size=8, key=seed.to_bytes(8, 'little')).digest()
+    # The second hash is odd, so the probe sequence h1 + i * h2 does not repeat early
+    return int.from_bytes(digest[:4], 'little'), int.from_bytes(digest[4:], 'little') | 1
+
+
+def document_terms(text):
+    """
+    Split a document into its distinct terms, as TfidfVectorizer(stop_words='english') would.
+
+    Args:
+        text (str): The document
+
+    Returns:
+        set: Distinct lowercased terms without English stopwords
+    """
+    return {term for term in TERM_PATTERN.findall(text.lower()) if term not in ENGLISH_STOP_WORDS}
+
+
+class TermStatistics:
+    """
+    Approximate document frequencies in fixed memory.
+    """
+
+    def __init__(self, width=1 << 18, depth=4, heavy_hitters=10000, seed=0):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            width (int): Counters per row; the overestimate is at most about e / width of the
+                (document, term) pairs counted
+            depth (int): Rows; the overestimate bound fails with probability about e^-depth
+            heavy_hitters (int): Number of most frequent terms tracked by name
+            seed (int): Hash seed; only sketches with the same seed can be merged
+        """
+        self.width = width
+        self.depth = depth
+        self.heavy_hitters = heavy_hitters
+        self.seed = seed
+        self.num_documents = 0
+        self.table = np.zeros((depth, width), dtype=np.uint32)
+        self.heavy = {}
+
+        # Smallest count that was kept at the last pruning of the heavy-hitters table
+        self._heavy_floor = 0
+        self._rows = np.arange(depth)[:, None]
+
+    @property
+    def nbytes(self):
+        return self.table.nbytes
+
+    def _columns(self, terms):
+        """
+        Counter column of each term in every row, shape (depth, len(terms)).
+        """
+        hashes = np.array([_term_hashes(term, self.seed) for term in terms], dtype=np.int64).reshape(-1, 2)
+        return (hashes[:, 0] + self._rows * hashes[:, 1]) % self.width
+
+    def update(self, text):
+        """
+        Count one document.
+
+        Args:
+            text (str): The document
+        """
+        self.update_terms(document_terms(text))
+
+    def update_terms(self, terms):
+        """
+        Count one document given its distinct terms.
+
+        Uses the conservative update: each counter is only raised as far as the
+        new minimum estimate, which keeps overestimates well below the plain sketch.
+
+        Args:
+            terms (iterable): Distinct terms of the document
+        """
+        terms = list(terms)
+        self.num_documents += 1
+        if not terms:
+            return
+
+        columns = self._columns(terms)
+        estimates = self.table[self._rows, columns].min(axis=0) + 1
+        # maximum.at, because two terms of one document may share a counter
+        np.maximum.at(self.table, (np.broadcast_to(self._rows, columns.shape), columns), estimates)
+
+        self._track(terms, estimates)
+
+    def update_many(self, texts):
+        """
+        Count many documents.
+
+        Args:
+            texts (iterable): Documents
+
+        Returns:
+            TermStatistics: self, for chaining
+        """
+        for text in texts:
+            self.update(text)
+        return self
+
+    def _track(self, terms, estimates):
+        """
+        Update the heavy-hitters table with fresh estimates.
+        """
+        for term, estimate in zip(terms, estimates.tolist()):
+            if term in self.heavy or estimate > self._heavy_floor:
+                self.heavy[term] = estimate
+
+        # Let the table grow to twice its size, then keep the most frequent half
+        if len(self.heavy) > 2 * self.heavy_hitters:
+            self._prune()
+
+    def _prune(self):
+        kept = sorted(self.heavy.items(), key=lambda item: -item[1])[:self.heavy_hitters]
+        self.heavy = dict(kept)
+        self._heavy_floor = kept[-1][1] if len(kept) == self.heavy_hitters else 0
+
+    def document_frequencies(self, terms):
+        """
+        Estimate the number of documents containing each term.
+
+        Args:
+            terms (list): Terms to look up
+
+        Returns:
+            np.ndarray: One estimate per term; never below the true count
+        """
+        if not len(terms):
+            return np.zeros(0, dtype=np.int64)
+        return self.table[self._rows, self._columns(terms)].min(axis=0).astype(np.int64)
+
+    def document_frequency(self, term):
+        """
+        Estimate the number of documents containing a term.
+
+        Args:
+            term (str): The term
+
+        Returns:
+            int: Estimated document frequency
+        """
+        return int(self.document_frequencies([term])[0])
+
+    def idf(self, terms):
+        """
+        Corpus IDF of each term, smoothed like TfidfVectorizer.
+
+        Args:
+            terms (list): Terms to weight
+
+        Returns:
+            np.ndarray: log((1 + N) / (1 + df)) + 1 per term, N being the documents seen
+        """
+        doc_freq = self.document_frequencies(terms)
+        return np.log((1 + self.num_documents) / (1 + doc_freq)) + 1
+
+    def top(self, limit=20):
+        """
+        List the most frequent terms.
+
+        Args:
+            limit (int): Number of terms
+
+        Returns:
+            list: (term, estimated document frequency) pairs, most frequent first
+        """
+        return sorted(self.heavy.items(), key=lambda item: -item[1])[:limit]
+
+    def merge(self, other):
+        """
+        Add the counts of another sketch built with the same settings.
+
+        Args:
+            other (TermStatistics): Sketch from another worker or shard
+
+        Returns:
+            TermStatistics: self, for chaining
+        """
+        if (self.width, self.depth, self.seed) != (other.width, other.depth, other.seed):
+            raise ValueError(
+                f"Cannot merge sketches with different settings: "
+                f"{(self.width, self.depth, self.seed)} and {(other.width, other.depth, other.seed)}"
+            )
+
+        self.table += other.table
+        self.num_documents += other.num_documents
+
+        # Re-estimate the candidates of both tables against the merged counts
+        candidates = list(self.heavy.keys() | other.heavy.keys())
+        self.heavy = dict(zip(candidates, self.document_frequencies(candidates).tolist()))
+        self._heavy_floor = 0
+        if len(self.heavy) > self.heavy_hitters:
+            self._prune()
+        return self
+
+    def save(self, path):
+        """
+        Save the sketch to an .npz file.
+
+        Args:
+            path (str): Output file path
+        """
+        terms = list(self.heavy)
+        # Through a file object, so numpy does not append .npz to the path
+        with open(path, 'wb') as f:
+            np.savez_compressed(
+                f,
+                table=self.table,
+                settings=np.array([self.width, self.depth, self.heavy_hitters, self.seed, self.num_documents,
+                                   self._heavy_floor], dtype=np.int64),
+                heavy_terms=np.array(terms, dtype=str),
+                heavy_counts=np.array([self.heavy[term] for term in terms], dtype=np.int64)
+            )
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a sketch saved with save().
+
+        Args:
+            path (str): Input file path
+
+        Returns:
+            TermStatistics: The loaded sketch
+        """
+        with np.load(path, allow_pickle=False) as data:
+            width, depth, heavy_hitters, seed, num_documents, heavy_floor = data['settings'].tolist()
+            stats = cls(width, depth, heavy_hitters, seed)
+            stats.table = data['table'].astype(np.uint32)
+            stats.num_documents = num_documents
+            stats.heavy = dict(zip(data['heavy_terms'].tolist(), data['heavy_counts'].tolist()))
+            stats._heavy_floor = heavy_floor
+        return stats
+
+    def __repr__(self):
+        return (f"TermStatistics(documents={self.num_documents}, width={self.width}, depth={self.depth}, "
+                f"heavy={len(self.heavy)})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Corpus document frequencies in a count-min sketch")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build = subparsers.add_parser('build', help="Count a JSON Lines corpus")
+    build.add_argument('--input', required=True)
+    build.add_argument('--output', required=True)
+    build.add_argument('--update', help="Existing sketch to add the corpus to")
+    build.add_argument('--width', type=int, default=1 << 18)
+    build.add_argument('--depth', type=int, default=4)
+    build.add_argument('--heavy-hitters', type=int, default=10000)
+
+    merge = subparsers.add_parser('merge', help="Merge sketches built by separate workers")
+    merge.add_argument('inputs', nargs='+')
+    merge.add_argument('--output', required=True)
+
+    top = subparsers.add_parser('top', help="Print the most frequent terms")
+    top.add_argument('--stats', required=True)
+    top.add_argument('--limit', type=int, default=20)
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        if args.update:
+            stats = TermStatistics.load(args.update)
+        else:
+            stats = TermStatistics(args.width, args.depth, args.heavy_hitters)
+        with open(args.input, 'r', encoding='utf-8') as f:
+            stats.update_many(json.loads(line)['text'] for line in f if line.strip())
+        stats.save(args.output)
+        print(stats)
+
+    elif args.command == 'merge':
+        stats = TermStatistics.load(args.inputs[0])
+        for path in args.inputs[1:]:
+            stats.merge(TermStatistics.load(path))
+        stats.save(args.output)
+        print(stats)
+
+    else:
+        stats = TermStatistics.load(args.stats)
+        for term, count in stats.top(args.limit):
+            print(f"{term}\t{count}")
+
+
+if __name__ == '__main__':
+    main()
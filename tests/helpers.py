@@ -0,0 +1,33 @@
+"""
+Shared helpers for the test suite.
+"""
+
+import sys
+import threading
+
+
+def run_threads(target, count=8):
+    """
+    Start target(index) on `count` threads at once, switching between them as often as possible.
+    """
+    errors = []
+    barrier = threading.Barrier(count)
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    def run(index):
+        barrier.wait()
+        try:
+            target(index)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(count)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    return errors
@@ -0,0 +1,77 @@
+import threading
+import time
+
+import modules.abstractive as abstractive
+from modules.abstractive import AbstractiveSummarizer, InferenceSlots
+
+from tests.helpers import run_threads
+
+
+def test_models_load_once_under_concurrent_requests(monkeypatch):
+    loads = []
+
+    def pipeline(task, model, **kwargs):
+        loads.append(model)
+        time.sleep(0.2)
+        return object()
+
+    monkeypatch.setattr(abstractive, 'pipeline', pipeline)
+    summarizer = AbstractiveSummarizer()
+
+    def load(index):
+        load_model = summarizer._get_bart_summarizer if index % 2 else summarizer._get_t5_summarizer
+        assert load_model() is not None
+
+    assert run_threads(load) == []
+    assert sorted(loads) == ['facebook/bart-large-cnn', 't5-small']
+
+
+def test_inference_slots_admit_in_arrival_order():
+    slots = InferenceSlots(1)
+    order = []
+    slots.acquire()
+
+    threads = []
+    for index in range(6):
+        def wait(index=index):
+            slots.acquire()
+            order.append(index)
+            slots.release()
+        thread = threading.Thread(target=wait)
+        thread.start()
+        threads.append(thread)
+        # Let each thread queue up before the next one arrives
+        time.sleep(0.02)
+
+    slots.release()
+    for thread in threads:
+        thread.join()
+    assert order == list(range(6))
+
+
+def test_inference_concurrency_limit_and_wait_metrics():
+    summarizer = AbstractiveSummarizer(max_concurrency=2)
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def infer(index):
+        with summarizer._inference_slot('bart'):
+            with lock:
+                running.append(index)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(index)
+        assert summarizer.last_inference_stats['model'] == 'bart'
+
+    assert run_threads(infer, count=6) == []
+    assert max(peak) == 2
+
+    stats = summarizer.inference_stats()['bart']
+    assert stats['requests'] == 6
+    assert stats['waiting'] == stats['running'] == 0
+    # Six requests through two slots run in three waves, so later ones queued
+    assert stats['max_wait_seconds'] >= 0.05
+    assert stats['compute_seconds'] >= 6 * 0.05
+    assert 0 < stats['wait_share'] < 1
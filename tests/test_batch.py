@@ -0,0 +1,92 @@
+import glob
+import time
+
+import pytest
+
+from modules.batch import BatchWorker, WorkQueue
+from modules.registry import SummarizerRegistry
+from modules.term_stats import TermStatistics
+
+from tests.test_extractive import DOCUMENTS
+
+POISON = "This filing cannot be summarized."
+
+
+@pytest.fixture
+def queue_path(tmp_path):
+    path = str(tmp_path / 'queue.db')
+    queue = WorkQueue(path)
+    documents = [(f"doc{i}", text, None) for i, text in enumerate(DOCUMENTS)]
+    queue.enqueue(documents + [('poison', POISON + " " + DOCUMENTS[0], None)])
+    queue.close()
+    return path
+
+
+@pytest.fixture
+def poison_summaries(monkeypatch):
+    summarize = SummarizerRegistry.summarize
+
+    def poisoned(self, name, text, **params):
+        if POISON in text:
+            raise RuntimeError("model crashed")
+        return summarize(self, name, text, **params)
+
+    monkeypatch.setattr(SummarizerRegistry, 'summarize', poisoned)
+
+
+def test_failing_document_is_retried_then_marked_failed(queue_path, poison_summaries):
+    worker = BatchWorker(queue_path, ['lsa'], worker_id='w1', max_attempts=2, num_sentences=2)
+    assert worker.run() == len(DOCUMENTS)
+
+    queue = WorkQueue(queue_path)
+    assert queue.progress() == {'done': len(DOCUMENTS), 'failed': 1}
+    assert queue.failures() == [('poison', 2, "RuntimeError: model crashed")]
+
+    # Failed documents are not claimed again
+    assert queue.claim('w2') == []
+    queue.close()
+
+
+def test_expired_lease_after_last_attempt_marks_failed(queue_path):
+    queue = WorkQueue(queue_path, lease_seconds=0, max_attempts=1)
+    claimed = queue.claim('crashed', limit=100)
+    assert len(claimed) == len(DOCUMENTS) + 1
+
+    time.sleep(0.01)
+    assert queue.claim('w2') == []
+    assert queue.progress() == {'failed': len(DOCUMENTS) + 1}
+    assert queue.failures()[0][2] == 'lease expired'
+    queue.close()
+
+
+def test_renewal_keeps_the_claim_and_lost_leases_are_not_published(queue_path):
+    queue = WorkQueue(queue_path, lease_seconds=0.05)
+    doc_id = queue.claim('w1', limit=1)[0][0]
+
+    time.sleep(0.03)
+    assert queue.renew('w1', [doc_id]) == {doc_id}
+    time.sleep(0.03)
+    # Renewed, so still held by w1
+    assert doc_id not in [row[0] for row in queue.claim('w2', limit=100)]
+
+    other = WorkQueue(queue_path, lease_seconds=0.05)
+    time.sleep(0.06)
+    reclaimed = [row[0] for row in other.claim('w3', limit=100)]
+    assert doc_id in reclaimed
+
+    result = [{'method': 'lsa', 'summary': 'late', 'seconds': 1.0}]
+    assert queue.renew('w1', [doc_id]) == set()
+    assert not queue.complete('w1', doc_id, result)
+    assert other.complete('w3', doc_id, result)
+    assert queue.results_frame()['worker'].tolist() == ['w3']
+    queue.close()
+    other.close()
+
+
+def test_worker_counts_terms_of_completed_documents_only(queue_path, tmp_path, poison_summaries):
+    term_stats = str(tmp_path / 'terms.npz')
+    BatchWorker(queue_path, ['lsa'], worker_id='w1', term_stats=term_stats, max_attempts=3).run()
+
+    paths = glob.glob(str(tmp_path / 'terms.*.npz'))
+    assert len(paths) == 1
+    assert TermStatistics.load(paths[0]).num_documents == len(DOCUMENTS)
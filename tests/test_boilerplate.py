@@ -0,0 +1,52 @@
+import json
+import warnings
+
+import pytest
+
+from modules.boilerplate import BoilerplateFilter, main
+
+DISCLAIMER = "Acme Corp. and its subsidiaries publish this update every quarter for holders of record."
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    path = tmp_path / 'corpus.jsonl'
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(4):
+            text = f"Revenue rose {i + 3}% in the quarter. {DISCLAIMER} Margins improved."
+            f.write(json.dumps({'doc_id': str(i), 'text': text}) + "\n")
+    return path
+
+
+@pytest.mark.parametrize('splitter', ['punkt', 'finance'])
+def test_learn_records_the_splitter(corpus, tmp_path, splitter):
+    output = tmp_path / 'boilerplate.json'
+    main(['learn', '--input', str(corpus), '--output', str(output), '--splitter', splitter])
+
+    with open(output, 'r', encoding='utf-8') as f:
+        assert json.load(f)['splitter'] == splitter
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        loaded = BoilerplateFilter.load(str(output), splitter=splitter)
+    assert loaded.splitter == splitter
+    assert BoilerplateFilter.load(str(output)).splitter == splitter
+
+
+def test_load_warns_on_a_different_splitter(corpus, tmp_path):
+    output = tmp_path / 'boilerplate.json'
+    main(['learn', '--input', str(corpus), '--output', str(output), '--splitter', 'finance'])
+
+    with pytest.warns(UserWarning, match="learned with the 'finance' splitter"):
+        loaded = BoilerplateFilter.load(str(output), splitter='punkt')
+    assert loaded.splitter == 'punkt'
+
+
+def test_files_without_a_splitter_were_learned_with_punkt(tmp_path):
+    output = tmp_path / 'boilerplate.json'
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({'hashes': [1, 2]}, f)
+
+    assert BoilerplateFilter.load(str(output)).splitter == 'punkt'
+    with pytest.warns(UserWarning):
+        BoilerplateFilter.load(str(output), splitter='finance')
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from modules.evaluation import CorpusEvaluator, bootstrap_means
+
+
+def test_bootstrap_interval_coverage():
+    # 95% percentile intervals around the mean of 60 normal scores should
+    # contain the true mean in roughly 95% of repeated experiments
+    rng = np.random.default_rng(0)
+    true_mean = 0.4
+    trials = 300
+    covered = 0
+    for trial in range(trials):
+        scores = rng.normal(true_mean, 0.1, size=60)
+        means = bootstrap_means(scores, n_resamples=1000, seed=trial)[:, 0]
+        low, high = np.quantile(means, [0.025, 0.975])
+        covered += low <= true_mean <= high
+
+    assert 0.90 <= covered / trials <= 0.98
+
+
+def test_bootstrap_is_paired_across_methods():
+    scores = np.random.default_rng(1).random(100)
+    means = bootstrap_means(np.column_stack([scores, scores + 0.1]), n_resamples=200)
+    assert np.allclose(means[:, 1] - means[:, 0], 0.1)
+
+
+def test_bootstrap_result_does_not_depend_on_memory_budget():
+    scores = np.random.default_rng(2).random((150, 3))
+    default = bootstrap_means(scores, n_resamples=300, seed=5)
+    small = bootstrap_means(scores, n_resamples=300, seed=5, max_elements=40)
+    assert np.allclose(default, small)
+
+
+def test_bootstrap_without_documents_returns_nan():
+    means = bootstrap_means(np.empty((0, 2)), n_resamples=10)
+    assert means.shape == (10, 2)
+    assert np.isnan(means).all()
+
+
+def test_corpus_reports_are_empty_without_scores():
+    evaluator = CorpusEvaluator(['tfidf', 'lsa'], workers=1)
+    evaluator.evaluate([])
+
+    summary = evaluator.summary('ROUGE-L')
+    assert summary.empty
+    assert list(summary.columns) == ['Method', 'Documents', 'ROUGE-L', 'CI Low', 'CI High', 'Seconds']
+    assert evaluator.paired_tests().empty
+    with pytest.raises(ValueError):
+        evaluator.find_best_method()
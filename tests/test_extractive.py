@@ -0,0 +1,63 @@
+import pytest
+
+from modules.extractive import ExtractiveSummarizer
+from modules.term_stats import TermStatistics
+
+from tests.helpers import run_threads
+
+DOCUMENTS = [
+    "The Federal Reserve held rates steady on Wednesday. Powell said inflation has moderated. "
+    "Futures now price a cut at the next meeting. Treasury yields declined after the decision. "
+    "Equity markets posted modest gains.",
+    "Quantum Computing Inc. reported revenue of $15.7 billion, up 22% year-over-year. "
+    "Earnings per share were $1.28 against estimates of $1.15. Cloud revenue grew 35%. "
+    "The company raised its full-year guidance. Shares rose 8% after hours.",
+    "Markets fell sharply as growth concerns mounted. The S&P 500 dropped 2.3% and the Nasdaq "
+    "fell 3.1%. Gold rose to $2,150 per ounce. The 10-year yield fell to 3.42%.",
+    "One sentence only.",
+    "",
+]
+
+
+@pytest.mark.parametrize('splitter', ['punkt', 'finance'])
+@pytest.mark.parametrize('num_sentences', [1, 2, 10])
+def test_tfidf_corpus_matches_per_document_tfidf(splitter, num_sentences):
+    expected = [ExtractiveSummarizer.tfidf(text, num_sentences, splitter=splitter) for text in DOCUMENTS]
+    assert ExtractiveSummarizer.tfidf_corpus(DOCUMENTS, num_sentences, splitter=splitter) == expected
+
+
+def test_tfidf_corpus_stream_matches_tfidf_with_term_stats():
+    stats = TermStatistics(width=1 << 12).update_many(DOCUMENTS)
+    expected = [ExtractiveSummarizer.tfidf(text, 2, term_stats=stats) for text in DOCUMENTS]
+    assert ExtractiveSummarizer.tfidf_corpus(DOCUMENTS, 2, idf='stream', term_stats=stats) == expected
+
+
+def test_tfidf_corpus_rejects_unknown_idf_mode():
+    with pytest.raises(ValueError):
+        ExtractiveSummarizer.tfidf_corpus(DOCUMENTS, idf='global')
+
+
+def test_ranking_and_index_caches_under_threads(monkeypatch):
+    # Tiny caches, so threads evict each other's entries constantly
+    monkeypatch.setattr(ExtractiveSummarizer, 'RANKING_CACHE_SIZE', 2)
+    monkeypatch.setattr(ExtractiveSummarizer, 'INDEX_CACHE_SIZE', 2)
+    ExtractiveSummarizer.clear_ranking_cache()
+
+    texts = DOCUMENTS[:3]
+    expected_rankings = [ExtractiveSummarizer.rank(text, 'tfidf', use_cache=False).cut(2) for text in texts]
+    expected_queries = [ExtractiveSummarizer.sentence_index(text, use_cache=False).search('rates').cut(1)
+                        for text in texts]
+
+    def lookup(index):
+        for i in range(200):
+            position = (index + i) % len(texts)
+            assert ExtractiveSummarizer.rank(texts[position], 'tfidf').cut(2) == expected_rankings[position]
+            ranking = ExtractiveSummarizer.sentence_index(texts[position]).search('rates')
+            assert ranking.cut(1) == expected_queries[position]
+
+    try:
+        assert run_threads(lookup) == []
+        assert len(ExtractiveSummarizer._ranking_cache) <= 2
+        assert len(ExtractiveSummarizer._index_cache) <= 2
+    finally:
+        ExtractiveSummarizer.clear_ranking_cache()
@@ -0,0 +1,77 @@
+import os
+import time
+from concurrent.futures import TimeoutError
+
+import pytest
+
+import modules.model_server as model_server
+from modules.model_server import ModelServer, RemoteAbstractiveSummarizer
+from utils.threads import get_thread_budget
+
+
+def _never_ready(*args, **kwargs):
+    time.sleep(60)
+
+
+def _crash(*args, **kwargs):
+    os._exit(3)
+
+
+def _ready_then_idle(request_queue, response_queue, *args, **kwargs):
+    # Accepts requests but never answers them
+    response_queue.put((None, True, 'ready'))
+    while request_queue.get() is not None:
+        pass
+
+
+def _budgeted():
+    return 'model_server' in get_thread_budget().allocation()['pools']
+
+
+@pytest.mark.parametrize('target, start_timeout, message', [
+    (_never_ready, 2, "did not load its models within 2s"),
+    (_crash, 60, "exited with code 3 while loading"),
+])
+def test_failed_start_stops_the_process_and_releases_the_budget(monkeypatch, target, start_timeout, message):
+    monkeypatch.setattr(model_server, '_serve', target)
+    server = ModelServer(models=(), workers=1, start_timeout=start_timeout)
+
+    with pytest.raises(RuntimeError, match=message):
+        server.start()
+    assert not server._process.is_alive()
+    assert not _budgeted()
+
+
+def test_dead_server_fails_pending_requests(monkeypatch):
+    monkeypatch.setattr(model_server, '_serve', _ready_then_idle)
+    server = ModelServer(models=(), workers=1, start_timeout=30).start()
+    assert _budgeted()
+
+    futures = [server.submit('session', 'bart', "text") for _ in range(3)]
+    server._process.kill()
+
+    for future in futures:
+        with pytest.raises(RuntimeError, match="Model server exited"):
+            future.result(timeout=10)
+    assert not server.stats()['running']
+    assert not _budgeted()
+    with pytest.raises(RuntimeError, match="not running"):
+        server.submit('session', 'bart', "text")
+
+
+def test_remote_summarizer_times_out_and_drops_the_request(monkeypatch):
+    monkeypatch.setattr(model_server, '_serve', _ready_then_idle)
+    server = ModelServer(models=(), workers=1, start_timeout=30).start()
+    try:
+        remote = RemoteAbstractiveSummarizer(server, timeout=0.2)
+        for _ in range(2):
+            with pytest.raises(TimeoutError):
+                remote.bart("text")
+
+        # The first request went to the server; the second was dropped from the queue
+        stats = server.stats()
+        assert stats['pending'] == {}
+        assert sum(stats['in_flight'].values()) == 1
+    finally:
+        server.stop()
+    assert not _budgeted()
@@ -0,0 +1,52 @@
+from modules.registry import CPU_LIGHT, SummarizerMethod, SummarizerRegistry
+from modules.term_stats import TermStatistics
+
+from tests.helpers import run_threads
+from tests.test_extractive import DOCUMENTS
+
+
+def test_summarize_corpus_matches_summarize_and_shares_its_cache():
+    registry = SummarizerRegistry()
+    summaries = registry.summarize_corpus('tfidf', DOCUMENTS, num_sentences=2)
+
+    assert summaries == [registry.summarize('tfidf', text, num_sentences=2) for text in DOCUMENTS]
+    stats = registry.stats()['tfidf']
+    assert stats['calls'] == 2 * len(DOCUMENTS)
+    assert stats['cache_hits'] == len(DOCUMENTS)
+
+
+def test_summarize_corpus_skips_the_cache_for_batch_options():
+    registry = SummarizerRegistry()
+    stats = TermStatistics(width=1 << 12).update_many(DOCUMENTS)
+    registry.summarize_corpus('tfidf', DOCUMENTS, idf='stream', term_stats=stats)
+
+    assert not any(registry.is_cached('tfidf', text) for text in DOCUMENTS)
+
+
+def test_summarize_corpus_falls_back_to_summarize():
+    registry = SummarizerRegistry()
+    expected = [registry.summarize('lsa', text) for text in DOCUMENTS[:2]]
+    assert registry.summarize_corpus('LSA', DOCUMENTS[:2]) == expected
+
+
+def test_cache_and_stats_are_consistent_under_threads():
+    registry = SummarizerRegistry(cache_size=2)
+    computed = []
+    registry.register(SummarizerMethod(
+        'upper', 'Upper', 'extractive', lambda text, **params: computed.append(text) or text.upper(),
+        CPU_LIGHT, {}
+    ))
+    texts = [f"document {i}" for i in range(10)]
+    rounds = 500
+
+    def summarize(index):
+        for i in range(rounds):
+            text = texts[(index + i) % len(texts)]
+            assert registry.summarize('upper', text) == text.upper()
+
+    assert run_threads(summarize) == []
+
+    stats = registry.stats()['upper']
+    assert stats['calls'] == 8 * rounds
+    assert stats['cache_hits'] + len(computed) == stats['calls']
+    assert len(registry._cache) <= registry.cache_size
@@ -0,0 +1,75 @@
+import json
+
+import pytest
+
+from modules.abstractive import AbstractiveSummarizer
+from modules.registry import SummarizerRegistry
+from modules.scheduler import CostModel, LatencyScheduler, main
+
+
+def test_fit_recovers_linear_costs():
+    samples = [('lsa', words, 0.05 + 0.2 * words / 1000) for words in (200, 400, 800, 1600)]
+    model = CostModel().fit(samples)
+
+    a, b, c = model.coefficients['lsa']
+    assert a == pytest.approx(0.05, abs=1e-6)
+    assert b == pytest.approx(0.2, abs=1e-6)
+    assert c == pytest.approx(0.0, abs=1e-6)
+    assert model.estimate('lsa', 1000) == pytest.approx(0.25)
+
+
+def test_fit_only_changes_timed_methods():
+    default = CostModel()
+    model = CostModel().fit([('tfidf', 1000, 1.0), ('tfidf', 2000, 2.0)])
+    assert model.coefficients['bart'] == default.coefficients['bart']
+    assert model.coefficients['tfidf'] != default.coefficients['tfidf']
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = tmp_path / 'cost_model.json'
+    model = CostModel().fit([('tfidf', 1000, 1.0), ('tfidf', 2000, 2.0)])
+    model.save(path)
+
+    loaded = CostModel.load(path)
+    assert loaded.coefficients == model.coefficients
+    assert loaded.word_caps == model.word_caps
+    assert LatencyScheduler(None, loaded).cost_model is loaded
+
+
+def test_fit_command_writes_a_loadable_model(tmp_path, capsys):
+    path = tmp_path / 'cost_model.json'
+    main(['fit', '--methods', 'tfidf', '--scales', '1', '2', '3', '--output', str(path)])
+
+    with open(path, 'r', encoding='utf-8') as f:
+        assert 'tfidf' in json.load(f)['coefficients']
+    assert CostModel.load(path).estimate('tfidf', 1000) > 0
+    assert "Saved cost model" in capsys.readouterr().out
+
+
+class _AssistedSummarizer(AbstractiveSummarizer):
+    """
+    Pretends to decode, recording assisted statistics the way assisted decoding does.
+    """
+
+    def bart(self, text, max_length=150, min_length=50, profile=None):
+        if profile == 'assisted':
+            self._local.assisted_stats = {'acceptance_rate': 0.5, 'estimated_speedup': 2.0}
+        return text[:20]
+
+
+def test_assisted_stats_are_reported_only_for_runs_that_decoded():
+    registry = SummarizerRegistry(abstractive=_AssistedSummarizer())
+    scheduler = LatencyScheduler(registry)
+    text = "Revenue rose in the quarter. " * 5
+
+    first = scheduler.run(['bart', 'tfidf'], text, 1e6, profile='assisted')
+    assert list(first.assisted) == ['BART']
+    assert first.assisted['BART']['acceptance_rate'] == 0.5
+
+    # Served from the result cache: the stats left by the first run are not reported
+    again = scheduler.run(['bart'], text, 1e6, profile='assisted')
+    assert again.summaries == {'BART': first.summaries['BART']}
+    assert again.assisted == {}
+
+    # A run without assisted decoding does not report the previous run's stats
+    assert scheduler.run(['bart'], text + " More.", 1e6, profile='fast').assisted == {}
@@ -0,0 +1,50 @@
+import functools
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from modules.benchmarks import measure_styles
+from modules.styles import FONT_SOURCES, STATIC_DIR, STYLESHEET, missing_fonts
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def app_url(tmp_path):
+    """
+    Serve a copy of the stylesheet at app/static/ with one of the two fonts present.
+    """
+    static = tmp_path / 'app' / 'static'
+    (static / 'fonts').mkdir(parents=True)
+    with open(f"{STATIC_DIR}/{STYLESHEET}", 'r', encoding='utf-8') as f:
+        (static / STYLESHEET).write_text(f.read(), encoding='utf-8')
+    (static / 'fonts' / 'VT323-Regular.woff2').write_bytes(b'\0' * 100)
+
+    handler = functools.partial(_QuietHandler, directory=str(tmp_path))
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_measure_styles_follows_font_references(app_url):
+    report = measure_styles(app_url)
+    rows = report.set_index('Resource')
+
+    assert rows.loc[f"{app_url}/app/static/{STYLESHEET}", 'Status'] == 200
+    assert rows.loc[f"{app_url}/app/static/fonts/VT323-Regular.woff2", 'Bytes'] == 100
+    assert rows.loc[f"{app_url}/app/static/fonts/SpaceMono-Regular.woff2", 'Status'] == 404
+    assert not report['External'].any()
+    assert rows.loc['TOTAL', 'Bytes'] == report['Bytes'].iloc[:-1].sum()
+
+
+def test_missing_fonts_lists_fonts_and_licences(tmp_path):
+    assert missing_fonts(str(tmp_path)) == list(FONT_SOURCES)
+
+    (tmp_path / 'VT323-Regular.ttf').write_bytes(b'')
+    assert 'VT323-Regular.ttf' not in missing_fonts(str(tmp_path))
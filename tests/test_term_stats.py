@@ -0,0 +1,90 @@
+import math
+
+import numpy as np
+import pytest
+
+from modules.term_stats import TermStatistics
+
+
+def _corpus(num_documents=2000, vocabulary=5000, terms_per_document=30, seed=0):
+    """
+    Documents as sets of Zipf-distributed terms, with their true document frequencies.
+    """
+    rng = np.random.default_rng(seed)
+    documents = []
+    for _ in range(num_documents):
+        ids = np.minimum(rng.zipf(1.3, size=terms_per_document), vocabulary)
+        documents.append({f"term{i}" for i in ids})
+
+    frequencies = {}
+    for terms in documents:
+        for term in terms:
+            frequencies[term] = frequencies.get(term, 0) + 1
+    return documents, frequencies
+
+
+def _build(documents, **settings):
+    stats = TermStatistics(**settings)
+    for terms in documents:
+        stats.update_terms(terms)
+    return stats
+
+
+def test_estimates_never_undercount():
+    documents, frequencies = _corpus()
+    stats = _build(documents, width=512, depth=4)
+
+    terms = list(frequencies)
+    estimates = stats.document_frequencies(terms)
+    assert (estimates >= np.array([frequencies[term] for term in terms])).all()
+
+
+def test_overestimate_within_count_min_bound():
+    documents, frequencies = _corpus()
+    width, depth = 512, 4
+    stats = _build(documents, width=width, depth=depth)
+
+    terms = list(frequencies)
+    errors = stats.document_frequencies(terms) - np.array([frequencies[term] for term in terms])
+
+    # Each estimate exceeds the true count by more than e / width of all counted
+    # (document, term) pairs with probability at most e^-depth
+    bound = math.e / width * sum(frequencies.values())
+    assert (errors > bound).mean() <= math.exp(-depth)
+
+
+def test_merge_adds_documents_and_keeps_estimates_above_truth():
+    documents, frequencies = _corpus()
+    half = len(documents) // 2
+    merged = _build(documents[:half], width=1024).merge(_build(documents[half:], width=1024))
+
+    assert merged.num_documents == len(documents)
+    terms = list(frequencies)
+    assert (merged.document_frequencies(terms) >= np.array([frequencies[term] for term in terms])).all()
+
+    # The most frequent term is tracked by name after the merge
+    top_term = max(frequencies, key=frequencies.get)
+    assert top_term in dict(merged.top(10))
+
+
+def test_merge_rejects_different_settings():
+    with pytest.raises(ValueError):
+        TermStatistics(width=1024).merge(TermStatistics(width=2048))
+
+
+def test_save_and_load_round_trip(tmp_path):
+    documents, _ = _corpus(num_documents=200)
+    stats = _build(documents, width=1024)
+    path = str(tmp_path / "stats.npz")
+    stats.save(path)
+
+    loaded = TermStatistics.load(path)
+    assert loaded.num_documents == stats.num_documents
+    assert np.array_equal(loaded.table, stats.table)
+    assert loaded.top(20) == stats.top(20)
+
+
+def test_idf_decreases_with_document_frequency():
+    stats = _build([{'revenue', 'guidance'}, {'revenue'}, {'revenue', 'margin'}], width=1024)
+    idf = stats.idf(['revenue', 'guidance', 'unseen'])
+    assert idf[0] < idf[1] < idf[2]
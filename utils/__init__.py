@@ -3,5 +3,9 @@
 
 from utils.text_processing import TextProcessor
 from utils.visualization import DataVisualizer
+from utils.sentence_splitter import FinanceSentenceSplitter, PunktSentenceSplitter
+from utils.normalization import Normalizer, get_normalizer
+from utils.threads import ThreadBudget, get_thread_budget
 
-__all__ = ['TextProcessor', 'DataVisualizer']
\ No newline at end of file
+__all__ = ['TextProcessor', 'DataVisualizer', 'FinanceSentenceSplitter', 'PunktSentenceSplitter',
+           'Normalizer', 'get_normalizer', 'ThreadBudget', 'get_thread_budget']
\ No newline at end of file
@@ -0,0 +1,143 @@
+"""
+Paginated document viewer for the Financial Text Summarizer.
+
+Long inputs are split into sentence spans once. Each rerun then sends the
+browser only the sentences of the current page. Extracted summary sentences
+are highlighted by their index in the document rather than sent again.
+"""
+
+import html
+from functools import lru_cache
+
+import streamlit as st
+
+from utils.sentence_splitter import get_splitter
+
+# Sentences shown per page
+PAGE_SIZE = 25
+
+
+@lru_cache(maxsize=8)
+def _sentence_spans(text, splitter):
+    """
+    Split a document once per (text, splitter) and reuse the spans across reruns.
+    """
+    return tuple(get_splitter(splitter).spans(text))
+
+
+class DocumentViewer:
+    """
+    Shows a long document a page of sentences at a time.
+    """
+
+    def __init__(self, text, splitter='punkt', page_size=PAGE_SIZE):
+        """
+        Initialize the viewer.
+
+        Args:
+            text (str): The document
+            splitter (str): Sentence splitter, 'punkt' or 'finance'
+            page_size (int): Sentences per page
+        """
+        self.text = text
+        self.splitter = splitter
+        self.page_size = page_size
+        self.spans = _sentence_spans(text, splitter)
+
+    @property
+    def page_count(self):
+        return max(1, -(-len(self.spans) // self.page_size))
+
+    def page_of(self, index):
+        """
+        Page number (from 1) that shows a sentence.
+
+        Args:
+            index (int): Sentence index in the document
+
+        Returns:
+            int: The page number
+        """
+        return index // self.page_size + 1
+
+    def page(self, number):
+        """
+        Sentence spans shown on one page.
+
+        Args:
+            number (int): Page number, from 1
+
+        Returns:
+            tuple: (index of the first sentence, list of (start, end) offsets)
+        """
+        first = (min(max(number, 1), self.page_count) - 1) * self.page_size
+        return first, self.spans[first:first + self.page_size]
+
+    def locate(self, summary):
+        """
+        Find the document sentences an extractive summary is made of.
+
+        Args:
+            summary (str): Summary built from sentences of the document
+
+        Returns:
+            list: Indices of the matching sentences, in document order
+        """
+        chosen = set(get_splitter(self.splitter).split(summary))
+        return [
+            index for index, (start, end) in enumerate(self.spans)
+            if self.text[start:end] in chosen
+        ]
+
+    def render_page(self, number, highlighted=()):
+        """
+        Build the HTML of one page.
+
+        Args:
+            number (int): Page number, from 1
+            highlighted (iterable): Sentence indices to highlight
+
+        Returns:
+            str: Escaped sentences of the page, highlighted ones wrapped in <mark>
+        """
+        highlighted = set(highlighted)
+        first, spans = self.page(number)
+        sentences = []
+        for index, (start, end) in enumerate(spans, first):
+            # Escaped so that markup and $ signs (math in Streamlit markdown) show as typed
+            sentence = html.escape(self.text[start:end], quote=False).replace('$', '&#36;')
+            if index in highlighted:
+                sentence = f"<mark class='summary-highlight'>{sentence}</mark>"
+            sentences.append(sentence)
+        return " ".join(sentences)
+
+    def show(self, key, highlighted=()):
+        """
+        Display the current page with pagination controls in Streamlit.
+
+        Args:
+            key (str): Widget key prefix, unique per viewer on the page
+            highlighted (iterable): Sentence indices to highlight
+        """
+        highlighted = sorted(highlighted)
+        page_key = f"{key}_page"
+
+        # Start on the page of the first highlighted sentence
+        if page_key not in st.session_state or st.session_state[page_key] > self.page_count:
+            st.session_state[page_key] = self.page_of(highlighted[0]) if highlighted else 1
+
+        if self.page_count > 1:
+            st.number_input("PAGE", min_value=1, max_value=self.page_count, step=1, key=page_key)
+
+        number = st.session_state[page_key]
+        first, spans = self.page(number)
+        st.markdown(
+            f"<div class='pixel-container'>{self.render_page(number, highlighted)}</div>",
+            unsafe_allow_html=True
+        )
+
+        caption = f"Sentences {first + 1}-{first + len(spans)} of {len(self.spans)}"
+        if highlighted:
+            pages = sorted({self.page_of(index) for index in highlighted})
+            caption += f" · highlighted on page {', '.join(map(str, pages))}"
+        st.caption(caption)
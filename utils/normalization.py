@@ -0,0 +1,136 @@
+"""
+Shared token normalization for the Financial Text Summarizer.
+
+One Normalizer holds a bounded LRU memo of token -> Porter stem and a frozenset
+of English stopwords. It is shared by the sumy summarizers, TextProcessor and the
+ROUGE scorer, so each distinct word in the financial vocabulary is stemmed once
+per process instead of once per call.
+"""
+
+from functools import lru_cache
+
+from nltk.corpus import stopwords
+from nltk.stem import porter
+from rouge_score import tokenize as rouge_tokenize
+from sumy.nlp.stemmers import null_stemmer
+
+
+class RougeTokenizer:
+    """
+    Drop-in tokenizer for rouge_scorer.RougeScorer that stems through a Normalizer.
+
+    Produces exactly the tokens of rouge_score's default tokenizer with
+    use_stemmer=True, so ROUGE scores do not change.
+    """
+
+    def __init__(self, normalizer):
+        self.normalizer = normalizer
+
+    def tokenize(self, text):
+        # Same steps as rouge_score.tokenize.tokenize
+        text = rouge_tokenize.NON_ALPHANUM_RE.sub(" ", text.lower())
+        stem = self.normalizer.stem
+        # Only words longer than 3 characters are stemmed
+        tokens = [stem(token) if len(token) > 3 else token for token in rouge_tokenize.SPACES_RE.split(text)]
+        return [token for token in tokens if rouge_tokenize.VALID_TOKEN_RE.match(token)]
+
+
+class Normalizer:
+    """
+    Memoized stemming and stopword lookups shared across the app.
+    """
+
+    def __init__(self, max_size=50000, stem_sumy=False):
+        """
+        Initialize the normalizer.
+
+        Args:
+            max_size (int): Maximum number of memoized stems
+            stem_sumy (bool): Stem words in the sumy summarizers. They have always
+                run without stemming, so enabling this changes their rankings
+        """
+        self.max_size = max_size
+        self.stem_sumy = stem_sumy
+        self._stemmer = porter.PorterStemmer()
+        self._stopwords = None
+
+        # Same stemmer as rouge_score, so memoized stems are valid for ROUGE
+        self.stem = lru_cache(maxsize=max_size)(self._stemmer.stem)
+
+    @property
+    def stopwords(self):
+        """
+        frozenset: NLTK's English stopwords, loaded on first use.
+        """
+        if self._stopwords is None:
+            self._stopwords = frozenset(stopwords.words('english'))
+        return self._stopwords
+
+    def is_stopword(self, word):
+        """
+        Tell whether a word is an English stopword.
+
+        Args:
+            word (str): The word, in any case
+
+        Returns:
+            bool: True for stopwords
+        """
+        return word.lower() in self.stopwords
+
+    def sumy_stemmer(self):
+        """
+        Return the stemmer to hand to the sumy summarizers.
+
+        Returns:
+            callable: The memoized stemmer, or sumy's null stemmer unless stem_sumy is set
+        """
+        return self.stem if self.stem_sumy else null_stemmer
+
+    def rouge_tokenizer(self):
+        """
+        Return a ROUGE tokenizer backed by the memoized stemmer.
+
+        Returns:
+            RougeTokenizer: Tokenizer for rouge_scorer.RougeScorer
+        """
+        return RougeTokenizer(self)
+
+    def stats(self):
+        """
+        Return hit and miss counts of the stem memo.
+
+        Returns:
+            dict: Hits, misses, current and maximum size, and hit rate
+        """
+        info = self.stem.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            'hits': info.hits,
+            'misses': info.misses,
+            'size': info.currsize,
+            'max_size': info.maxsize,
+            'hit_rate': info.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self):
+        """
+        Empty the stem memo and reset its statistics.
+        """
+        self.stem.cache_clear()
+
+
+_shared = None
+
+
+def get_normalizer():
+    """
+    Return the process-wide shared Normalizer.
+
+    Returns:
+        Normalizer: The shared instance
+    """
+    global _shared
+    if _shared is None:
+        _shared = Normalizer()
+    return _shared
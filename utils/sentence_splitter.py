@@ -0,0 +1,259 @@
+"""
+Sentence splitting for the Financial Text Summarizer.
+
+FinanceSentenceSplitter is a rule-based splitter tuned for financial news: it
+does not break on prices and decimals ("$1.28"), company suffixes ("Inc.",
+"Corp."), country abbreviations ("U.S.") or titles ("Mr."), unless the next word
+starts a new sentence. Splitters return (start, end) character offsets so callers
+can work on the original text without copying it.
+"""
+
+import re
+
+from nltk.tokenize import sent_tokenize
+from sumy.nlp.tokenizers import Tokenizer
+
+# Candidate boundaries: terminal punctuation with optional closing quotes or
+# brackets followed by whitespace, or a blank line between paragraphs
+BOUNDARY = re.compile(r'(?P<end>[.!?]+["\'”’)\]]*)\s+|\n[ \t]*\n\s*')
+
+# First word after a boundary, skipping opening quotes and brackets
+NEXT_WORD = re.compile(r'["\'“‘(\[]*([A-Za-z]+)')
+
+# Leading quotes and brackets stripped from the token before a boundary
+TOKEN_PREFIX = '"\'“‘(['
+
+# Abbreviations that never end a sentence
+NON_TERMINAL_ABBREVIATIONS = frozenset([
+    'mr.', 'mrs.', 'ms.', 'dr.', 'prof.', 'sr.', 'jr.', 'st.', 'gov.', 'sen.', 'rep.', 'gen.',
+    'vs.', 'v.', 'no.', 'nos.', 'approx.', 'est.', 'fig.', 'e.g.', 'i.e.', 'cf.',
+])
+
+# Abbreviations that may end a sentence; they only do when a sentence starter follows
+TERMINAL_ABBREVIATIONS = frozenset([
+    'inc.', 'corp.', 'co.', 'ltd.', 'llc.', 'plc.', 'l.p.', 'n.v.', 's.a.', 'ag.', 'bros.', 'cos.',
+    'u.s.', 'u.k.', 'u.n.', 'e.u.', 'u.s.a.', 'a.m.', 'p.m.', 'etc.',
+    'jan.', 'feb.', 'mar.', 'apr.', 'jun.', 'jul.', 'aug.', 'sep.', 'sept.', 'oct.', 'nov.', 'dec.',
+])
+
+# Words that commonly open a sentence in financial news
+SENTENCE_STARTERS = frozenset([
+    'a', 'after', 'also', 'an', 'analysts', 'as', 'at', 'but', 'despite', 'during', 'for', 'he',
+    'her', 'his', 'however', 'if', 'in', 'investors', 'it', 'its', 'meanwhile', 'more', 'on',
+    'our', 'over', 'shares', 'she', 'since', 'so', 'that', 'the', 'their', 'there', 'these',
+    'they', 'this', 'those', 'we', 'when', 'while', 'with', 'yet',
+])
+
+# Capitalized single letter, as in a person's initial
+INITIAL = re.compile(r'^[A-Z]\.$')
+
+
+class FinanceSentenceSplitter:
+    """
+    Rule-based sentence splitter for financial text.
+    """
+
+    name = 'finance'
+
+    def __init__(self, non_terminal=None, terminal=None, starters=None):
+        """
+        Initialize the splitter.
+
+        Args:
+            non_terminal (iterable, optional): Lowercase abbreviations that never end a sentence
+            terminal (iterable, optional): Lowercase abbreviations that end a sentence
+                only before a sentence starter
+            starters (iterable, optional): Lowercase words that open a sentence
+        """
+        self.non_terminal = frozenset(non_terminal) if non_terminal is not None else NON_TERMINAL_ABBREVIATIONS
+        self.terminal = frozenset(terminal) if terminal is not None else TERMINAL_ABBREVIATIONS
+        self.starters = frozenset(starters) if starters is not None else SENTENCE_STARTERS
+
+    def _is_boundary(self, text, match):
+        """
+        Decide whether a candidate boundary ends a sentence.
+        """
+        if match.group('end') is None:
+            # Blank line between paragraphs
+            return True
+
+        next_index = match.end()
+        if next_index < len(text) and text[next_index].islower():
+            return False
+
+        # Only a single period can belong to an abbreviation
+        if text[match.start()] != '.' or match.group('end').startswith('..'):
+            return True
+
+        token_start = max(text.rfind(' ', 0, match.start()), text.rfind('\n', 0, match.start())) + 1
+        token = text[token_start:match.start() + 1].lstrip(TOKEN_PREFIX)
+        lowered = token.lower()
+
+        if lowered in self.non_terminal or INITIAL.match(token):
+            return False
+
+        if lowered in self.terminal:
+            next_word = NEXT_WORD.match(text, next_index)
+            return next_word is not None and next_word.group(1).lower() in self.starters
+
+        return True
+
+    def spans(self, text):
+        """
+        Find the sentences of a text.
+
+        Args:
+            text (str): The text to split
+
+        Returns:
+            list: (start, end) character offsets of each sentence, without
+                surrounding whitespace
+        """
+        spans = []
+        start = len(text) - len(text.lstrip())
+
+        for match in BOUNDARY.finditer(text, start):
+            if not self._is_boundary(text, match):
+                continue
+
+            end = match.start('end') + len(match.group('end')) if match.group('end') else match.start()
+            while end > start and text[end - 1].isspace():
+                end -= 1
+            if end > start:
+                spans.append((start, end))
+            start = match.end()
+
+        end = len(text.rstrip())
+        if end > start:
+            spans.append((start, end))
+
+        return spans
+
+    def split(self, text):
+        """
+        Split a text into sentences.
+
+        Args:
+            text (str): The text to split
+
+        Returns:
+            list: The sentences
+        """
+        return [text[start:end] for start, end in self.spans(text)]
+
+
+class PunktSentenceSplitter:
+    """
+    NLTK's punkt tokenizer behind the same interface as FinanceSentenceSplitter.
+    """
+
+    name = 'punkt'
+
+    def spans(self, text):
+        """
+        Find the sentences of a text.
+
+        Args:
+            text (str): The text to split
+
+        Returns:
+            list: (start, end) character offsets of each sentence
+        """
+        spans = []
+        position = 0
+        for sentence in sent_tokenize(text):
+            start = text.find(sentence, position)
+            if start < 0:
+                # punkt normalized the sentence; fall back to the current position
+                start = position
+            position = start + len(sentence)
+            spans.append((start, position))
+        return spans
+
+    def split(self, text):
+        """
+        Split a text into sentences.
+
+        Args:
+            text (str): The text to split
+
+        Returns:
+            list: The sentences
+        """
+        return sent_tokenize(text)
+
+
+SPLITTERS = {
+    'punkt': PunktSentenceSplitter,
+    'finance': FinanceSentenceSplitter,
+}
+
+_instances = {}
+
+
+def get_splitter(name='punkt'):
+    """
+    Return the shared instance of a sentence splitter.
+
+    Args:
+        name (str): 'punkt' or 'finance'
+
+    Returns:
+        PunktSentenceSplitter or FinanceSentenceSplitter: The splitter
+    """
+    if name not in SPLITTERS:
+        raise ValueError(f"Splitter '{name}' not supported. Choose from: {', '.join(SPLITTERS.keys())}")
+
+    if name not in _instances:
+        _instances[name] = SPLITTERS[name]()
+    return _instances[name]
+
+
+def split_sentences(text, splitter='punkt'):
+    """
+    Split a text into sentences with a named splitter.
+
+    Args:
+        text (str): The text to split
+        splitter (str): 'punkt' or 'finance'
+
+    Returns:
+        list: The sentences
+    """
+    return get_splitter(splitter).split(text)
+
+
+class SumyTokenizer(Tokenizer):
+    """
+    sumy tokenizer that splits sentences with one of our splitters and words
+    with sumy's own English word tokenizer.
+    """
+
+    def __init__(self, splitter='finance', language='english'):
+        """
+        Initialize the tokenizer.
+
+        Args:
+            splitter (str): 'punkt' or 'finance'
+            language (str): Language of sumy's word tokenizer
+        """
+        super().__init__(language)
+        self.splitter = get_splitter(splitter)
+
+    def to_sentences(self, paragraph):
+        return tuple(self.splitter.split(paragraph))
+
+
+def sumy_tokenizer(splitter='punkt'):
+    """
+    Return a sumy tokenizer for a named splitter.
+
+    Args:
+        splitter (str): 'punkt' for sumy's default tokenizer, or 'finance'
+
+    Returns:
+        Tokenizer: A sumy tokenizer
+    """
+    if splitter == 'punkt':
+        return Tokenizer("english")
+    return SumyTokenizer(splitter)
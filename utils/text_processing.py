@@ -4,9 +4,17 @@ Text processing utilities for the Financial Text Summarizer.
 
 import re
 import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import multiprocessing
 import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize, sent_tokenize
+from nltk.tokenize import word_tokenize
+
+from utils.normalization import get_normalizer
+from utils.sentence_splitter import get_splitter
+from utils.threads import get_thread_budget, limit_threads
 
 # Make sure NLTK resources are available
 try:
@@ -18,17 +26,58 @@ try:
 except LookupError:
     nltk.download('stopwords')
 
+# Characters clean_text keeps: word characters, whitespace and . , ? !
+SPECIAL_CHARACTERS = re.compile(r'[^\w\s.,?!]+')
+
+# ASCII text skips the regex: one translate call deletes the same characters
+ASCII_SPECIAL_CHARACTERS = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128)) if SPECIAL_CHARACTERS.fullmatch(c)
+))
+
+# Punctuation stripped from a word before the stopword lookup in bulk cleaning
+WORD_PUNCTUATION = '.,?!'
+
+
+def _clean(text):
+    """
+    Remove special characters and collapse whitespace, as TextProcessor.clean_text.
+    """
+    if text.isascii():
+        text = text.translate(ASCII_SPECIAL_CHARACTERS)
+    else:
+        text = SPECIAL_CHARACTERS.sub('', text)
+    return ' '.join(text.split())
+
+
+def _clean_chunk(texts, stopwords=None):
+    """
+    Clean a chunk of documents, optionally dropping stopwords; runs in pool workers.
+    """
+    cleaned = [_clean(text) for text in texts]
+    if stopwords:
+        cleaned = [
+            ' '.join(word for word in text.split(' ') if word.strip(WORD_PUNCTUATION).lower() not in stopwords)
+            for text in cleaned
+        ]
+    return cleaned
+
 
 class TextProcessor:
     """
     Utility class for processing and analyzing text.
     """
     
-    def __init__(self):
+    def __init__(self, splitter='punkt', normalizer=None):
         """
         Initialize with English stopwords.
+        
+        Args:
+            splitter (str): Sentence splitter, 'punkt' or 'finance'
+            normalizer (Normalizer, optional): Shared stopword and stemming service
         """
-        self.stopwords = set(stopwords.words('english'))
+        self.normalizer = normalizer if normalizer is not None else get_normalizer()
+        self.stopwords = self.normalizer.stopwords
+        self.splitter = get_splitter(splitter)
     
     def clean_text(self, text):
         """
@@ -40,13 +89,55 @@ class TextProcessor:
         Returns:
             str: Cleaned text
         """
-        # Remove special characters and digits
-        text = re.sub(r'[^\w\s\.\,\?\!]', '', text)
+        # Remove special characters and extra whitespace
+        return _clean(text)
+    
+    def clean_many(self, texts, remove_stopwords=False, workers=None, chunk_size=256):
+        """
+        Clean many documents, yielding results lazily in input order.
+        
+        Each document gets the same cleaning as clean_text. With remove_stopwords,
+        stopwords are then dropped by splitting on whitespace rather than running
+        word_tokenize, so punctuation stays attached to the words it follows.
+        Input is read in chunks, and at most two chunks per worker are in flight,
+        so memory stays bounded however long the input is.
+        
+        Args:
+            texts (iterable): Documents to clean
+            remove_stopwords (bool): Also drop stopwords
+            workers (int, optional): Worker processes; defaults to the CPU count,
+                and 1 cleans in the calling process
+            chunk_size (int): Documents sent to a worker at a time
+            
+        Yields:
+            str: One cleaned document per input document
+        """
+        stopwords = self.stopwords if remove_stopwords else None
+        texts = iter(texts)
+        workers = workers or os.cpu_count() or 1
         
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        first = list(islice(texts, chunk_size))
+        if workers == 1 or len(first) < chunk_size:
+            # Small batches are not worth starting processes for
+            chunk = first
+            while chunk:
+                yield from _clean_chunk(chunk, stopwords)
+                chunk = list(islice(texts, chunk_size))
+            return
         
-        return text
+        context = multiprocessing.get_context('spawn')
+        with get_thread_budget().pool('clean', workers) as threads, \
+                ProcessPoolExecutor(workers, mp_context=context, initializer=limit_threads, initargs=(threads,)) as pool:
+            pending = deque([pool.submit(_clean_chunk, first, stopwords)])
+            exhausted = False
+            while pending:
+                while not exhausted and len(pending) < 2 * workers:
+                    chunk = list(islice(texts, chunk_size))
+                    if not chunk:
+                        exhausted = True
+                        break
+                    pending.append(pool.submit(_clean_chunk, chunk, stopwords))
+                yield from pending.popleft().result()
     
     def remove_stopwords(self, text):
         """
@@ -86,8 +177,7 @@ class TextProcessor:
         Returns:
             int: Number of sentences
         """
-        sentences = sent_tokenize(text)
-        return len(sentences)
+        return len(self.splitter.spans(text))
     
     def calculate_compression_ratio(self, original_text, summary):
         """
@@ -0,0 +1,222 @@
+"""
+CPU thread budgets for the Financial Text Summarizer.
+
+torch, the BLAS library behind NumPy and scikit-learn, and OpenMP each start one
+thread per core by default. When model inference runs next to a process pool, or
+every batch worker loads its own model, each process does this and the machine
+runs several times more threads than it has cores.
+
+A ThreadBudget splits the cores between the calling process and the worker pools
+it starts. Workers are capped to their share when they start, and the calling
+process is capped to what is left whenever a pool starts, stops or is resized.
+A capped process sees its share as its total, so budgets nest.
+"""
+
+import os
+import sys
+import threading
+from contextlib import contextmanager
+
+from threadpoolctl import threadpool_limits
+
+# Cores a process may use; set for worker processes, or to share a host between deployments
+CORES_ENV_VAR = 'FTS_CPU_CORES'
+
+# Read by BLAS and OpenMP runtimes (and torch) when they load, so child processes start capped
+THREAD_ENV_VARS = ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS',
+                   'VECLIB_MAXIMUM_THREADS', 'NUMEXPR_NUM_THREADS', CORES_ENV_VAR)
+
+
+def available_cores():
+    """
+    Number of cores this process may use.
+
+    Returns:
+        int: FTS_CPU_CORES if set, otherwise the size of the process's CPU affinity mask
+    """
+    override = os.environ.get(CORES_ENV_VAR)
+    if override:
+        return max(1, int(override))
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        # No affinity masks on macOS and Windows
+        return os.cpu_count() or 1
+
+
+def _limit_loaded(threads):
+    """
+    Cap the thread pools of libraries already loaded in this process.
+    """
+    threadpool_limits(limits=threads)
+
+    # Only where torch is loaded already; importing it just for this would take seconds
+    torch = sys.modules.get('torch')
+    if torch is not None:
+        torch.set_num_threads(threads)
+
+
+def limit_threads(threads):
+    """
+    Cap torch, BLAS and OpenMP threads in this process and the processes it starts.
+
+    Used as the initializer of worker pools.
+
+    Args:
+        threads (int): Threads per thread pool
+    """
+    for name in THREAD_ENV_VARS:
+        os.environ[name] = str(threads)
+    _limit_loaded(threads)
+
+
+class ThreadBudget:
+    """
+    Splits the available cores between this process and its worker pools.
+    """
+
+    def __init__(self, cores=None):
+        """
+        Initialize the budget with no worker pools.
+
+        Args:
+            cores (int, optional): Cores to share out; defaults to available_cores()
+        """
+        self.cores = cores or available_cores()
+        self._pools = {}
+        self._lock = threading.RLock()
+        self._saved_env = None
+
+    def _share(self):
+        # Every worker process and this process get an equal share, at least one thread
+        return max(1, self.cores // (sum(self._pools.values()) + 1))
+
+    def allocation(self):
+        """
+        Current split of the cores.
+
+        Returns:
+            dict: 'cores', 'main' (threads of this process, which also gets the
+                cores left over), 'pools' mapping each pool to its 'processes' and
+                'threads' per process, and 'threads' in total
+        """
+        with self._lock:
+            share = self._share()
+            workers = sum(self._pools.values())
+            main = max(1, self.cores - share * workers)
+            return {
+                'cores': self.cores,
+                'main': main,
+                'pools': {name: {'processes': count, 'threads': share} for name, count in self._pools.items()},
+                'threads': main + share * workers,
+            }
+
+    def apply(self):
+        """
+        Cap the threads of this process to its current share.
+
+        Returns:
+            int: Threads of this process
+        """
+        with self._lock:
+            main = self.allocation()['main']
+            _limit_loaded(main)
+            return main
+
+    def _publish(self):
+        """
+        Set the per-worker share in the environment inherited by new processes.
+        """
+        if self._pools:
+            if self._saved_env is None:
+                self._saved_env = {name: os.environ.get(name) for name in THREAD_ENV_VARS}
+            for name in THREAD_ENV_VARS:
+                os.environ[name] = str(self._share())
+        elif self._saved_env is not None:
+            for name, value in self._saved_env.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+            self._saved_env = None
+
+    def resize(self, name, processes):
+        """
+        Register a worker pool or change its size, and re-split the cores.
+
+        Workers that are already running keep the share they started with.
+
+        Args:
+            name (str): Pool name
+            processes (int): Worker processes (or inference threads) in the pool; 0 removes it
+
+        Returns:
+            int: Threads per worker of the pool
+        """
+        with self._lock:
+            if processes > 0:
+                self._pools[name] = processes
+            else:
+                self._pools.pop(name, None)
+            self._publish()
+            self.apply()
+            return self._share()
+
+    def release(self, name):
+        """
+        Remove a worker pool and give its cores back.
+
+        Args:
+            name (str): Pool name
+        """
+        self.resize(name, 0)
+
+    @contextmanager
+    def pool(self, name, processes):
+        """
+        Budget a worker pool for the duration of a with block.
+
+        Start the pool inside the block with limit_threads as its initializer:
+
+            with budget.pool('batch', 4) as threads:
+                Pool(4, initializer=limit_threads, initargs=(threads,))
+
+        Args:
+            name (str): Pool name; numbered if a pool of that name is running
+            processes (int): Worker processes
+
+        Yields:
+            int: Threads per worker process
+        """
+        with self._lock:
+            key, number = name, 1
+            while key in self._pools:
+                number += 1
+                key = f"{name}#{number}"
+            threads = self.resize(key, processes)
+        try:
+            yield threads
+        finally:
+            self.release(key)
+
+    def __repr__(self):
+        allocation = self.allocation()
+        pools = ", ".join(f"{name}={pool['processes']}x{pool['threads']}"
+                          for name, pool in allocation['pools'].items())
+        return f"ThreadBudget(cores={self.cores}, main={allocation['main']}, pools=[{pools}])"
+
+
+_shared = None
+
+
+def get_thread_budget():
+    """
+    Return the process-wide shared ThreadBudget.
+
+    Returns:
+        ThreadBudget: The shared instance
+    """
+    global _shared
+    if _shared is None:
+        _shared = ThreadBudget()
+    return _shared
@@ -2,15 +2,207 @@
 Data visualization utilities for the Financial Text Summarizer.
 """
 
+import hashlib
+import io
+from collections import OrderedDict
+
 import streamlit as st
 import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 
+ROUGE_METRICS = ['ROUGE-1', 'ROUGE-2', 'ROUGE-L']
+
+# Rendered matplotlib figures as image bytes, keyed by (chart, data hash, format)
+FIGURE_CACHE_SIZE = 64
+_figure_cache = OrderedDict()
+
+
+def frame_hash(frame):
+    """
+    Hash the contents of a DataFrame, including its column names and index.
+    
+    Args:
+        frame (pd.DataFrame): The data to hash
+        
+    Returns:
+        str: Hex digest that changes whenever any value changes
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(list(frame.columns)).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(frame, index=True).values.tobytes())
+    return digest.hexdigest()
+
+
+def _cached_figure(chart, frame, fmt, draw):
+    """
+    Return the rendered bytes of a chart, drawing it only on a cache miss.
+    
+    The figure is closed as soon as it is saved, so no figure outlives the call
+    and the cache holds only bytes.
+    """
+    key = (chart, frame_hash(frame), fmt)
+    if key in _figure_cache:
+        _figure_cache.move_to_end(key)
+        return _figure_cache[key]
+    
+    fig = draw(frame)
+    try:
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=fmt, bbox_inches='tight')
+    finally:
+        plt.close(fig)
+    
+    _figure_cache[key] = buffer.getvalue()
+    while len(_figure_cache) > FIGURE_CACHE_SIZE:
+        _figure_cache.popitem(last=False)
+    return _figure_cache[key]
+
+
+# Most rows sent to the browser by a single chart; larger results are aggregated
+# or sampled server-side first
+MAX_CHART_ROWS = 5000
+
+# Quantiles reported per method in the dashboard
+DASHBOARD_QUANTILES = [0.05, 0.25, 0.5, 0.75, 0.95]
+
+
+def downsample(frame, max_rows=MAX_CHART_ROWS, seed=0):
+    """
+    Sample a DataFrame down to at most max_rows rows, keeping row order.
+    
+    Args:
+        frame (pd.DataFrame): The data
+        max_rows (int): Row limit
+        seed (int): Random seed, so reruns show the same sample
+        
+    Returns:
+        pd.DataFrame: The frame itself if small enough, else a uniform sample
+    """
+    if len(frame) <= max_rows:
+        return frame
+    rows = np.sort(np.random.default_rng(seed).choice(len(frame), max_rows, replace=False))
+    return frame.iloc[rows]
+
+
+def score_summary(results, metrics=ROUGE_METRICS, by='Method', quantiles=DASHBOARD_QUANTILES):
+    """
+    Aggregate per-document scores into one row per method.
+    
+    Args:
+        results (pd.DataFrame): One row per (document, method)
+        metrics (list): Score columns to aggregate
+        by (str): Column naming the method
+        quantiles (list): Quantiles reported for each metric
+        
+    Returns:
+        pd.DataFrame: Document count, and mean and quantiles of every metric, per method
+    """
+    grouped = results.groupby(by, sort=True)
+    summary = grouped.agg(
+        Documents=(metrics[0], 'count'),
+        **{metric: (metric, 'mean') for metric in metrics}
+    )
+    
+    for metric in metrics:
+        values = grouped[metric].quantile(quantiles).unstack()
+        values.columns = [f"{metric} p{round(q * 100):02d}" for q in quantiles]
+        summary = summary.join(values)
+    
+    return summary.reset_index()
+
+
+def score_histogram(results, metric='ROUGE-L', by='Method', bins=40, value_range=(0.0, 1.0)):
+    """
+    Count per-document scores into fixed bins, per method.
+    
+    All methods are binned in one np.bincount pass over (method code, bin) pairs.
+    
+    Args:
+        results (pd.DataFrame): One row per (document, method)
+        metric (str): Score column to bin
+        by (str): Column naming the method
+        bins (int): Number of equal-width bins
+        value_range (tuple): Lower and upper edge; scores outside are clipped into the end bins
+        
+    Returns:
+        pd.DataFrame: One row per (method, bin) with the bin edges and the count
+    """
+    codes, methods = pd.factorize(results[by], sort=True)
+    values = results[metric].to_numpy(dtype=float)
+    valid = ~np.isnan(values)
+    codes, values = codes[valid], values[valid]
+    
+    low, high = value_range
+    index = np.clip(((values - low) / (high - low) * bins).astype(np.int64), 0, bins - 1)
+    counts = np.bincount(codes * bins + index, minlength=len(methods) * bins)
+    edges = np.linspace(low, high, bins + 1)
+    
+    return pd.DataFrame({
+        by: np.repeat(np.asarray(methods), bins),
+        'Bin Start': np.tile(edges[:-1], len(methods)),
+        'Bin End': np.tile(edges[1:], len(methods)),
+        'Count': counts,
+    })
+
+
+def bucket_summary(results, metric='ROUGE-L', by='Method', bucket='Bucket'):
+    """
+    Mean score and document count per method and bucket (e.g. length bucket or shard).
+    
+    Args:
+        results (pd.DataFrame): One row per (document, method)
+        metric (str): Score column to average
+        by (str): Column naming the method
+        bucket (str): Column naming the bucket
+        
+    Returns:
+        pd.DataFrame: One row per (method, bucket)
+    """
+    return results.groupby([by, bucket], sort=True, observed=True).agg(
+        Documents=(metric, 'count'),
+        **{metric: (metric, 'mean')}
+    ).reset_index()
+
+
+def build_dashboard(results, metric='ROUGE-L', by='Method', bucket=None, bins=40, max_rows=MAX_CHART_ROWS):
+    """
+    Pre-aggregate a large result set into the small frames the dashboard draws.
+    
+    Every frame returned is small whatever the size of the input, so the result
+    can be cached and rerendered without touching the raw rows again.
+    
+    Args:
+        results (pd.DataFrame): One row per (document, method)
+        metric (str): Score column for the histogram and bucket views
+        by (str): Column naming the method
+        bucket (str, optional): Column to break the scores down by
+        bins (int): Histogram bins
+        max_rows (int): Size of the raw-row sample kept for inspection
+        
+    Returns:
+        dict: 'summary', 'histogram', 'buckets' (or None) and 'sample' DataFrames,
+            plus the metric, method column and total row count
+    """
+    metrics = [column for column in ROUGE_METRICS if column in results.columns]
+    return {
+        'metric': metric,
+        'by': by,
+        'rows': len(results),
+        'summary': score_summary(results, metrics, by),
+        'histogram': score_histogram(results, metric, by, bins),
+        'buckets': bucket_summary(results, metric, by, bucket) if bucket else None,
+        'sample': downsample(results, max_rows),
+    }
+
 
 class DataVisualizer:
     """
     Utility class for visualizing text summarization results.
+    
+    The heatmap and radar chart default to native Vega-Lite charts rendered in
+    the browser. Their matplotlib versions are rendered once per distinct scores
+    DataFrame and served from a bounded cache of PNG or SVG bytes.
     """
     
     @staticmethod
@@ -19,7 +211,8 @@ class DataVisualizer:
         Create a bar chart of ROUGE scores.
         
         Args:
-            scores_df (pd.DataFrame): DataFrame with ROUGE scores
+            scores_df (pd.DataFrame): DataFrame with ROUGE scores, one row per
+                method or one row per (document, method)
             
         Returns:
             None: Displays the chart directly using Streamlit
@@ -27,11 +220,15 @@ class DataVisualizer:
         # Make a copy to avoid modifying the original
         df = scores_df.copy()
         
+        # Corpus results hold many rows per method: plot the per-method means
+        if len(df) > MAX_CHART_ROWS or df['Method'].duplicated().any():
+            df = df.groupby('Method', sort=False)[ROUGE_METRICS].mean().reset_index()
+        
         # Melt the dataframe for easier plotting
         plot_data = pd.melt(
             df,
             id_vars=['Method'],
-            value_vars=['ROUGE-1', 'ROUGE-2', 'ROUGE-L'],
+            value_vars=ROUGE_METRICS,
             var_name='Metric',
             value_name='Score'
         )
@@ -109,19 +306,19 @@ class DataVisualizer:
         )
     
     @staticmethod
-    def create_heatmap(scores_df):
+    def _draw_heatmap(scores_df):
         """
-        Create a heatmap of ROUGE scores for different methods.
+        Draw the matplotlib heatmap of ROUGE scores.
         
         Args:
             scores_df (pd.DataFrame): DataFrame with ROUGE scores
             
         Returns:
-            None: Displays the chart directly using Streamlit
+            matplotlib.figure.Figure: The figure; the caller must close it
         """
         # Prepare the data
         methods = scores_df['Method'].tolist()
-        metrics = ['ROUGE-1', 'ROUGE-2', 'ROUGE-L']
+        metrics = ROUGE_METRICS
         
         # Create a matrix from the scores
         data = scores_df[metrics].values
@@ -148,8 +345,7 @@ class DataVisualizer:
         # Add text annotations
         for i in range(len(methods)):
             for j in range(len(metrics)):
-                text = ax.text(j, i, f"{data[i, j]:.3f}",
-                               ha="center", va="center", color="w")
+                ax.text(j, i, f"{data[i, j]:.3f}", ha="center", va="center", color="w")
         
         # Add title
         ax.set_title("ROUGE Scores Comparison")
@@ -157,45 +353,35 @@ class DataVisualizer:
         # Adjust layout
         fig.tight_layout()
         
-        # Display the plot
-        st.pyplot(fig)
+        return fig
     
     @staticmethod
-    def create_radar_chart(scores_df):
+    def _draw_radar_chart(scores_df):
         """
-        Create a radar chart comparing different summarization methods.
+        Draw the matplotlib radar chart of ROUGE scores.
         
         Args:
             scores_df (pd.DataFrame): DataFrame with ROUGE scores
             
         Returns:
-            None: Displays the chart directly using Streamlit
+            matplotlib.figure.Figure: The figure; the caller must close it
         """
         # Get methods and metrics
         methods = scores_df['Method'].tolist()
-        metrics = ['ROUGE-1', 'ROUGE-2', 'ROUGE-L']
-        
-        # Number of variables
-        num_vars = len(metrics)
-        
-        # Calculate angle for each axis
-        angles = np.linspace(0, 2 * np.pi, num_vars, endpoint=False).tolist()
+        metrics = ROUGE_METRICS
         
-        # Make the plot circular
+        # Calculate angle for each axis, repeating the first to close the loop
+        angles = np.linspace(0, 2 * np.pi, len(metrics), endpoint=False).tolist()
         angles += angles[:1]
         
         # Create the figure
         fig, ax = plt.subplots(figsize=(8, 8), subplot_kw=dict(polar=True))
         
-        # Add extra metric to close the loop
-        metrics_loop = metrics + [metrics[0]]
-        
         # Plot each method
-        for i, method in enumerate(methods):
+        for method in methods:
             values = scores_df.loc[scores_df['Method'] == method, metrics].values.flatten().tolist()
             values += values[:1]  # Close the loop
             
-            # Plot the method
             ax.plot(angles, values, linewidth=2, label=method)
             ax.fill(angles, values, alpha=0.1)
         
@@ -203,14 +389,264 @@ class DataVisualizer:
         ax.set_xticks(angles[:-1])
         ax.set_xticklabels(metrics)
         
-        # Add legend
-        plt.legend(loc='upper right')
+        # Add legend and title
+        ax.legend(loc='upper right')
+        ax.set_title('Summarization Methods Comparison', size=15)
         
-        # Add title
-        plt.title('Summarization Methods Comparison', size=15)
+        return fig
+    
+    @staticmethod
+    def render_heatmap(scores_df, fmt='png'):
+        """
+        Render the matplotlib heatmap to image bytes, reusing cached renders.
+        
+        Args:
+            scores_df (pd.DataFrame): DataFrame with ROUGE scores
+            fmt (str): Image format, 'png' or 'svg'
+            
+        Returns:
+            bytes: The rendered image
+        """
+        frame = scores_df[['Method'] + ROUGE_METRICS]
+        return _cached_figure('heatmap', frame, fmt, DataVisualizer._draw_heatmap)
+    
+    @staticmethod
+    def render_radar_chart(scores_df, fmt='png'):
+        """
+        Render the matplotlib radar chart to image bytes, reusing cached renders.
+        
+        Args:
+            scores_df (pd.DataFrame): DataFrame with ROUGE scores
+            fmt (str): Image format, 'png' or 'svg'
+            
+        Returns:
+            bytes: The rendered image
+        """
+        frame = scores_df[['Method'] + ROUGE_METRICS]
+        return _cached_figure('radar', frame, fmt, DataVisualizer._draw_radar_chart)
+    
+    @staticmethod
+    def _show_image(image, fmt):
+        """
+        Display rendered image bytes in Streamlit.
+        """
+        if fmt == 'svg':
+            st.image(image.decode('utf-8'), use_container_width=True)
+        else:
+            st.image(image, use_container_width=True)
+    
+    @staticmethod
+    def create_heatmap(scores_df, interactive=True, fmt='png'):
+        """
+        Create a heatmap of ROUGE scores for different methods.
+        
+        Args:
+            scores_df (pd.DataFrame): DataFrame with ROUGE scores
+            interactive (bool): Draw a Vega-Lite chart in the browser; otherwise
+                show the cached matplotlib render
+            fmt (str): Image format of the matplotlib render, 'png' or 'svg'
+            
+        Returns:
+            None: Displays the chart directly using Streamlit
+        """
+        if not interactive:
+            DataVisualizer._show_image(DataVisualizer.render_heatmap(scores_df, fmt), fmt)
+            return
+        
+        # Long format: one row per (method, metric)
+        plot_data = pd.melt(
+            scores_df,
+            id_vars=['Method'],
+            value_vars=ROUGE_METRICS,
+            var_name='Metric',
+            value_name='Score'
+        )
+        
+        st.vega_lite_chart(
+            plot_data,
+            {
+                'title': 'ROUGE Scores Comparison',
+                'encoding': {
+                    'x': {'field': 'Metric', 'type': 'nominal', 'sort': ROUGE_METRICS},
+                    'y': {'field': 'Method', 'type': 'nominal', 'sort': None},
+                },
+                'layer': [
+                    {
+                        'mark': 'rect',
+                        'encoding': {
+                            'color': {'field': 'Score', 'type': 'quantitative', 'scale': {'scheme': 'viridis'}},
+                            'tooltip': [
+                                {'field': 'Method', 'type': 'nominal'},
+                                {'field': 'Metric', 'type': 'nominal'},
+                                {'field': 'Score', 'type': 'quantitative', 'format': '.3f'},
+                            ],
+                        },
+                    },
+                    {
+                        'mark': {'type': 'text', 'color': 'white'},
+                        'encoding': {'text': {'field': 'Score', 'type': 'quantitative', 'format': '.3f'}},
+                    },
+                ],
+            },
+            use_container_width=True
+        )
+    
+    @staticmethod
+    def create_radar_chart(scores_df, interactive=True, fmt='png'):
+        """
+        Create a chart comparing different summarization methods across metrics.
+        
+        The interactive version is a Vega-Lite line chart with one line per method
+        over the metrics, which shows the same profile as the radar chart.
+        
+        Args:
+            scores_df (pd.DataFrame): DataFrame with ROUGE scores
+            interactive (bool): Draw a Vega-Lite chart in the browser; otherwise
+                show the cached matplotlib radar chart
+            fmt (str): Image format of the matplotlib render, 'png' or 'svg'
+            
+        Returns:
+            None: Displays the chart directly using Streamlit
+        """
+        if not interactive:
+            DataVisualizer._show_image(DataVisualizer.render_radar_chart(scores_df, fmt), fmt)
+            return
+        
+        # Long format: one row per (method, metric)
+        plot_data = pd.melt(
+            scores_df,
+            id_vars=['Method'],
+            value_vars=ROUGE_METRICS,
+            var_name='Metric',
+            value_name='Score'
+        )
+        
+        st.vega_lite_chart(
+            plot_data,
+            {
+                'title': 'Summarization Methods Comparison',
+                'mark': {'type': 'line', 'point': True},
+                'encoding': {
+                    'x': {'field': 'Metric', 'type': 'nominal', 'sort': ROUGE_METRICS},
+                    'y': {'field': 'Score', 'type': 'quantitative'},
+                    'color': {'field': 'Method', 'type': 'nominal'},
+                    'tooltip': [
+                        {'field': 'Method', 'type': 'nominal'},
+                        {'field': 'Metric', 'type': 'nominal'},
+                        {'field': 'Score', 'type': 'quantitative', 'format': '.3f'},
+                    ],
+                },
+            },
+            use_container_width=True
+        )
+    
+    @staticmethod
+    def plot_dashboard(dashboard):
+        """
+        Display a dashboard built by build_dashboard.
         
-        # Display the plot
-        st.pyplot(fig)
+        Only the pre-aggregated frames are sent to the browser: the per-method
+        summary, the score histogram, quantile ranges, the optional bucket
+        breakdown and a bounded sample of raw rows.
+        
+        Args:
+            dashboard (dict): Output of build_dashboard
+            
+        Returns:
+            None: Displays the charts directly using Streamlit
+        """
+        metric = dashboard['metric']
+        by = dashboard['by']
+        summary = dashboard['summary']
+        
+        st.caption(f"{dashboard['rows']:,} scored rows across {len(summary)} methods")
+        st.dataframe(summary, use_container_width=True)
+        
+        # Score distribution per method
+        st.subheader(f"{metric} Distribution")
+        st.vega_lite_chart(
+            dashboard['histogram'],
+            {
+                'mark': {'type': 'bar', 'opacity': 0.6},
+                'encoding': {
+                    'x': {'field': 'Bin Start', 'type': 'quantitative', 'title': metric},
+                    'x2': {'field': 'Bin End'},
+                    'y': {'field': 'Count', 'type': 'quantitative', 'stack': None},
+                    'color': {'field': by, 'type': 'nominal'},
+                    'tooltip': [
+                        {'field': by, 'type': 'nominal'},
+                        {'field': 'Bin Start', 'type': 'quantitative', 'format': '.3f'},
+                        {'field': 'Count', 'type': 'quantitative'},
+                    ],
+                },
+            },
+            use_container_width=True
+        )
+        
+        # Quantile ranges: whiskers p05-p95, box p25-p75, tick at the median
+        st.subheader(f"{metric} Quantiles")
+        st.vega_lite_chart(
+            summary,
+            {
+                'encoding': {'y': {'field': by, 'type': 'nominal'}},
+                'layer': [
+                    {
+                        'mark': 'rule',
+                        'encoding': {
+                            'x': {'field': f'{metric} p05', 'type': 'quantitative', 'title': metric},
+                            'x2': {'field': f'{metric} p95'},
+                        },
+                    },
+                    {
+                        'mark': {'type': 'bar', 'size': 14},
+                        'encoding': {
+                            'x': {'field': f'{metric} p25', 'type': 'quantitative'},
+                            'x2': {'field': f'{metric} p75'},
+                            'color': {'field': by, 'type': 'nominal', 'legend': None},
+                        },
+                    },
+                    {
+                        'mark': {'type': 'tick', 'color': 'white', 'size': 14},
+                        'encoding': {'x': {'field': f'{metric} p50', 'type': 'quantitative'}},
+                    },
+                ],
+            },
+            use_container_width=True
+        )
+        
+        # Mean score per method and bucket
+        buckets = dashboard['buckets']
+        if buckets is not None:
+            bucket = buckets.columns[1]
+            st.subheader(f"{metric} by {bucket}")
+            st.vega_lite_chart(
+                buckets,
+                {
+                    'mark': 'rect',
+                    'encoding': {
+                        'x': {'field': bucket, 'type': 'nominal'},
+                        'y': {'field': by, 'type': 'nominal'},
+                        'color': {'field': metric, 'type': 'quantitative', 'scale': {'scheme': 'viridis'}},
+                        'tooltip': [
+                            {'field': by, 'type': 'nominal'},
+                            {'field': bucket, 'type': 'nominal'},
+                            {'field': metric, 'type': 'quantitative', 'format': '.3f'},
+                            {'field': 'Documents', 'type': 'quantitative'},
+                        ],
+                    },
+                },
+                use_container_width=True
+            )
+        
+        with st.expander(f"Sample of {len(dashboard['sample']):,} rows"):
+            st.dataframe(dashboard['sample'], use_container_width=True)
+    
+    @staticmethod
+    def clear_figure_cache():
+        """
+        Drop every cached figure render.
+        """
+        _figure_cache.clear()
     
     @staticmethod
     def create_retro_scoreboard(scores_dict, title="SCORES"):